@@ -39,12 +39,40 @@ __author__ = "Spotify MCP Server Team"
 __email__ = "dev@example.com"
 __description__ = "A FastMCP server for interacting with Spotify Web API"
 
-# Import core components
-from .config import Config, ConfigManager, SpotifyConfig
-from .auth import SpotifyAuthenticator, AuthTokens
-from .token_manager import TokenManager
-from .spotify_client import SpotifyClient
-from .server import SpotifyMCPServer
+# Core components are imported lazily so that lightweight entry points
+# (e.g. ``--create-config``) do not pay for the FastMCP/httpx import tree
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import Config, ConfigManager, SpotifyConfig
+    from .auth import SpotifyAuthenticator, AuthTokens
+    from .token_manager import TokenManager
+    from .spotify_client import SpotifyClient
+    from .server import SpotifyMCPServer
+
+_LAZY_IMPORTS = {
+    "Config": ".config",
+    "ConfigManager": ".config",
+    "SpotifyConfig": ".config",
+    "SpotifyAuthenticator": ".auth",
+    "AuthTokens": ".auth",
+    "TokenManager": ".token_manager",
+    "SpotifyClient": ".spotify_client",
+    "SpotifyMCPServer": ".server",
+}
+
+
+def __getattr__(name):
+    """Import core components on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Config", 
@@ -654,6 +654,10 @@ class CachedSpotifyClient:
         """Close underlying client."""
         await self.client.close()
     
+    async def close_when_idle(self) -> None:
+        """Close underlying client once its requests in progress finish."""
+        await self.client.close_when_idle()
+    
     async def __aenter__(self):
         """Async context manager entry."""
         return self
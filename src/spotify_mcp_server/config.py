@@ -44,6 +44,10 @@ class ServerConfig(BaseModel):
     host: str = Field(default="localhost", description="Server host")
     port: int = Field(default=8000, description="Server port")
     log_level: str = Field(default="INFO", description="Logging level")
+    preload_users: List[str] = Field(
+        default_factory=list,
+        description="User IDs whose tokens are loaded at startup"
+    )
 
     @field_validator("port")
     @classmethod
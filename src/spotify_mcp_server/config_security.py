@@ -3,10 +3,13 @@ ABOUTME: Configuration security module for Spotify MCP Server
 ABOUTME: Provides encryption, validation, and integrity checks for sensitive configuration data
 """
 
+import functools
 import hashlib
+import itertools
 import json
 import os
 import secrets
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import logging
@@ -158,8 +161,8 @@ class ConfigurationSecurity:
         
         try:
             # Extract encryption components
-            salt = base64.b64decode(secure_config["salt"].encode())
-            encrypted_data = base64.b64decode(secure_config["encrypted_data"].encode())
+            salt = base64.b64decode(secure_config["salt"])
+            encrypted_data = base64.b64decode(secure_config["encrypted_data"])
             expected_hash = secure_config["integrity_hash"]
             
             # Decrypt the data
@@ -321,6 +324,27 @@ class ConfigurationValidator:
         }
     }
     
+    # Ports reserved by common services
+    _RESERVED_PORTS = frozenset({22, 23, 25, 53, 80, 443, 993, 995})
+    
+    # Static tail appended to every security report
+    _RECOMMENDATIONS_TAIL = "\n".join([
+        "🔒 SECURITY RECOMMENDATIONS:",
+        "-" * 30,
+        "1. Use environment variables for sensitive configuration",
+        "2. Enable configuration encryption in production",
+        "3. Regularly rotate client secrets",
+        "4. Monitor configuration access logs",
+        "5. Use HTTPS for all external communications",
+        "6. Implement configuration backup and recovery",
+        ""
+    ])
+    
+    # Reports keyed on (environment, config fingerprint, cache directory
+    # permission check), shared across instances
+    _REPORT_CACHE_SIZE = 64
+    _report_cache: "OrderedDict[Tuple[str, bytes, bool], str]" = OrderedDict()
+    
     def __init__(self, environment: str = "production"):
         """Initialize configuration validator.
         
@@ -439,7 +463,7 @@ class ConfigurationValidator:
         if port < 1024 and self.environment == "production":
             warnings.append("Using privileged port - ensure proper permissions")
         
-        if port in [22, 23, 25, 53, 80, 443, 993, 995]:
+        if port in self._RESERVED_PORTS:
             errors.append(f"Port {port} conflicts with common services")
         
         # Validate log level
@@ -493,11 +517,8 @@ class ConfigurationValidator:
                 warnings.append("Cache database path is relative - consider using absolute path")
             
             # Check directory permissions
-            db_dir = os.path.dirname(db_path) if db_path else "."
-            if os.path.exists(db_dir):
-                dir_stat = os.stat(db_dir)
-                if dir_stat.st_mode & 0o022:  # Check if group/other have write permissions
-                    errors.append("Cache directory has insecure permissions")
+            if self._cache_dir_insecure(cache_config):
+                errors.append("Cache directory has insecure permissions")
         
         # Validate memory limits
         memory_limit = cache_config.get("memory_limit", 1000)
@@ -517,77 +538,125 @@ class ConfigurationValidator:
         
         return errors, warnings
     
+    @staticmethod
+    def _cache_dir_insecure(cache_config: Dict[str, Any]) -> bool:
+        """Check whether group or other users can write to the cache directory.
+        
+        Args:
+            cache_config: Cache configuration
+            
+        Returns:
+            True if the cache is enabled and its database directory exists
+            with group/other write permission
+        """
+        db_path = cache_config.get("db_path", "")
+        if not cache_config.get("enabled", True) or not db_path:
+            return False
+        
+        try:
+            dir_stat = os.stat(os.path.dirname(db_path))
+        except OSError:
+            return False
+        return bool(dir_stat.st_mode & 0o022)
+    
+    @staticmethod
+    def _fingerprint(config: Dict[str, Any]) -> bytes:
+        """Compute a fast, non-cryptographic fingerprint of a configuration.
+        
+        Args:
+            config: Configuration to fingerprint
+            
+        Returns:
+            16-byte BLAKE2b digest of the canonical JSON form
+        """
+        canonical = json.dumps(config, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+    
     def generate_security_report(self, config: Dict[str, Any]) -> str:
         """Generate a security assessment report.
         
+        Reports are cached by environment, configuration fingerprint and the
+        cache directory permission check, so repeated calls with an unchanged
+        configuration skip re-validation while permission changes on disk are
+        still picked up.
+        
         Args:
             config: Configuration to assess
             
         Returns:
             Security report as formatted string
         """
+        key = (
+            self.environment,
+            self._fingerprint(config),
+            self._cache_dir_insecure(config.get("cache", {}))
+        )
+        cache = self._report_cache
+        
+        report = cache.get(key)
+        if report is not None:
+            cache.move_to_end(key)
+            return report
+        
+        report = self._build_security_report(config)
+        cache[key] = report
+        while len(cache) > self._REPORT_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        return report
+    
+    def _build_security_report(self, config: Dict[str, Any]) -> str:
+        """Build the security assessment report without caching."""
         errors, warnings = self.validate_configuration(config)
         
-        report = [
+        header = [
             f"Security Assessment Report - Environment: {self.environment.upper()}",
             "=" * 60,
             ""
         ]
         
+        error_section: List[str] = []
         if errors:
-            report.extend([
+            error_section = [
                 "🚨 SECURITY ERRORS (Must Fix):",
-                "-" * 30
-            ])
-            for i, error in enumerate(errors, 1):
-                report.append(f"{i:2d}. {error}")
-            report.append("")
+                "-" * 30,
+                *(f"{i:2d}. {error}" for i, error in enumerate(errors, 1)),
+                ""
+            ]
         
+        warning_section: List[str] = []
         if warnings:
-            report.extend([
+            warning_section = [
                 "⚠️  SECURITY WARNINGS (Recommended):",
-                "-" * 35
-            ])
-            for i, warning in enumerate(warnings, 1):
-                report.append(f"{i:2d}. {warning}")
-            report.append("")
+                "-" * 35,
+                *(f"{i:2d}. {warning}" for i, warning in enumerate(warnings, 1)),
+                ""
+            ]
         
+        status_section: List[str] = []
         if not errors and not warnings:
-            report.extend([
+            status_section = [
                 "✅ SECURITY STATUS: GOOD",
                 "No security issues detected."
-            ])
-        
-        # Add recommendations
-        report.extend([
-            "🔒 SECURITY RECOMMENDATIONS:",
-            "-" * 30,
-            "1. Use environment variables for sensitive configuration",
-            "2. Enable configuration encryption in production",
-            "3. Regularly rotate client secrets",
-            "4. Monitor configuration access logs",
-            "5. Use HTTPS for all external communications",
-            "6. Implement configuration backup and recovery",
-            ""
-        ])
-        
-        return "\n".join(report)
-
-
-# Global configuration security instance
-_config_security: Optional[ConfigurationSecurity] = None
+            ]
+        
+        return "\n".join(itertools.chain(
+            header,
+            error_section,
+            warning_section,
+            status_section,
+            (self._RECOMMENDATIONS_TAIL,)
+        ))
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_security() -> ConfigurationSecurity:
     """Get global configuration security instance.
     
     Returns:
         ConfigurationSecurity instance
     """
-    global _config_security
-    if _config_security is None:
-        _config_security = ConfigurationSecurity()
-    return _config_security
+    return ConfigurationSecurity()
 
 
 def validate_production_config(config: Dict[str, Any], environment: str = "production") -> None:
@@ -3,10 +3,17 @@ ABOUTME: Dependency security scanner and management for Spotify MCP Server
 ABOUTME: Provides vulnerability scanning, license checking, and secure update management
 """
 
+import copy
 import json
+import re
 import subprocess
 import sys
-from datetime import datetime, timedelta
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import logging
@@ -15,19 +22,126 @@ try:
     import pkg_resources
 except ImportError:
     pkg_resources = None
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 try:
     from packaging import version
+    from packaging.utils import canonicalize_name
 except ImportError:
     version = None
+    
+    def canonicalize_name(name: str) -> str:
+        """Normalize a project name per PEP 503."""
+        return re.sub(r"[-_.]+", "-", name).lower()
 
 from .secure_errors import log_security_event, ErrorSeverity
 
 logger = logging.getLogger(__name__)
 
+# Timeout for pip-audit, in-process (per PyPI request) or as a subprocess
+_PIP_AUDIT_TIMEOUT_S = 60
+
+# Vulnerability severity to security event severity
+_SEVERITY_MAP = {
+    "CRITICAL": ErrorSeverity.CRITICAL,
+    "HIGH": ErrorSeverity.HIGH,
+    "MEDIUM": ErrorSeverity.MEDIUM,
+    "LOW": ErrorSeverity.LOW
+}
+
+# Common license patterns, in priority order
+_LICENSE_PATTERNS = {
+    "MIT": ["MIT", "MIT License"],
+    "BSD": ["BSD", "BSD License", "BSD-3-Clause", "BSD-2-Clause"],
+    "Apache-2.0": ["Apache", "Apache License", "Apache Software License"],
+    "GPL-3.0": ["GPL", "GNU General Public License"],
+    "LGPL": ["LGPL", "GNU Lesser General Public License"]
+}
+
+# One top-level alternative per standard license so that earlier entries win
+# regardless of where in the string they occur, matching the priority order
+_LICENSE_GROUPS = {f"l{i}": name for i, name in enumerate(_LICENSE_PATTERNS)}
+_LICENSE_RE = re.compile(
+    "|".join(
+        f".*?(?P<{group}>{'|'.join(map(re.escape, _LICENSE_PATTERNS[name]))})"
+        for group, name in _LICENSE_GROUPS.items()
+    ),
+    re.IGNORECASE | re.DOTALL
+)
+
+
+@lru_cache(maxsize=512)
+def _normalize_license(license_info: str) -> str:
+    """Map raw license metadata to a standard license name.
+    
+    Args:
+        license_info: Raw license information
+        
+    Returns:
+        Normalized license name, or the input if no pattern matches
+    """
+    match = _LICENSE_RE.match(license_info)
+    return _LICENSE_GROUPS[match.lastgroup] if match else license_info
+
+
+@dataclass(frozen=True)
+class _DistributionInfo:
+    """Metadata captured from a single installed distribution."""
+    
+    name: str
+    version: str
+    license: Optional[str]
+    classifiers: Tuple[str, ...]
+
+
+@lru_cache(maxsize=1)
+def _dist_snapshot() -> Dict[str, _DistributionInfo]:
+    """Read installed distribution metadata in a single pass.
+    
+    Every metadata access re-reads files from disk, so the result is cached
+    and shared by all scanner instances for the lifetime of the process.
+    
+    Returns:
+        Dictionary mapping canonical (PEP 503) package names to distribution info
+    """
+    snapshot = {}
+    
+    for dist in importlib.metadata.distributions():
+        metadata = dist.metadata
+        name = metadata['Name']
+        if not name:
+            continue
+        
+        snapshot[canonicalize_name(name)] = _DistributionInfo(
+            name=name,
+            version=dist.version,
+            license=metadata.get('License'),
+            classifiers=tuple(metadata.get_all('Classifier') or ())
+        )
+    
+    return snapshot
+
+
+def _installed_versions() -> Dict[str, str]:
+    """Map installed package names to versions.
+    
+    Returns:
+        Dictionary mapping canonical package names to versions
+    """
+    return {name: info.version for name, info in _dist_snapshot().items()}
+
 
 class DependencyVulnerability:
     """Represents a security vulnerability in a dependency."""
     
+    __slots__ = (
+        "package", "version", "vulnerability_id",
+        "severity", "description", "fixed_version"
+    )
+    
     def __init__(
         self,
         package: str,
@@ -64,6 +178,8 @@ class DependencyVulnerability:
 class LicenseIssue:
     """Represents a license compliance issue."""
     
+    __slots__ = ("package", "version", "license_name", "issue_type", "description")
+    
     def __init__(
         self,
         package: str,
@@ -95,37 +211,49 @@ class DependencySecurityScanner:
     # Known vulnerable packages (fallback if pip-audit not available)
     KNOWN_VULNERABILITIES = {
         "cryptography": {
-            "41.0.0": ["CVE-2023-49083"],
-            "41.0.1": ["CVE-2023-49083"],
-            "41.0.2": ["CVE-2023-49083"],
-            "41.0.3": ["CVE-2023-49083"]
+            "41.0.0": ("CVE-2023-49083",),
+            "41.0.1": ("CVE-2023-49083",),
+            "41.0.2": ("CVE-2023-49083",),
+            "41.0.3": ("CVE-2023-49083",)
         },
         "httpx": {
-            "0.24.0": ["CVE-2023-37276"],
-            "0.24.1": ["CVE-2023-37276"]
+            "0.24.0": ("CVE-2023-37276",),
+            "0.24.1": ("CVE-2023-37276",)
         }
     }
     
+    # KNOWN_VULNERABILITIES keyed by canonical package name
+    _VULN_INDEX = {
+        canonicalize_name(package_name): {
+            package_version: tuple(vuln_ids)
+            for package_version, vuln_ids in versions.items()
+        }
+        for package_name, versions in KNOWN_VULNERABILITIES.items()
+    }
+    
     # License compatibility matrix
     LICENSE_COMPATIBILITY = {
-        "allowed": [
+        "allowed": frozenset({
             "MIT", "BSD", "BSD-2-Clause", "BSD-3-Clause", 
             "Apache-2.0", "Apache Software License",
             "ISC", "Python Software Foundation License"
-        ],
-        "review_required": [
+        }),
+        "review_required": frozenset({
             "LGPL-2.1", "LGPL-3.0", "MPL-2.0"
-        ],
-        "prohibited": [
+        }),
+        "prohibited": frozenset({
             "GPL-2.0", "GPL-3.0", "AGPL-3.0", "SSPL-1.0"
-        ]
+        })
     }
     
     # Critical packages that require extra attention
-    CRITICAL_PACKAGES = {
+    CRITICAL_PACKAGES = frozenset({
         "cryptography", "httpx", "pydantic", "fastmcp",
         "certifi", "urllib3", "requests"
-    }
+    })
+    
+    # How long a generated security report is reused (seconds)
+    REPORT_TTL = 300
     
     def __init__(self, requirements_file: Optional[Path] = None):
         """Initialize dependency scanner.
@@ -135,6 +263,8 @@ class DependencySecurityScanner:
         """
         self.requirements_file = requirements_file
         self.installed_packages = self._get_installed_packages()
+        self._report_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._pip_audit_auditor: Optional[Any] = None
     
     def _get_installed_packages(self) -> Dict[str, str]:
         """Get list of installed packages and their versions.
@@ -146,14 +276,13 @@ class DependencySecurityScanner:
         
         try:
             # Use importlib.metadata (Python 3.8+)
-            for dist in importlib.metadata.distributions():
-                packages[dist.metadata['name'].lower()] = dist.version
+            packages.update(_installed_versions())
         except ImportError:
             # Fallback to pkg_resources if available
             if pkg_resources:
                 try:
                     for dist in pkg_resources.working_set:
-                        packages[dist.project_name.lower()] = dist.version
+                        packages[canonicalize_name(dist.project_name)] = dist.version
                 except Exception as e:
                     logger.warning(f"Failed to get installed packages: {e}")
             else:
@@ -181,40 +310,101 @@ class DependencySecurityScanner:
         
         # Log security events for vulnerabilities
         for vuln in vulnerabilities:
-            severity_map = {
-                "CRITICAL": ErrorSeverity.CRITICAL,
-                "HIGH": ErrorSeverity.HIGH,
-                "MEDIUM": ErrorSeverity.MEDIUM,
-                "LOW": ErrorSeverity.LOW
-            }
-            
             log_security_event(
                 event_type="dependency_vulnerability_found",
-                severity=severity_map.get(vuln.severity, ErrorSeverity.MEDIUM),
+                severity=_SEVERITY_MAP.get(vuln.severity, ErrorSeverity.MEDIUM),
                 details=vuln.to_dict()
             )
         
         return vulnerabilities
     
+    def _get_pip_audit_auditor(self) -> Optional[Any]:
+        """Get an in-process pip-audit auditor, if pip-audit is importable.
+        
+        Returns:
+            Cached pip-audit Auditor instance, or None if unavailable
+        """
+        if self._pip_audit_auditor is None:
+            try:
+                from pip_audit._audit import Auditor
+                from pip_audit._service.pypi import PyPIService
+            except ImportError:
+                return None
+            
+            self._pip_audit_auditor = Auditor(PyPIService(timeout=_PIP_AUDIT_TIMEOUT_S))
+        
+        return self._pip_audit_auditor
+    
+    def _audit_in_process(self, auditor: Any) -> List[DependencyVulnerability]:
+        """Scan for vulnerabilities using pip-audit's Python API.
+        
+        Args:
+            auditor: pip-audit Auditor instance
+            
+        Returns:
+            List of vulnerabilities found by pip-audit
+        """
+        if self.requirements_file:
+            from pip_audit._dependency_source import RequirementSource
+            source = RequirementSource([self.requirements_file])
+        else:
+            from pip_audit._dependency_source import PipSource
+            source = PipSource()
+        
+        vulnerabilities = []
+        
+        for dependency, results in auditor.audit(source):
+            # Skipped dependencies carry no version and no results
+            dependency_version = getattr(dependency, "version", None)
+            
+            for result in results:
+                fix_versions = getattr(result, "fix_versions", None) or [None]
+                fixed_version = fix_versions[0]
+                
+                vulnerabilities.append(DependencyVulnerability(
+                    package=dependency.name,
+                    version=str(dependency_version) if dependency_version else "unknown",
+                    vulnerability_id=result.id,
+                    severity="MEDIUM",
+                    description=result.description or "No description",
+                    fixed_version=str(fixed_version) if fixed_version else None
+                ))
+        
+        return vulnerabilities
+    
     def _run_pip_audit(self) -> List[DependencyVulnerability]:
         """Run pip-audit to scan for vulnerabilities.
         
+        pip-audit's Python API is used in-process when it can be imported,
+        avoiding a second interpreter start-up. Otherwise, or if the API
+        call fails, pip-audit is run as a subprocess.
+        
         Returns:
             List of vulnerabilities found by pip-audit
         """
+        auditor = self._get_pip_audit_auditor()
+        if auditor is not None:
+            try:
+                return self._audit_in_process(auditor)
+            except Exception as e:
+                logger.warning(f"In-process pip-audit failed, falling back to subprocess: {e}")
+        
         vulnerabilities = []
         
         try:
             # Run pip-audit with JSON output
-            cmd = [sys.executable, "-m", "pip_audit", "--format=json", "--desc"]
+            cmd = [
+                sys.executable, "-m", "pip_audit",
+                "--format=json", "--desc", "--progress-spinner=off"
+            ]
             if self.requirements_file:
                 cmd.extend(["-r", str(self.requirements_file)])
             
+            # Keep stdout as bytes; both orjson and json parse bytes directly
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
-                timeout=60
+                timeout=_PIP_AUDIT_TIMEOUT_S
             )
             
             if result.returncode == 0:
@@ -223,7 +413,7 @@ class DependencySecurityScanner:
             
             # Parse JSON output
             try:
-                audit_data = json.loads(result.stdout)
+                audit_data = _json_loads(result.stdout)
                 
                 for vuln_data in audit_data.get("vulnerabilities", []):
                     vulnerability = DependencyVulnerability(
@@ -256,20 +446,21 @@ class DependencySecurityScanner:
         """
         vulnerabilities = []
         
-        for package_name, package_version in self.installed_packages.items():
-            if package_name in self.KNOWN_VULNERABILITIES:
-                vuln_versions = self.KNOWN_VULNERABILITIES[package_name]
-                
-                if package_version in vuln_versions:
-                    for vuln_id in vuln_versions[package_version]:
-                        vulnerability = DependencyVulnerability(
-                            package=package_name,
-                            version=package_version,
-                            vulnerability_id=vuln_id,
-                            severity="HIGH",
-                            description=f"Known vulnerability in {package_name} {package_version}"
-                        )
-                        vulnerabilities.append(vulnerability)
+        installed = self.installed_packages
+        
+        # Only packages present in both the database and the environment matter
+        for package_name in installed.keys() & self._VULN_INDEX.keys():
+            package_version = installed[package_name]
+            
+            for vuln_id in self._VULN_INDEX[package_name].get(package_version, ()):
+                vulnerability = DependencyVulnerability(
+                    package=package_name,
+                    version=package_version,
+                    vulnerability_id=vuln_id,
+                    severity="HIGH",
+                    description=f"Known vulnerability in {package_name} {package_version}"
+                )
+                vulnerabilities.append(vulnerability)
         
         return vulnerabilities
     
@@ -282,14 +473,14 @@ class DependencySecurityScanner:
         issues = []
         
         try:
-            for dist in importlib.metadata.distributions():
-                package_name = dist.metadata['name']
-                package_version = dist.version
+            for info in _dist_snapshot().values():
+                package_name = info.name
+                package_version = info.version
                 
                 # Get license information
                 license_info = (
-                    dist.metadata.get('License') or 
-                    dist.metadata.get('Classifier', '') or
+                    info.license or 
+                    (info.classifiers[0] if info.classifiers else '') or
                     "Unknown"
                 )
                 
@@ -321,23 +512,7 @@ class DependencySecurityScanner:
         if not license_info or license_info.lower() in ["unknown", "none", ""]:
             return "Unknown"
         
-        # Common license patterns
-        license_patterns = {
-            "MIT": ["MIT", "MIT License"],
-            "BSD": ["BSD", "BSD License", "BSD-3-Clause", "BSD-2-Clause"],
-            "Apache-2.0": ["Apache", "Apache License", "Apache Software License"],
-            "GPL-3.0": ["GPL", "GNU General Public License"],
-            "LGPL": ["LGPL", "GNU Lesser General Public License"]
-        }
-        
-        license_lower = license_info.lower()
-        
-        for standard_name, patterns in license_patterns.items():
-            for pattern in patterns:
-                if pattern.lower() in license_lower:
-                    return standard_name
-        
-        return license_info
+        return _normalize_license(license_info)
     
     def _check_license_compatibility(
         self, 
@@ -405,7 +580,7 @@ class DependencySecurityScanner:
                 outdated_data = json.loads(result.stdout)
                 
                 for package_info in outdated_data:
-                    package_name = package_info["name"].lower()
+                    package_name = canonicalize_name(package_info["name"])
                     
                     # Check if it's a critical package
                     is_critical = package_name in self.CRITICAL_PACKAGES
@@ -438,25 +613,60 @@ class DependencySecurityScanner:
         
         return outdated
     
-    def generate_security_report(self) -> Dict[str, Any]:
+    def generate_security_report(self, force: bool = False) -> Dict[str, Any]:
         """Generate comprehensive security report.
         
+        Reports are reused for REPORT_TTL seconds, since each scan shells out
+        to pip-audit and pip and walks all installed package metadata.
+        
+        Args:
+            force: Rescan even if a fresh cached report is available, re-reading
+                installed package metadata in case packages changed
+            
         Returns:
-            Security report dictionary
+            Security report dictionary (a copy; callers may modify it)
         """
-        vulnerabilities = self.scan_vulnerabilities()
-        license_issues = self.scan_licenses()
-        outdated_packages = self.check_outdated_packages()
-        
-        # Categorize vulnerabilities by severity
-        vuln_by_severity = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
-        for vuln in vulnerabilities:
-            vuln_by_severity[vuln.severity] += 1
+        now = time.monotonic()
+        if force:
+            _dist_snapshot.cache_clear()
+            self.installed_packages = self._get_installed_packages()
+        elif self._report_cache is not None:
+            cached_at, cached_report = self._report_cache
+            if now - cached_at < self.REPORT_TTL:
+                return copy.deepcopy(cached_report)
+        
+        report = self._build_security_report()
+        self._report_cache = (now, report)
+        
+        return copy.deepcopy(report)
+    
+    def _build_security_report(self) -> Dict[str, Any]:
+        """Run all scans and assemble the security report."""
+        # The scans are independent and mostly wait on subprocesses and disk,
+        # so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            vulnerabilities_future = executor.submit(self.scan_vulnerabilities)
+            license_issues_future = executor.submit(self.scan_licenses)
+            outdated_packages_future = executor.submit(self.check_outdated_packages)
+            
+            vulnerabilities = vulnerabilities_future.result()
+            license_issues = license_issues_future.result()
+            outdated_packages = outdated_packages_future.result()
+        
+        # Categorize vulnerabilities, license issues and outdated packages
+        # in a single pass each
+        severity_counts = Counter(vuln.severity for vuln in vulnerabilities)
+        license_counts = Counter(issue.issue_type for issue in license_issues)
+        critical_outdated = sum(1 for p in outdated_packages if p["is_critical"])
         
-        # Categorize license issues
-        license_by_type = {"PROHIBITED": 0, "REVIEW_REQUIRED": 0, "UNKNOWN": 0}
-        for issue in license_issues:
-            license_by_type[issue.issue_type] += 1
+        vuln_by_severity = {
+            severity: severity_counts[severity]
+            for severity in ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+        }
+        license_by_type = {
+            issue_type: license_counts[issue_type]
+            for issue_type in ("PROHIBITED", "REVIEW_REQUIRED", "UNKNOWN")
+        }
         
         # Calculate security score (0-100)
         security_score = self._calculate_security_score(
@@ -464,7 +674,7 @@ class DependencySecurityScanner:
         )
         
         report = {
-            "scan_timestamp": datetime.now(datetime.UTC).isoformat(),
+            "scan_timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             "security_score": security_score,
             "summary": {
                 "total_packages": len(self.installed_packages),
@@ -478,7 +688,7 @@ class DependencySecurityScanner:
                 },
                 "outdated_packages": {
                     "total": len(outdated_packages),
-                    "critical": sum(1 for p in outdated_packages if p["is_critical"])
+                    "critical": critical_outdated
                 }
             },
             "details": {
@@ -487,7 +697,7 @@ class DependencySecurityScanner:
                 "outdated_packages": outdated_packages
             },
             "recommendations": self._generate_recommendations(
-                vulnerabilities, license_issues, outdated_packages
+                severity_counts, license_counts, critical_outdated
             )
         }
         
@@ -539,16 +749,16 @@ class DependencySecurityScanner:
     
     def _generate_recommendations(
         self,
-        vulnerabilities: List[DependencyVulnerability],
-        license_issues: List[LicenseIssue],
-        outdated_packages: List[Dict[str, Any]]
+        severity_counts: Counter,
+        license_counts: Counter,
+        critical_outdated: int
     ) -> List[str]:
         """Generate security recommendations.
         
         Args:
-            vulnerabilities: List of vulnerabilities
-            license_issues: List of license issues
-            outdated_packages: List of outdated packages
+            severity_counts: Vulnerability counts by severity
+            license_counts: License issue counts by issue type
+            critical_outdated: Number of outdated critical packages
             
         Returns:
             List of recommendation strings
@@ -556,34 +766,33 @@ class DependencySecurityScanner:
         recommendations = []
         
         # Vulnerability recommendations
-        critical_vulns = [v for v in vulnerabilities if v.severity == "CRITICAL"]
+        critical_vulns = severity_counts["CRITICAL"]
         if critical_vulns:
             recommendations.append(
-                f"URGENT: Fix {len(critical_vulns)} critical vulnerabilities immediately"
+                f"URGENT: Fix {critical_vulns} critical vulnerabilities immediately"
             )
         
-        high_vulns = [v for v in vulnerabilities if v.severity == "HIGH"]
+        high_vulns = severity_counts["HIGH"]
         if high_vulns:
             recommendations.append(
-                f"HIGH PRIORITY: Address {len(high_vulns)} high-severity vulnerabilities"
+                f"HIGH PRIORITY: Address {high_vulns} high-severity vulnerabilities"
             )
         
         # License recommendations
-        prohibited_licenses = [i for i in license_issues if i.issue_type == "PROHIBITED"]
+        prohibited_licenses = license_counts["PROHIBITED"]
         if prohibited_licenses:
             recommendations.append(
-                f"LEGAL RISK: Remove {len(prohibited_licenses)} packages with prohibited licenses"
+                f"LEGAL RISK: Remove {prohibited_licenses} packages with prohibited licenses"
             )
         
         # Update recommendations
-        critical_outdated = [p for p in outdated_packages if p["is_critical"]]
         if critical_outdated:
             recommendations.append(
-                f"UPDATE: {len(critical_outdated)} critical packages are outdated"
+                f"UPDATE: {critical_outdated} critical packages are outdated"
             )
         
         # General recommendations
-        if not vulnerabilities and not license_issues:
+        if not severity_counts and not license_counts:
             recommendations.append("✅ No security issues found - maintain current practices")
         
         recommendations.extend([
@@ -596,17 +805,30 @@ class DependencySecurityScanner:
         return recommendations
 
 
-def scan_dependencies(requirements_file: Optional[Path] = None) -> Dict[str, Any]:
+@lru_cache(maxsize=8)
+def _get_scanner(requirements_file: Optional[Path]) -> DependencySecurityScanner:
+    """Get a shared scanner so its cached report is reused across calls."""
+    return DependencySecurityScanner(requirements_file)
+
+
+def scan_dependencies(
+    requirements_file: Optional[Path] = None,
+    force: bool = False
+) -> Dict[str, Any]:
     """Scan dependencies for security issues.
     
     Args:
         requirements_file: Path to requirements file
+        force: Rescan even if a fresh cached report is available
         
     Returns:
         Security report dictionary
     """
-    scanner = DependencySecurityScanner(requirements_file)
-    return scanner.generate_security_report()
+    if force:
+        # Shared scanners hold the package list read when they were created
+        _get_scanner.cache_clear()
+    scanner = _get_scanner(requirements_file)
+    return scanner.generate_security_report(force=force)
 
 
 def check_security_compliance() -> bool:
@@ -7,24 +7,67 @@ import os
 import sys
 
 import argparse
-import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 # main function is defined in this file
 
 if TYPE_CHECKING:
     from .auth import SpotifyAuthenticator
+    from .config import Config
     from .token_manager import TokenManager
 
 
+# Environment variables that override config file values
+_CONFIG_ENV_VARS = (
+    "SPOTIFY_CLIENT_ID",
+    "SPOTIFY_CLIENT_SECRET",
+    "SPOTIFY_REDIRECT_URI",
+    "SERVER_HOST",
+    "SERVER_PORT",
+    "LOG_LEVEL",
+    "API_RATE_LIMIT",
+    "API_RETRY_ATTEMPTS",
+    "API_TIMEOUT",
+)
+
+
+@lru_cache(maxsize=8)
+def _load_config(config_path: str, mtime_ns: Optional[int],
+                 env: Tuple[Optional[str], ...]) -> "Config":
+    """Load config, reusing the result while the file and environment are unchanged.
+    
+    Args:
+        config_path: Absolute path to the configuration file
+        mtime_ns: File modification time, part of the cache key only
+        env: Values of the override environment variables, part of the cache key only
+    """
+    from .config import ConfigManager
+    return ConfigManager.load_with_env_precedence(config_path)
+
+
+def _config_mtime_ns(config_path: str) -> Optional[int]:
+    """Get the config file modification time, or None if it does not exist."""
+    try:
+        return Path(config_path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _config_env() -> Tuple[Optional[str], ...]:
+    """Get the current values of the config override environment variables."""
+    return tuple(os.getenv(name) for name in _CONFIG_ENV_VARS)
+
+
 def setup_authentication(config_path: str) -> None:
     """Run one-time authentication setup to store refresh tokens."""
     print("🎵 Spotify MCP Server - One-Time Authentication Setup")
     print("=" * 60)
     
     try:
-        from .config import ConfigManager
+        import asyncio
+        
         from .auth import SpotifyAuthenticator
         from .token_manager import TokenManager
         
@@ -32,7 +75,7 @@ def setup_authentication(config_path: str) -> None:
         config_path = str(Path(config_path).resolve())
         
         # Load config with environment variable precedence
-        config = ConfigManager.load_with_env_precedence(config_path)
+        config = _load_config(config_path, _config_mtime_ns(config_path), _config_env())
         
         # Initialize components with absolute paths
         authenticator = SpotifyAuthenticator(config.spotify)
@@ -52,6 +95,16 @@ def setup_authentication(config_path: str) -> None:
 
 async def _async_setup_auth(authenticator: "SpotifyAuthenticator", token_manager: "TokenManager", config_path: str) -> None:
     """Async authentication setup."""
+    try:
+        await _run_auth_setup(authenticator, token_manager, config_path)
+    finally:
+        # Writes any token update still pending and stops auto-refresh,
+        # however setup ended, before the event loop exits
+        await token_manager.close()
+
+
+async def _run_auth_setup(authenticator: "SpotifyAuthenticator", token_manager: "TokenManager", config_path: str) -> None:
+    """Check existing tokens, or run the authorization flow and store new ones."""
     # Check if tokens already exist
     if token_manager.has_tokens():
         print("✅ Authentication tokens already exist!")
@@ -104,8 +157,9 @@ async def _async_setup_auth(authenticator: "SpotifyAuthenticator", token_manager
         code_verifier=code_verifier
     )
     
-    # Store tokens
+    # Store tokens; write them now, since the event loop exits right after setup
     await token_manager.set_tokens(tokens)
+    await token_manager.flush_tokens()
     
     # Verify authentication works
     from .spotify_client import SpotifyClient
@@ -1,149 +1,623 @@
 """ABOUTME: FastMCP middleware implementations for cross-cutting concerns.
-ABOUTME: Provides logging, error handling, timing, and authentication middleware."""
+ABOUTME: Provides observability (logging, error handling, timing) and authentication middleware."""
 
+import atexit
 import logging
+import math
+import os
+import sys
 import time
-from typing import Any, Dict
+import warnings
+import weakref
+from collections import Counter, deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Optional
 
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
 logger = logging.getLogger(__name__)
 
+_NS_PER_MS = 1_000_000
+
+# Upper bound on the sample period when adaptive sampling backs off
+_MAX_SAMPLE_PERIOD = 1024
+
+# Log templates, formatted lazily by the logging module only when emitted
+_REQ_FMT = "MCP Request: %s"
+_REQ_PAYLOAD_FMT = "Request payload: %s"
+_RESP_FMT = "MCP Response: %s completed in %.2fms"
+_RESP_PAYLOAD_FMT = "Response payload: %s"
+# Exception text is capped, since some exceptions render whole response bodies
+_ERR_FMT = "MCP Error: %s failed after %.2fms: %s: %.200s"
+_ERR_UNTIMED_FMT = "MCP Error: %s failed: %s: %.200s"
+_ERR_TRACKED_FMT = "Error in %s: %s: %.200s"
+_FAILED_TIMING_FMT = "Failed request timing: %s failed after %.2fms"
+_SLOW_FMT = "Slow request: %s took %.2fms"
+_SUPPRESSED_SUFFIX = " (%d similar suppressed)"
+_SLOW_SUPPRESSED_FMT = _SLOW_FMT + _SUPPRESSED_SUFFIX
+_AUTH_REQUIRED_FMT = "Authentication required for %s"
+
+# Response for rejected tool calls, shared by every rejection; treat as read-only
+_AUTH_ERROR: Dict[str, str] = {
+    "error": "Authentication required. Use 'get_auth_url' and 'authenticate' tools first."
+}
+
+# Start timestamp of the request being handled by the outermost timing
+# middleware. MiddlewareContext is frozen, so it cannot carry the value.
+_request_start_ns: "ContextVar[Optional[int]]" = ContextVar(
+    "spotify_mcp_request_start_ns", default=None
+)
+
+# Background listener that performs handler I/O for the queued loggers
+_log_listener: Optional["QueueListener"] = None
 
-class SpotifyLoggingMiddleware(Middleware):
-    """Middleware for structured logging of MCP operations."""
+# Loggers routed through the listener: the middleware's own, and secure
+# error reporting, which logs a full traceback for every failed call
+_QUEUED_LOGGER_NAMES = (__name__, "spotify_mcp_server.secure_errors")
+
+
+def install_async_logging(maxsize: int = 10000) -> "QueueListener":
+    """Move middleware and error log output off the event loop.
     
-    def __init__(self, include_payloads: bool = False, max_payload_length: int = 500):
-        """Initialize logging middleware.
+    The middleware and secure error loggers get a QueueHandler, and the
+    middleware logger's (or else the root logger's) handlers are driven by
+    a QueueListener on a background thread, so logging in the request path
+    only merges the message arguments and enqueues a record. Formatting,
+    including exception tracebacks, happens on the listener thread.
+    
+    Args:
+        maxsize: Maximum number of pending records before new ones are dropped
+        
+    Returns:
+        The running QueueListener (installed once per process)
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+    
+    # Queue machinery is only needed when async logging is installed
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+    
+    class _DroppingQueueHandler(QueueHandler):
+        """Queue handler that drops records instead of blocking when the queue is full."""
+        
+        def enqueue(self, record: logging.LogRecord) -> None:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+        
+        def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+            # Merge the arguments now, since mutable ones may change before
+            # the listener runs; only the traceback is formatted later
+            record.msg = record.getMessage()
+            record.args = None
+            return record
+    
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=maxsize)
+    handlers = logger.handlers[:] or logging.getLogger().handlers[:]
+    
+    queue_handler = _DroppingQueueHandler(log_queue)
+    for name in _QUEUED_LOGGER_NAMES:
+        queued_logger = logging.getLogger(name)
+        queued_logger.handlers = [queue_handler]
+        queued_logger.propagate = False
+    
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(uninstall_async_logging)
+    
+    return _log_listener
+
+
+def uninstall_async_logging() -> None:
+    """Stop the background log listener and restore direct logging."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    
+    _log_listener.stop()
+    for name in _QUEUED_LOGGER_NAMES:
+        queued_logger = logging.getLogger(name)
+        queued_logger.handlers = []
+        queued_logger.propagate = True
+    _log_listener = None
+
+
+# Middleware instances whose statistics belong to the current process
+_stats_owners: "weakref.WeakSet[SpotifyObservabilityMiddleware]" = weakref.WeakSet()
+
+
+def _reset_stats_after_fork() -> None:
+    """Start forked worker processes with empty statistics."""
+    for middleware in list(_stats_owners):
+        middleware.reset_stats()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_stats_after_fork)
+
+
+def _sample_period(sample_rate: float) -> int:
+    """Convert a sampling rate into a "measure every Nth request" period.
+    
+    Args:
+        sample_rate: Fraction of requests to measure, in (0, 1]
+        
+    Returns:
+        Number of requests per measured request
+    """
+    if not 0 < sample_rate <= 1:
+        raise ValueError("sample_rate must be in the range (0, 1]")
+    return max(1, round(1 / sample_rate))
+
+
+class _LogRateLimiter:
+    """Suppress repeats of the same log line within a time window."""
+    
+    __slots__ = ('window_s', '_last_logged', '_suppressed')
+    
+    def __init__(self, window_s: float = 5.0):
+        """Initialize the rate limiter.
+        
+        Args:
+            window_s: Minimum seconds between two lines with the same key
+        """
+        self.window_s = window_s
+        self._last_logged: Dict[Any, float] = {}
+        self._suppressed: Counter = Counter()
+    
+    def allow(self, key: Any) -> Optional[int]:
+        """Decide whether a line with this key should be logged now.
+        
+        Args:
+            key: Identity of the repeated line
+            
+        Returns:
+            Number of lines suppressed since the last one was logged, or None
+            if this line should be suppressed too
+        """
+        now = time.monotonic()
+        last_logged = self._last_logged.get(key)
+        if last_logged is not None and now - last_logged < self.window_s:
+            self._suppressed[key] += 1
+            return None
+        
+        self._last_logged[key] = now
+        return self._suppressed.pop(key, 0)
+
+
+class MethodStats:
+    """Running timing aggregates for a single MCP method.
+    
+    Aggregates are updated in place, so memory stays constant no matter how
+    many requests are recorded; only the most recent samples are retained.
+    Fields live in slots, which keeps the per-request update to a handful of
+    fixed-offset attribute loads and stores.
+    """
+    
+    __slots__ = ('count', 'sum_ms', 'sum_sq', 'min_ms', 'max_ms', 'recent')
+    
+    def __init__(self, recent_size: int = 256):
+        """Initialize empty aggregates.
+        
+        Args:
+            recent_size: Number of most recent durations to retain
+        """
+        self.count = 0
+        self.sum_ms = 0.0
+        self.sum_sq = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+        self.recent: Deque[float] = deque(maxlen=recent_size)
+    
+    def record(self, duration_ms: float, weight: int = 1) -> None:
+        """Add a measured duration.
+        
+        Args:
+            duration_ms: Measured request duration
+            weight: Number of requests this sample represents
+        """
+        weighted_ms = duration_ms * weight
+        self.count += weight
+        self.sum_ms += weighted_ms
+        self.sum_sq += duration_ms * weighted_ms
+        if duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        self.recent.append(duration_ms)
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Summarize the aggregates for monitoring."""
+        avg_ms = self.sum_ms / self.count
+        variance = max(0.0, self.sum_sq / self.count - avg_ms * avg_ms)
+        return {
+            "count": self.count,
+            "avg_ms": avg_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "total_ms": self.sum_ms,
+            "stddev_ms": math.sqrt(variance)
+        }
+
+
+class SpotifyObservabilityMiddleware(Middleware):
+    """Middleware for logging, error tracking, and timing of MCP operations.
+    
+    All three concerns share one pass around ``call_next``: a single sampling
+    decision, a single duration measurement, and a single exception handler.
+    """
+    
+    # The Middleware base class has no __slots__, so instances keep a
+    # __dict__, but the fields read on every request use slot descriptors
+    __slots__ = (
+        'log_requests', 'include_payloads', 'max_payload_length', 'track_errors',
+        'include_traceback', 'track_timing', 'slow_threshold', '_slow_ns',
+        'collect_stats', 'sample_period', 'error_counts', 'request_times',
+        '_request_count', '_log_limiter', 'adaptive_sampling', 'high_watermark_rps',
+        'low_watermark_rps', '_base_sample_period', '_window_start', '_window_count'
+    )
+    
+    # Whether stacked instances share one start timestamp per request; only
+    # the single-purpose shims are meant to be stacked
+    _share_start = False
+    
+    def __init__(
+        self,
+        log_requests: bool = True,
+        include_payloads: bool = False,
+        max_payload_length: int = 500,
+        track_errors: bool = True,
+        include_traceback: bool = False,
+        track_timing: bool = True,
+        slow_request_threshold_ms: float = 2000,
+        collect_stats: bool = True,
+        sample_rate: float = 1.0,
+        log_dedup_window_s: float = 5.0,
+        adaptive_sampling: bool = False,
+        high_watermark_rps: float = 500,
+        low_watermark_rps: float = 100
+    ):
+        """Initialize observability middleware.
         
         Args:
+            log_requests: Whether to log requests, responses, and errors
             include_payloads: Whether to include request/response payloads in logs
             max_payload_length: Maximum length of payload to log
+            track_errors: Whether to count errors by exception type
+            include_traceback: Whether to include tracebacks in error logs
+            track_timing: Whether to time requests and warn about slow ones
+            slow_request_threshold_ms: Threshold for logging slow requests
+            collect_stats: Whether to record per-method timing statistics
+            sample_rate: Fraction of requests to log and time (errors are always handled)
+            log_dedup_window_s: Window in which repeated error and slow-request
+                lines for the same method are suppressed (0 disables suppression)
+            adaptive_sampling: Whether to sample fewer requests under heavy load
+            high_watermark_rps: Request rate above which the sample period doubles
+            low_watermark_rps: Request rate below which the sample period halves,
+                down to the period given by sample_rate
         """
+        self.log_requests = log_requests
         self.include_payloads = include_payloads
         self.max_payload_length = max_payload_length
+        self.track_errors = track_errors
+        self.include_traceback = include_traceback
+        self.track_timing = track_timing
+        self.slow_threshold = slow_request_threshold_ms
+        self._slow_ns = int(slow_request_threshold_ms * _NS_PER_MS)
+        self.collect_stats = collect_stats
+        self.sample_period = _sample_period(sample_rate)
+        self.error_counts: Counter = Counter()
+        self.request_times: Dict[str, MethodStats] = {}
+        self._request_count = 0
+        self._log_limiter = _LogRateLimiter(log_dedup_window_s)
+        self.adaptive_sampling = adaptive_sampling
+        self.high_watermark_rps = high_watermark_rps
+        self.low_watermark_rps = low_watermark_rps
+        self._base_sample_period = self.sample_period
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        _stats_owners.add(self)
 
     async def on_message(self, context: MiddlewareContext, call_next):
-        """Log all MCP messages with structured information."""
-        start_time = time.perf_counter()
+        """Log, time, and track errors for all MCP messages in one pass."""
+        method = context.method
+        
+        # Logger.isEnabledFor is cached by the logging module and invalidated
+        # on reconfiguration, so checking it per request stays cheap
+        self._request_count += 1
+        if self.adaptive_sampling:
+            self._adapt_sample_period()
+        sampled = not self._request_count % self.sample_period
+        log_request = sampled and self.log_requests and logger.isEnabledFor(logging.INFO)
+        time_request = sampled and self.track_timing and (
+            self.collect_stats or logger.isEnabledFor(logging.WARNING)
+        )
         
-        # Log request
-        logger.info(f"MCP Request: {context.method}")
+        if not (log_request or time_request):
+            # Unsampled or nothing to emit: skip timing, but still handle errors
+            try:
+                return await call_next(context)
+            except Exception as e:
+                self._handle_error(method, e, None)
+                raise
         
-        if self.include_payloads and hasattr(context, 'params'):
-            payload_str = str(context.params)[:self.max_payload_length]
-            logger.debug(f"Request payload: {payload_str}")
+        start_ns = _request_start_ns.get() if self._share_start else None
+        start_token = None
+        if start_ns is None:
+            start_ns = time.perf_counter_ns()
+            if self._share_start:
+                start_token = _request_start_ns.set(start_ns)
+        
+        # Only stringify payloads when DEBUG output will actually be emitted
+        log_payloads = (
+            log_request and self.include_payloads and logger.isEnabledFor(logging.DEBUG)
+        )
+        
+        if log_request:
+            logger.info(_REQ_FMT, method)
+            if log_payloads and hasattr(context, 'params'):
+                payload_str = str(context.params)[:self.max_payload_length]
+                logger.debug(_REQ_PAYLOAD_FMT, payload_str)
         
         try:
             result = await call_next(context)
-            
-            # Log successful response
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            logger.info(f"MCP Response: {context.method} completed in {duration_ms:.2f}ms")
-            
-            if self.include_payloads:
-                result_str = str(result)[:self.max_payload_length]
-                logger.debug(f"Response payload: {result_str}")
-            
-            return result
-            
         except Exception as e:
-            # Log error
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            logger.error(f"MCP Error: {context.method} failed after {duration_ms:.2f}ms: {e}")
+            self._handle_error(method, e, (time.perf_counter_ns() - start_ns) / _NS_PER_MS)
             raise
+        finally:
+            if start_token is not None:
+                _request_start_ns.reset(start_token)
+        
+        # Keep the duration as integer nanoseconds until something needs milliseconds
+        duration_ns = time.perf_counter_ns() - start_ns
+        
+        if log_request:
+            logger.info(_RESP_FMT, method, duration_ns / _NS_PER_MS)
+            if log_payloads:
+                result_str = str(result)[:self.max_payload_length]
+                logger.debug(_RESP_PAYLOAD_FMT, result_str)
+        
+        if time_request:
+            # Track timing statistics
+            if self.collect_stats:
+                method_stats = self.request_times.get(method)
+                if method_stats is None:
+                    key = sys.intern(method) if isinstance(method, str) else method
+                    method_stats = self.request_times[key] = MethodStats()
+                method_stats.record(duration_ns / _NS_PER_MS, self.sample_period)
+            
+            # Log slow requests
+            if duration_ns > self._slow_ns:
+                suppressed = self._log_limiter.allow(method)
+                if suppressed == 0:
+                    logger.warning(_SLOW_FMT, method, duration_ns / _NS_PER_MS)
+                elif suppressed is not None:
+                    logger.warning(
+                        _SLOW_SUPPRESSED_FMT, method, duration_ns / _NS_PER_MS, suppressed
+                    )
+        
+        return result
 
+    def _handle_error(self, method: str, error: Exception, duration_ms: Optional[float]) -> None:
+        """Count and log a failed request.
+        
+        Args:
+            method: MCP method that failed
+            error: Exception raised by the downstream handler
+            duration_ms: Measured duration, or None if the request was not timed
+        """
+        error_type = type(error).__name__
+        if self.track_errors:
+            self.error_counts[error_type] += 1
+        
+        # Bursts of identical failures (e.g. upstream rate limiting) are
+        # logged once per window with a count of the lines suppressed since
+        if self.log_requests or self.track_errors:
+            suppressed = self._log_limiter.allow((method, error_type))
+            if suppressed is not None:
+                if not self.log_requests:
+                    msg, args = _ERR_TRACKED_FMT, (method, error_type, error)
+                elif duration_ms is None:
+                    msg, args = _ERR_UNTIMED_FMT, (method, error_type, error)
+                else:
+                    msg, args = _ERR_FMT, (method, duration_ms, error_type, error)
+                if suppressed:
+                    msg += _SUPPRESSED_SUFFIX
+                    args += (suppressed,)
+                self._log_error(msg, args, error)
+        
+        if duration_ms is not None and not self.log_requests:
+            logger.debug(_FAILED_TIMING_FMT, method, duration_ms)
 
-class SpotifyErrorHandlingMiddleware(Middleware):
-    """Middleware for consistent error handling and monitoring."""
-    
-    def __init__(self, include_traceback: bool = False):
-        """Initialize error handling middleware.
+    def _log_error(self, msg: str, args: tuple, error: Exception) -> None:
+        """Emit an error line, attaching the traceback when include_traceback is set.
+        
+        With install_async_logging the traceback is formatted on the
+        listener thread, so this only enqueues the record.
         
         Args:
-            include_traceback: Whether to include tracebacks in error responses
+            msg: Log format string
+            args: Arguments for the format string
+            error: Exception whose traceback is attached when include_traceback is set
         """
-        self.include_traceback = include_traceback
-        self.error_counts: Dict[str, int] = {}
+        logger.error(msg, *args, exc_info=error if self.include_traceback else None)
 
-    async def on_message(self, context: MiddlewareContext, call_next):
-        """Handle errors consistently across all MCP operations."""
-        try:
-            return await call_next(context)
-        except Exception as e:
-            # Track error statistics
-            error_type = type(e).__name__
-            self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
-            
-            # Log error with context
-            logger.error(f"Error in {context.method}: {error_type}: {e}")
-            
-            # Re-raise the exception to maintain FastMCP error handling
-            raise
+    def _adapt_sample_period(self) -> None:
+        """Adjust the sample period once per second based on the request rate.
+        
+        The rate is measured inline from the request counter, so no background
+        task is needed and idle servers do no work.
+        """
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed < 1.0:
+            return
+        
+        rps = (self._request_count - self._window_count) / elapsed
+        self._window_start = now
+        self._window_count = self._request_count
+        
+        period = self.sample_period
+        if rps > self.high_watermark_rps:
+            period = min(period * 2, _MAX_SAMPLE_PERIOD)
+        elif rps < self.low_watermark_rps:
+            period = max(period // 2, self._base_sample_period)
+        
+        if period != self.sample_period:
+            logger.info(
+                "Sample period changed from %d to %d at %.0f requests/s",
+                self.sample_period, period, rps
+            )
+            self.sample_period = period
+
+    def reset_stats(self) -> None:
+        """Discard collected error counts and timing statistics."""
+        self.error_counts = Counter()
+        self.request_times = {}
+        self._request_count = 0
+        self._log_limiter = _LogRateLimiter(self._log_limiter.window_s)
+        self.sample_period = self._base_sample_period
+        self._window_start = time.monotonic()
+        self._window_count = 0
 
     def get_error_stats(self) -> Dict[str, int]:
         """Get error statistics for monitoring."""
-        return self.error_counts.copy()
+        return dict(self.error_counts)
+
+    def get_timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get timing statistics for monitoring.
+        
+        With sampling enabled, counts and totals are estimates scaled by the
+        sample period; averages, minimums and maximums come from the samples.
+        """
+        return {
+            method: method_stats.to_dict()
+            for method, method_stats in self.request_times.items()
+            if method_stats.count
+        }
+
+
+class SpotifyLoggingMiddleware(SpotifyObservabilityMiddleware):
+    """Middleware for structured logging of MCP operations.
+    
+    Deprecated: use SpotifyObservabilityMiddleware.
+    """
+    
+    __slots__ = ()
+    
+    _share_start = True
+    
+    def __init__(
+        self,
+        include_payloads: bool = False,
+        max_payload_length: int = 500,
+        sample_rate: float = 1.0
+    ):
+        """Initialize logging middleware.
+        
+        Args:
+            include_payloads: Whether to include request/response payloads in logs
+            max_payload_length: Maximum length of payload to log
+            sample_rate: Fraction of requests to log and time (errors are always logged)
+        """
+        warnings.warn(
+            "SpotifyLoggingMiddleware is deprecated; use SpotifyObservabilityMiddleware",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        super().__init__(
+            include_payloads=include_payloads,
+            max_payload_length=max_payload_length,
+            track_errors=False,
+            track_timing=False,
+            sample_rate=sample_rate
+        )
+
+
+class SpotifyErrorHandlingMiddleware(SpotifyObservabilityMiddleware):
+    """Middleware for consistent error handling and monitoring.
+    
+    Deprecated: use SpotifyObservabilityMiddleware.
+    """
+    
+    __slots__ = ()
+    
+    _share_start = True
+    
+    def __init__(self, include_traceback: bool = False):
+        """Initialize error handling middleware.
+        
+        Args:
+            include_traceback: Whether to include tracebacks in error responses
+        """
+        warnings.warn(
+            "SpotifyErrorHandlingMiddleware is deprecated; use SpotifyObservabilityMiddleware",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        super().__init__(
+            log_requests=False,
+            include_traceback=include_traceback,
+            track_timing=False
+        )
 
 
-class SpotifyTimingMiddleware(Middleware):
-    """Middleware for performance monitoring and timing."""
+class SpotifyTimingMiddleware(SpotifyObservabilityMiddleware):
+    """Middleware for performance monitoring and timing.
+    
+    Deprecated: use SpotifyObservabilityMiddleware.
+    """
     
-    def __init__(self, slow_request_threshold_ms: float = 2000):
+    __slots__ = ()
+    
+    _share_start = True
+    
+    def __init__(
+        self,
+        slow_request_threshold_ms: float = 2000,
+        sample_rate: float = 1.0,
+        collect_stats: bool = True
+    ):
         """Initialize timing middleware.
         
         Args:
             slow_request_threshold_ms: Threshold for logging slow requests
+            sample_rate: Fraction of requests to time
+            collect_stats: Whether to record per-method timing statistics
         """
-        self.slow_threshold = slow_request_threshold_ms
-        self.request_times: Dict[str, list] = {}
+        warnings.warn(
+            "SpotifyTimingMiddleware is deprecated; use SpotifyObservabilityMiddleware",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        super().__init__(
+            log_requests=False,
+            track_errors=False,
+            slow_request_threshold_ms=slow_request_threshold_ms,
+            collect_stats=collect_stats,
+            sample_rate=sample_rate
+        )
 
-    async def on_message(self, context: MiddlewareContext, call_next):
-        """Time all MCP operations and track performance."""
-        start_time = time.perf_counter()
-        
-        try:
-            result = await call_next(context)
-            
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            
-            # Track timing statistics
-            method = context.method
-            if method not in self.request_times:
-                self.request_times[method] = []
-            self.request_times[method].append(duration_ms)
-            
-            # Log slow requests
-            if duration_ms > self.slow_threshold:
-                logger.warning(f"Slow request: {method} took {duration_ms:.2f}ms")
-            
-            return result
-            
-        except Exception as e:
-            # Still track timing for failed requests
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            logger.debug(f"Failed request timing: {context.method} failed after {duration_ms:.2f}ms")
-            raise
 
-    def get_timing_stats(self) -> Dict[str, Dict[str, float]]:
-        """Get timing statistics for monitoring."""
-        stats = {}
-        for method, times in self.request_times.items():
-            if times:
-                stats[method] = {
-                    "count": len(times),
-                    "avg_ms": sum(times) / len(times),
-                    "min_ms": min(times),
-                    "max_ms": max(times),
-                    "total_ms": sum(times)
-                }
-        return stats
+def _no_auth_required() -> None:
+    """Authentication check for tools that do not require it."""
+    return None
 
 
 class SpotifyAuthenticationMiddleware(Middleware):
     """Middleware for authentication validation and token management."""
     
+    __slots__ = ('server_instance', 'require_auth_methods', '_has_tokens', '_tool_checks')
+    
+    # Upper bound on distinct tool names whose check is cached
+    _MAX_CACHED_TOOLS = 256
+    
     def __init__(self, server_instance=None, require_auth_methods: set = None):
         """Initialize authentication middleware.
         
@@ -152,25 +626,61 @@ class SpotifyAuthenticationMiddleware(Middleware):
             require_auth_methods: Set of methods that require authentication
         """
         self.server_instance = server_instance
-        self.require_auth_methods = require_auth_methods or {
+        self.require_auth_methods = frozenset(require_auth_methods or {
             'search_tracks', 'get_playlists', 'get_playlist', 'create_playlist',
             'add_tracks_to_playlist', 'remove_tracks_from_playlist',
             'get_track_details', 'get_album_details', 'get_artist_details'
-        }
+        })
+        self._has_tokens: Optional[Callable[[], bool]] = None
+        self._tool_checks: Dict[Any, Callable[[], Optional[Dict[str, str]]]] = {}
+
+    def _resolve_has_tokens(self) -> Optional[Callable[[], bool]]:
+        """Bind the server's token check once its token manager exists.
+        
+        The server creates its token manager during initialization, after
+        middleware is registered, so the lookup is retried until it succeeds.
+        """
+        if self._has_tokens is None and self.server_instance:
+            token_manager = self.server_instance.token_manager
+            if token_manager:
+                self._has_tokens = token_manager.has_tokens
+        return self._has_tokens
+
+    def _check_tokens(self) -> Optional[Dict[str, str]]:
+        """Authentication check for tools that require it.
+        
+        Returns:
+            Error response if the server has no tokens, otherwise None
+        """
+        has_tokens = self._has_tokens or self._resolve_has_tokens()
+        if has_tokens and has_tokens():
+            return None
+        return _AUTH_ERROR
+
+    def _resolve_tool_check(self, tool_name: Any) -> Callable[[], Optional[Dict[str, str]]]:
+        """Pick and cache the authentication check for a tool.
+        
+        Args:
+            tool_name: Name of the tool being called
+            
+        Returns:
+            Check returning an error response, or None if the call may proceed
+        """
+        check = self._check_tokens if tool_name in self.require_auth_methods else _no_auth_required
+        if len(self._tool_checks) < self._MAX_CACHED_TOOLS:
+            self._tool_checks[tool_name] = check
+        return check
 
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         """Validate authentication for tool calls that require it."""
         # Get tool name from context
         tool_name = getattr(context, 'tool_name', None)
         
-        if tool_name in self.require_auth_methods:
-            # Check if server has valid authentication using injected dependency
-            if (not self.server_instance or 
-                not self.server_instance.token_manager or 
-                not self.server_instance.token_manager.has_tokens()):
-                logger.warning(f"Authentication required for {tool_name}")
-                return {
-                    "error": "Authentication required. Use 'get_auth_url' and 'authenticate' tools first."
-                }
+        # The auth set is fixed after init, so each tool's check is decided once
+        check = self._tool_checks.get(tool_name) or self._resolve_tool_check(tool_name)
+        error = check()
+        if error:
+            logger.warning(_AUTH_REQUIRED_FMT, tool_name)
+            return error
         
         return await call_next(context)
@@ -3,22 +3,120 @@ ABOUTME: Network security module for Spotify MCP Server
 ABOUTME: Provides TLS validation, request signing, and network-level security protections
 """
 
+import asyncio
 import hashlib
 import hmac
+import os
+import re
 import ssl
+import threading
 import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Union
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache, partial
 import httpx
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 
 from .secure_errors import log_security_event, ErrorSeverity
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 logger = logging.getLogger(__name__)
 
+# Read size when hashing file-like request bodies
+_BODY_CHUNK_SIZE = 64 * 1024
+
+# Certificates expiring sooner than this are flagged during validation
+_EXPIRY_WARNING = timedelta(days=30)
+
+
+def _utcnow() -> datetime:
+    """Current time as a naive UTC datetime, cryptography's convention."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _validity_bounds(cert: x509.Certificate) -> Tuple[datetime, datetime]:
+    """Get a certificate's validity period as naive UTC datetimes.
+    
+    Uses the timezone-aware accessors where available (cryptography 42+),
+    which avoids the deprecated naive properties.
+    
+    Args:
+        cert: Certificate to inspect
+        
+    Returns:
+        Tuple of (not_valid_before, not_valid_after)
+    """
+    try:
+        return (
+            cert.not_valid_before_utc.replace(tzinfo=None),
+            cert.not_valid_after_utc.replace(tzinfo=None)
+        )
+    except AttributeError:
+        return cert.not_valid_before, cert.not_valid_after
+
+
+def _build_substring_matcher(patterns: Iterable[str]) -> Callable[[str], bool]:
+    """Build a single-pass matcher for "text contains any of these substrings".
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a compiled regex alternation.
+    
+    Args:
+        patterns: Substrings to search for
+        
+    Returns:
+        Function returning True if its argument contains any pattern
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return lambda text: False
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    regex = re.compile("|".join(re.escape(pattern) for pattern in patterns))
+    return lambda text: regex.search(text) is not None
+
+
+@lru_cache(maxsize=256)
+def _extract_san_dns(cert: x509.Certificate) -> Optional[Tuple[str, ...]]:
+    """Extract the DNS names from a certificate's subject alternative names.
+    
+    Certificates hash and compare by their DER encoding, so validating and
+    then describing the same certificate decodes the extension only once.
+    
+    Args:
+        cert: Certificate to inspect
+        
+    Returns:
+        DNS names, or None if the certificate has no SAN extension
+    """
+    try:
+        san_extension = cert.extensions.get_extension_for_class(
+            x509.SubjectAlternativeName
+        ).value
+    except x509.ExtensionNotFound:
+        return None
+    
+    return tuple(san_extension.get_values_for_type(x509.DNSName))
+
 
 class TLSValidator:
     """Validates TLS certificates and connections."""
@@ -37,15 +135,44 @@ class TLSValidator:
     MIN_TLS_VERSION = ssl.TLSVersion.TLSv1_2
     PREFERRED_TLS_VERSION = ssl.TLSVersion.TLSv1_3
     
-    def __init__(self, strict_mode: bool = True):
+    def __init__(self, strict_mode: bool = True, cache_size: int = 256):
         """Initialize TLS validator.
         
         Args:
             strict_mode: Whether to enforce strict TLS validation
+            cache_size: Maximum number of host certificates to cache
         """
         self.strict_mode = strict_mode
-        self.certificate_cache: Dict[str, Tuple[x509.Certificate, datetime]] = {}
-        self.cache_ttl = timedelta(hours=1)
+        self.cache_size = cache_size
+        if self.TRUSTED_CAS is TLSValidator.TRUSTED_CAS:
+            self._trusted_orgs = _TRUSTED_CAS_FROZEN
+            self._is_trusted_issuer = _TRUSTED_CAS_MATCHER
+        else:
+            # Subclass with its own CA list
+            self._trusted_orgs = frozenset(self.TRUSTED_CAS)
+            self._is_trusted_issuer = _build_substring_matcher(self.TRUSTED_CAS)
+        # LRU of (hostname, port) -> (certificate info, SHA-256 of the DER,
+        # not_valid_before, not_valid_after, cached_at); the parsed certificate
+        # is not retained and cached_at is a time.monotonic() reading
+        self.certificate_cache: OrderedDict[
+            Tuple[str, int], Tuple[Dict[str, Any], bytes, datetime, datetime, float]
+        ] = OrderedDict()
+        self.cache_ttl_s = 3600.0
+        # (hostname, port) -> time.monotonic() of the last failed fetch, so a
+        # misconfigured endpoint is not re-handshaken on every call
+        self._negative_cache: OrderedDict[Tuple[str, int], float] = OrderedDict()
+        self.negative_cache_ttl_s = 120.0
+        # Guards both caches so validate_many can fetch from worker threads
+        self._cache_lock = threading.Lock()
+    
+    @cached_property
+    def shared_context(self) -> ssl.SSLContext:
+        """Secure SSL context built once and shared by probes and HTTP clients.
+        
+        A configured SSLContext is safe to share, and building one parses the
+        OpenSSL cipher and protocol configuration.
+        """
+        return self.create_secure_context()
     
     def create_secure_context(self) -> ssl.SSLContext:
         """Create a secure SSL context with proper validation.
@@ -94,37 +221,32 @@ class TLSValidator:
             Tuple of (is_valid, issues_list)
         """
         issues = []
+        now = _utcnow()
+        expiry_cutoff = now + _EXPIRY_WARNING
         
         try:
             # Check certificate validity period
-            now = datetime.utcnow()
+            not_before, not_after = _validity_bounds(certificate)
             
-            if certificate.not_valid_before > now:
+            if not_before > now:
                 issues.append("Certificate is not yet valid")
             
-            if certificate.not_valid_after < now:
+            if not_after < now:
                 issues.append("Certificate has expired")
             
             # Warn if certificate expires soon (within 30 days)
-            if certificate.not_valid_after < now + timedelta(days=30):
+            if not_after < expiry_cutoff:
                 issues.append("Certificate expires within 30 days")
             
             # Validate hostname
-            try:
+            hostnames = _extract_san_dns(certificate)
+            if hostnames is not None:
                 # Check subject alternative names
-                san_extension = certificate.extensions.get_extension_for_oid(
-                    x509.oid.ExtensionOID.SUBJECT_ALTERNATIVE_NAME
-                ).value
-                
-                hostnames = []
-                for name in san_extension:
-                    if isinstance(name, x509.DNSName):
-                        hostnames.append(name.value)
-                
-                if not any(self._match_hostname(hostname, h) for h in hostnames):
+                hostname_lower = hostname.lower()
+                if not any(self._match_hostname(hostname_lower, h) for h in hostnames):
                     issues.append(f"Hostname {hostname} not in certificate SAN")
                     
-            except x509.ExtensionNotFound:
+            else:
                 # Check common name if no SAN
                 try:
                     subject = certificate.subject
@@ -148,10 +270,16 @@ class TLSValidator:
                     issues.append("Certificate missing key usage extension")
             
             # Check issuer
-            issuer_name = certificate.issuer.rfc4514_string()
+            issuer = certificate.issuer
+            issuer_name = issuer.rfc4514_string()
             
             if self.strict_mode:
-                trusted = any(ca in issuer_name for ca in self.TRUSTED_CAS)
+                # Most issuers name the CA exactly in their organization
+                # attribute; fall back to scanning the full issuer name
+                org_attrs = issuer.get_attributes_for_oid(x509.oid.NameOID.ORGANIZATION_NAME)
+                trusted = (
+                    bool(org_attrs) and org_attrs[0].value in self._trusted_orgs
+                ) or self._is_trusted_issuer(issuer_name)
                 if not trusted:
                     issues.append(f"Certificate issued by untrusted CA: {issuer_name}")
             
@@ -162,7 +290,7 @@ class TLSValidator:
                 details={
                     "hostname": hostname,
                     "issuer": issuer_name,
-                    "expires": certificate.not_valid_after.isoformat(),
+                    "expires": not_after.isoformat(),
                     "issues_count": len(issues)
                 }
             )
@@ -187,18 +315,21 @@ class TLSValidator:
         Returns:
             True if hostname matches pattern
         """
+        hostname = hostname.lower()
+        pattern = pattern.lower()
+        
         if pattern.startswith('*.'):
-            # Wildcard certificate
-            pattern_parts = pattern[2:].split('.')
-            hostname_parts = hostname.split('.')
-            
-            if len(hostname_parts) != len(pattern_parts) + 1:
-                return False
-            
-            return hostname_parts[1:] == pattern_parts
+            # Wildcard certificate: "*" stands for exactly one non-empty label
+            suffix = pattern[1:]
+            label_end = len(hostname) - len(suffix)
+            return (
+                label_end > 0
+                and hostname.endswith(suffix)
+                and hostname.find('.', 0, label_end) == -1
+            )
         else:
             # Exact match
-            return hostname.lower() == pattern.lower()
+            return hostname == pattern
     
     def get_certificate_info(self, hostname: str, port: int = 443) -> Optional[Dict[str, Any]]:
         """Get certificate information for a hostname.
@@ -210,36 +341,207 @@ class TLSValidator:
         Returns:
             Certificate information dictionary or None if failed
         """
-        cache_key = f"{hostname}:{port}"
-        
-        # Check cache first
-        if cache_key in self.certificate_cache:
-            cert, cached_at = self.certificate_cache[cache_key]
-            if datetime.utcnow() - cached_at < self.cache_ttl:
-                return self._cert_to_dict(cert)
+        cache_key = (hostname, port)
+        hit, cert_info = self._lookup_certificate_cache(cache_key)
+        if hit:
+            return cert_info
         
         try:
             # Get certificate from server
-            context = self.create_secure_context()
+            context = self.shared_context
             
             with ssl.create_connection((hostname, port), timeout=10) as sock:
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
                     cert_der = ssock.getpeercert(binary_form=True)
-                    cert = x509.load_der_x509_certificate(cert_der, default_backend())
-                    
-                    # Cache certificate
-                    self.certificate_cache[cache_key] = (cert, datetime.utcnow())
-                    
-                    return self._cert_to_dict(cert)
-                    
+            
+            return dict(self._certificate_info_from_der(cache_key, cert_der))
+            
         except Exception as e:
-            log_security_event(
-                event_type="certificate_fetch_error",
-                severity=ErrorSeverity.MEDIUM,
-                details={"hostname": hostname, "port": port, "error": str(e)}
+            self._record_fetch_failure(cache_key, e)
+            return None
+    
+    async def get_certificate_info_async(
+        self,
+        hostname: str,
+        port: int = 443,
+        timeout: float = 10.0
+    ) -> Optional[Dict[str, Any]]:
+        """Get certificate information without blocking the event loop.
+        
+        Same caching and result as get_certificate_info, but the TLS handshake
+        runs on the event loop instead of a blocking socket.
+        
+        Args:
+            hostname: Hostname to check
+            port: Port to connect to
+            timeout: Seconds allowed for connecting and the handshake
+            
+        Returns:
+            Certificate information dictionary or None if failed
+        """
+        cache_key = (hostname, port)
+        hit, cert_info = self._lookup_certificate_cache(cache_key)
+        if hit:
+            return cert_info
+        
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    hostname, port, ssl=self.shared_context, server_hostname=hostname
+                ),
+                timeout=timeout
             )
+            try:
+                cert_der = writer.get_extra_info('ssl_object').getpeercert(binary_form=True)
+            finally:
+                writer.close()
+                # Let the TLS shutdown finish so the transport is not left
+                # open; a failing shutdown does not affect the certificate
+                try:
+                    await asyncio.wait_for(writer.wait_closed(), timeout=timeout)
+                except Exception:
+                    pass
+            
+            return dict(self._certificate_info_from_der(cache_key, cert_der))
+            
+        except Exception as e:
+            self._record_fetch_failure(cache_key, e)
             return None
     
+    def validate_many(
+        self,
+        hostnames: Iterable[str],
+        port: int = 443
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch certificate information for several hosts concurrently.
+        
+        Handshakes are network-bound and certificate parsing runs in OpenSSL,
+        so a thread pool overlaps them, e.g. when warming up allowed hosts.
+        
+        Args:
+            hostnames: Hostnames to check
+            port: Port to connect to
+            
+        Returns:
+            Mapping of hostname to certificate information (None if failed)
+        """
+        hosts = list(dict.fromkeys(hostnames))
+        if not hosts:
+            return {}
+        
+        max_workers = min(len(hosts), (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(partial(self.get_certificate_info, port=port), hosts)
+            return dict(zip(hosts, results))
+    
+    def _lookup_certificate_cache(
+        self,
+        cache_key: Tuple[str, int]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Answer a certificate lookup from the positive or negative cache.
+        
+        Args:
+            cache_key: (hostname, port) being looked up
+            
+        Returns:
+            (hit, cert_info); cert_info is None on a negative-cache hit
+        """
+        with self._cache_lock:
+            cached = self.certificate_cache.get(cache_key)
+            if cached is not None:
+                cert_info, _, _, _, cached_at = cached
+                if time.monotonic() - cached_at < self.cache_ttl_s:
+                    self.certificate_cache.move_to_end(cache_key)
+                    return True, dict(cert_info)
+            
+            # Skip hosts whose last fetch failed recently
+            failed_at = self._negative_cache.get(cache_key)
+            if failed_at is not None:
+                if time.monotonic() - failed_at < self.negative_cache_ttl_s:
+                    return True, None
+                del self._negative_cache[cache_key]
+        
+        return False, None
+    
+    def _record_fetch_failure(self, cache_key: Tuple[str, int], error: Exception) -> None:
+        """Negative-cache a failed certificate fetch and log it.
+        
+        Args:
+            cache_key: (hostname, port) that failed
+            error: Exception raised by the fetch
+        """
+        with self._cache_lock:
+            self._negative_cache[cache_key] = time.monotonic()
+            while len(self._negative_cache) > self.cache_size:
+                self._negative_cache.popitem(last=False)
+        
+        hostname, port = cache_key
+        log_security_event(
+            event_type="certificate_fetch_error",
+            severity=ErrorSeverity.MEDIUM,
+            details={"hostname": hostname, "port": port, "error": str(error)}
+        )
+    
+    def _certificate_info_from_der(
+        self,
+        cache_key: Tuple[str, int],
+        cert_der: bytes
+    ) -> Dict[str, Any]:
+        """Describe a fetched certificate, parsing it only if it changed.
+        
+        A host that serves the same certificate as last time only costs a
+        hash of the DER bytes and a lifetime check.
+        
+        Args:
+            cache_key: (hostname, port) the certificate was fetched from
+            cert_der: DER-encoded certificate
+            
+        Returns:
+            Certificate information dictionary (cached; callers copy it)
+        """
+        digest = hashlib.sha256(cert_der).digest()
+        
+        cached = self.certificate_cache.get(cache_key)
+        if cached is not None:
+            cert_info, cached_digest, not_before, not_after, _ = cached
+            # Identical DER means identical validity bounds, so the cached
+            # lifetimes are reused and nothing in the certificate is decoded
+            if cached_digest == digest and _utcnow() < not_after:
+                self._cache_certificate(cache_key, cert_info, digest, not_before, not_after)
+                return cert_info
+        
+        cert = x509.load_der_x509_certificate(cert_der, default_backend())
+        cert_info = self._cert_to_dict(cert)
+        self._cache_certificate(cache_key, cert_info, digest, *_validity_bounds(cert))
+        return cert_info
+    
+    def _cache_certificate(
+        self,
+        cache_key: Tuple[str, int],
+        cert_info: Dict[str, Any],
+        digest: bytes,
+        not_before: datetime,
+        not_after: datetime
+    ) -> None:
+        """Cache certificate information, evicting the least recently used host.
+        
+        Args:
+            cache_key: (hostname, port) the certificate was fetched from
+            cert_info: Dictionary form of the certificate
+            digest: SHA-256 of the DER-encoded certificate
+            not_before: Start of the certificate's validity period
+            not_after: End of the certificate's validity period
+        """
+        with self._cache_lock:
+            self.certificate_cache[cache_key] = (
+                cert_info, digest, not_before, not_after, time.monotonic()
+            )
+            self.certificate_cache.move_to_end(cache_key)
+            self._negative_cache.pop(cache_key, None)
+            
+            while len(self.certificate_cache) > self.cache_size:
+                self.certificate_cache.popitem(last=False)
+    
     def _cert_to_dict(self, cert: x509.Certificate) -> Dict[str, Any]:
         """Convert certificate to dictionary format.
         
@@ -247,56 +549,145 @@ class TLSValidator:
             cert: Certificate to convert
             
         Returns:
-            Certificate information dictionary
+            Certificate information dictionary (shared; callers copy it)
         """
-        try:
-            # Get subject alternative names
-            san_names = []
-            try:
-                san_extension = cert.extensions.get_extension_for_oid(
-                    x509.oid.ExtensionOID.SUBJECT_ALTERNATIVE_NAME
-                ).value
-                
-                for name in san_extension:
-                    if isinstance(name, x509.DNSName):
-                        san_names.append(name.value)
-            except x509.ExtensionNotFound:
-                pass
-            
-            return {
-                "subject": cert.subject.rfc4514_string(),
-                "issuer": cert.issuer.rfc4514_string(),
-                "serial_number": str(cert.serial_number),
-                "not_valid_before": cert.not_valid_before.isoformat(),
-                "not_valid_after": cert.not_valid_after.isoformat(),
-                "san_names": san_names,
-                "signature_algorithm": cert.signature_algorithm_oid._name,
-                "version": cert.version.name
-            }
-        except Exception as e:
-            return {"error": str(e)}
+        return _describe_certificate(cert)
+
+
+# Default CA list lookups, built once at import and shared by validators
+_TRUSTED_CAS_FROZEN: FrozenSet[str] = frozenset(TLSValidator.TRUSTED_CAS)
+_TRUSTED_CAS_MATCHER = _build_substring_matcher(TLSValidator.TRUSTED_CAS)
+
+
+@lru_cache(maxsize=1024)
+def _describe_certificate(cert: x509.Certificate) -> Dict[str, Any]:
+    """Format a certificate's fields, once per distinct certificate.
+    
+    Certificates hash and compare by their DER encoding, so hosts sharing a
+    certificate, and re-fetches after a cache entry expires, reuse the
+    formatted names and dates.
+    
+    Args:
+        cert: Certificate to describe
+        
+    Returns:
+        Certificate information dictionary
+    """
+    try:
+        # Get subject alternative names
+        san_names = list(_extract_san_dns(cert) or ())
+        not_before, not_after = _validity_bounds(cert)
+        
+        return {
+            "subject": cert.subject.rfc4514_string(),
+            "issuer": cert.issuer.rfc4514_string(),
+            "serial_number": str(cert.serial_number),
+            "not_valid_before": not_before.isoformat(),
+            "not_valid_after": not_after.isoformat(),
+            "san_names": san_names,
+            "signature_algorithm": cert.signature_algorithm_oid._name,
+            "version": cert.version.name
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@lru_cache(maxsize=1024)
+def _canonicalize_url(method: str, url: str, preserve_query_encoding: bool = False) -> str:
+    """Create the method, path, and query lines of a canonical request.
+    
+    These depend only on the method and URL, so repeated requests to the
+    same endpoint reuse the parsed and sorted result.
+    
+    Args:
+        method: HTTP method
+        url: Request URL
+        preserve_query_encoding: Sort the query's raw "name=value" pairs as
+            sent instead of decoding and re-encoding them
+        
+    Returns:
+        Newline-separated normalized method, path, and query string
+    """
+    parsed_url = urllib.parse.urlparse(url)
+    
+    # Normalize path
+    path = parsed_url.path or '/'
+    
+    # Normalize query string
+    query = parsed_url.query
+    if preserve_query_encoding:
+        query_string = '&'.join(sorted(query.split('&'))) if query else ''
+    else:
+        query_params = urllib.parse.parse_qsl(query, keep_blank_values=True)
+        query_params.sort()
+        query_string = urllib.parse.urlencode(query_params)
+    
+    return '\n'.join([method.upper(), path, query_string])
 
 
 class RequestSigner:
     """Signs HTTP requests for additional security."""
     
-    def __init__(self, secret_key: str, algorithm: str = "sha256"):
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "sha256",
+        body_hash_algorithm: str = "sha256",
+        preserve_query_encoding: bool = False
+    ):
         """Initialize request signer.
         
         Args:
             secret_key: Secret key for signing
             algorithm: Hash algorithm to use
+            body_hash_algorithm: Algorithm for the body hash in the canonical
+                request; "blake3" (requires the blake3 package) or any hashlib
+                algorithm. Signer and verifier must use the same one.
+            preserve_query_encoding: Canonicalize the query by sorting its
+                percent-encoded pairs as sent, skipping the decode/re-encode
+                round trip. Only safe when clients encode queries consistently;
+                signer and verifier must use the same setting.
         """
         self.secret_key = secret_key.encode() if isinstance(secret_key, str) else secret_key
         self.algorithm = algorithm
         self.hash_func = getattr(hashlib, algorithm)
+        # Keyed once; copies skip re-deriving the inner/outer pads per request
+        self._hmac_template = hmac.new(self.secret_key, None, self.hash_func)
+        self.body_hash_algorithm = body_hash_algorithm
+        self._body_hasher = self._get_body_hasher(body_hash_algorithm)
+        self.preserve_query_encoding = preserve_query_encoding
+    
+    @staticmethod
+    def _get_body_hasher(name: str) -> Callable[[bytes], Any]:
+        """Resolve a body hash constructor.
+        
+        Args:
+            name: Hash algorithm name
+            
+        Returns:
+            Callable taking the body and returning a hash object
+            
+        Raises:
+            ValueError: If the algorithm is not available
+        """
+        if name == "blake3":
+            if blake3 is None:
+                raise ValueError("blake3 body hashing requires the blake3 package")
+            return blake3.blake3
+        
+        # Named constructors such as hashlib.sha256 skip hashlib.new's lookup
+        hasher = getattr(hashlib, name, None)
+        if hasher is None:
+            hasher = partial(hashlib.new, name)
+            hasher(b'')  # Raises ValueError for unsupported algorithms
+        return hasher
     
     def sign_request(
         self, 
         method: str, 
         url: str, 
-        headers: Optional[Dict[str, str]] = None,
-        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[Union[bytes, BinaryIO]] = None,
         timestamp: Optional[int] = None
     ) -> Dict[str, str]:
         """Sign an HTTP request.
@@ -305,29 +696,22 @@ class RequestSigner:
             method: HTTP method
             url: Request URL
             headers: Request headers
-            body: Request body
+            body: Request body bytes or seekable binary file object
             timestamp: Request timestamp (uses current time if None)
             
         Returns:
             Dictionary with signature headers
+            
+        Raises:
+            ValueError: If a file-like body is not seekable
         """
         if timestamp is None:
             timestamp = int(time.time())
         
-        # Parse URL components
-        parsed_url = urllib.parse.urlparse(url)
-        
-        # Create canonical request
-        canonical_request = self._create_canonical_request(
-            method, parsed_url, headers or {}, body or b'', timestamp
-        )
-        
-        # Create signature
-        signature = hmac.new(
-            self.secret_key,
-            canonical_request.encode('utf-8'),
-            self.hash_func
-        ).hexdigest()
+        # Create canonical request and signature
+        signature = self._compute_signature(self._canonical_request_segments(
+            method, url, headers or {}, body or b'', timestamp
+        ))
         
         # Return signature headers
         return {
@@ -340,8 +724,8 @@ class RequestSigner:
         self,
         method: str,
         url: str,
-        headers: Dict[str, str],
-        body: Optional[bytes] = None,
+        headers: Mapping[str, str],
+        body: Optional[Union[bytes, BinaryIO]] = None,
         max_age_seconds: int = 300
     ) -> bool:
         """Verify a signed HTTP request.
@@ -350,7 +734,7 @@ class RequestSigner:
             method: HTTP method
             url: Request URL
             headers: Request headers
-            body: Request body
+            body: Request body bytes or seekable binary file object
             max_age_seconds: Maximum age of request in seconds
             
         Returns:
@@ -383,16 +767,9 @@ class RequestSigner:
                 return False
             
             # Create expected signature
-            parsed_url = urllib.parse.urlparse(url)
-            canonical_request = self._create_canonical_request(
-                method, parsed_url, headers, body or b'', timestamp
-            )
-            
-            expected_signature = hmac.new(
-                self.secret_key,
-                canonical_request.encode('utf-8'),
-                self.hash_func
-            ).hexdigest()
+            expected_signature = self._compute_signature(self._canonical_request_segments(
+                method, url, headers, body or b'', timestamp
+            ))
             
             # Compare signatures securely
             is_valid = hmac.compare_digest(signature, expected_signature)
@@ -414,70 +791,115 @@ class RequestSigner:
             )
             return False
     
-    def _create_canonical_request(
+    def _compute_signature(self, segments: List[bytes]) -> str:
+        """HMAC the canonical request segment by segment.
+        
+        Args:
+            segments: Encoded canonical request pieces
+            
+        Returns:
+            Hex-encoded signature
+        """
+        mac = self._hmac_template.copy()
+        for segment in segments:
+            mac.update(segment)
+        return mac.hexdigest()
+    
+    def _hash_body(self, body: Union[bytes, BinaryIO]) -> str:
+        """Hash a request body, streaming it in chunks if it is file-like.
+        
+        A file-like body is read from its current position and then seeked
+        back, so it can still be sent after signing.
+        
+        Args:
+            body: Request body bytes or seekable binary file object
+            
+        Returns:
+            Hex-encoded body hash
+            
+        Raises:
+            ValueError: If the file-like body is not seekable
+        """
+        if not hasattr(body, 'read'):
+            return self._body_hasher(body).hexdigest()
+        
+        seekable = getattr(body, 'seekable', None)
+        if seekable is None or not seekable():
+            raise ValueError("File-like request bodies must be seekable to be signed")
+        
+        position = body.tell()
+        hasher = self._body_hasher(b'')
+        try:
+            for chunk in iter(partial(body.read, _BODY_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        finally:
+            body.seek(position)
+        return hasher.hexdigest()
+    
+    def _canonical_request_segments(
         self,
         method: str,
-        parsed_url: urllib.parse.ParseResult,
-        headers: Dict[str, str],
-        body: bytes,
+        url: str,
+        headers: Mapping[str, str],
+        body: Union[bytes, BinaryIO],
         timestamp: int
-    ) -> str:
-        """Create canonical request string for signing.
+    ) -> List[bytes]:
+        """Create the canonical request for signing as encoded segments.
+        
+        The segments concatenate to the newline-separated canonical request,
+        which is fed to the HMAC without being joined into one string.
         
         Args:
             method: HTTP method
-            parsed_url: Parsed URL components
+            url: Request URL
             headers: Request headers
-            body: Request body
+            body: Request body bytes or binary file object
             timestamp: Request timestamp
             
         Returns:
-            Canonical request string
+            Canonical request segments
         """
-        # Normalize method
-        method = method.upper()
-        
-        # Normalize path
-        path = parsed_url.path or '/'
+        # Normalized method, path, and query (cached per endpoint)
+        url_part = _canonicalize_url(method, url, self.preserve_query_encoding)
         
-        # Normalize query string
-        query_params = urllib.parse.parse_qsl(parsed_url.query, keep_blank_values=True)
-        query_params.sort()
-        query_string = urllib.parse.urlencode(query_params)
-        
-        # Normalize headers (exclude signature headers)
-        normalized_headers = {}
-        for key, value in headers.items():
-            if not key.lower().startswith('x-signature'):
-                normalized_headers[key.lower()] = value.strip()
+        # Normalize headers (exclude signature headers); any mapping works,
+        # including httpx.Headers, so callers need not copy it into a dict
+        lowered_headers = ((key.lower(), value) for key, value in headers.items())
+        normalized_headers = sorted(
+            (key, value.strip()) for key, value in lowered_headers
+            if not key.startswith('x-signature')
+        )
         
-        header_string = '\n'.join(f'{k}:{v}' for k, v in sorted(normalized_headers.items()))
+        header_string = '\n'.join(f'{k}:{v}' for k, v in normalized_headers)
         
         # Create body hash
-        body_hash = hashlib.sha256(body).hexdigest()
+        body_hash = self._hash_body(body)
         
-        # Create canonical request
-        canonical_request = '\n'.join([
-            method,
-            path,
-            query_string,
-            header_string,
-            str(timestamp),
-            body_hash
-        ])
-        
-        return canonical_request
+        return [
+            url_part.encode('utf-8'), b'\n',
+            header_string.encode('utf-8'), b'\n',
+            str(timestamp).encode('ascii'), b'\n',
+            body_hash.encode('ascii')
+        ]
 
 
 class NetworkSecurityManager:
     """Manages network security for HTTP clients."""
     
+    __slots__ = (
+        'enable_tls_validation', 'enable_request_signing', 'allowed_hosts',
+        'tls_validator', 'request_signer', '_tls_validations', '_tls_failures',
+        '_blocked_hosts', '_signed_requests', 'event_log_interval_s',
+        '_event_counts', '_event_window_start'
+    )
+    
     def __init__(
         self,
         enable_tls_validation: bool = True,
         enable_request_signing: bool = False,
         signing_secret: Optional[str] = None,
-        allowed_hosts: Optional[List[str]] = None
+        allowed_hosts: Optional[Iterable[str]] = None,
+        event_log_interval_s: float = 1.0
     ):
         """Initialize network security manager.
         
@@ -486,21 +908,38 @@ class NetworkSecurityManager:
             enable_request_signing: Whether to enable request signing
             signing_secret: Secret for request signing
             allowed_hosts: List of allowed hostnames (None = allow all)
+            event_log_interval_s: Window over which routine per-request
+                events are counted and logged as one event per host and
+                request method or response status code
         """
         self.enable_tls_validation = enable_tls_validation
         self.enable_request_signing = enable_request_signing
-        self.allowed_hosts = set(allowed_hosts) if allowed_hosts else None
+        self.allowed_hosts = frozenset(allowed_hosts) if allowed_hosts else None
         
         # Initialize components
         self.tls_validator = TLSValidator(strict_mode=enable_tls_validation)
         self.request_signer = RequestSigner(signing_secret) if signing_secret else None
         
-        # Security metrics
-        self.security_metrics = {
-            "tls_validations": 0,
-            "tls_failures": 0,
-            "blocked_hosts": 0,
-            "signed_requests": 0
+        # Security metrics, kept as plain counters updated from request hooks
+        self._tls_validations = 0
+        self._tls_failures = 0
+        self._blocked_hosts = 0
+        self._signed_requests = 0
+        
+        # Routine request/response events, aggregated per
+        # (event_type, host, detail name, detail value)
+        self.event_log_interval_s = event_log_interval_s
+        self._event_counts: Dict[Tuple[str, str, str, Any], int] = {}
+        self._event_window_start = time.monotonic()
+    
+    @property
+    def security_metrics(self) -> Dict[str, int]:
+        """Security event counters."""
+        return {
+            "tls_validations": self._tls_validations,
+            "tls_failures": self._tls_failures,
+            "blocked_hosts": self._blocked_hosts,
+            "signed_requests": self._signed_requests
         }
     
     def create_secure_client(self, **kwargs) -> httpx.AsyncClient:
@@ -512,10 +951,9 @@ class NetworkSecurityManager:
         Returns:
             Configured secure HTTP client
         """
-        # Create SSL context if TLS validation is enabled
+        # Use the shared SSL context if TLS validation is enabled
         if self.enable_tls_validation:
-            ssl_context = self.tls_validator.create_secure_context()
-            kwargs['verify'] = ssl_context
+            kwargs['verify'] = self.tls_validator.shared_context
         
         # Set security headers
         default_headers = {
@@ -549,7 +987,7 @@ class NetworkSecurityManager:
         """
         # Validate allowed hosts
         if self.allowed_hosts and request.url.host not in self.allowed_hosts:
-            self.security_metrics["blocked_hosts"] += 1
+            self._blocked_hosts += 1
             log_security_event(
                 event_type="blocked_host_request",
                 severity=ErrorSeverity.HIGH,
@@ -562,26 +1000,17 @@ class NetworkSecurityManager:
             signature_headers = self.request_signer.sign_request(
                 method=request.method,
                 url=str(request.url),
-                headers=dict(request.headers),
+                headers=request.headers,
                 body=request.content
             )
             
             for key, value in signature_headers.items():
                 request.headers[key] = value
             
-            self.security_metrics["signed_requests"] += 1
+            self._signed_requests += 1
         
-        # Log request for security monitoring
-        log_security_event(
-            event_type="secure_request_initiated",
-            severity=ErrorSeverity.LOW,
-            details={
-                "method": request.method,
-                "host": request.url.host,
-                "path": request.url.path,
-                "signed": self.enable_request_signing
-            }
-        )
+        # Count request for security monitoring
+        self._count_event("secure_request_initiated", request.url.host, "method", request.method)
     
     async def _post_response_hook(self, response: httpx.Response) -> None:
         """Post-response security hook.
@@ -591,22 +1020,54 @@ class NetworkSecurityManager:
         """
         # Validate TLS if enabled
         if self.enable_tls_validation and response.url.scheme == 'https':
-            self.security_metrics["tls_validations"] += 1
+            self._tls_validations += 1
             
             # Note: In a real implementation, you would extract the certificate
             # from the response and validate it. This is a simplified version.
             
-        # Log response for security monitoring
-        log_security_event(
-            event_type="secure_response_received",
-            severity=ErrorSeverity.LOW,
-            details={
-                "status_code": response.status_code,
-                "host": response.url.host,
-                "content_type": response.headers.get("content-type", "unknown")
-            }
+        # Count response for security monitoring
+        self._count_event(
+            "secure_response_received", response.url.host, "status_code", response.status_code
         )
     
+    def _count_event(self, event_type: str, host: str, detail: str, value: Any) -> None:
+        """Count a routine event, flushing the counts once the window ends.
+        
+        Args:
+            event_type: Type of security event
+            host: Host the event relates to
+            detail: Name of the event detail counted separately, e.g. "status_code"
+            value: Value of that detail
+        """
+        key = (event_type, host, detail, value)
+        self._event_counts[key] = self._event_counts.get(key, 0) + 1
+        
+        if time.monotonic() - self._event_window_start >= self.event_log_interval_s:
+            self.flush_security_events()
+    
+    def flush_security_events(self) -> None:
+        """Log one aggregated event per (event_type, host, detail) and reset counts.
+        
+        Call at shutdown so that the last, partial window is not lost.
+        """
+        now = time.monotonic()
+        window_s = round(now - self._event_window_start, 3)
+        counts, self._event_counts = self._event_counts, {}
+        self._event_window_start = now
+        
+        for (event_type, host, detail, value), count in counts.items():
+            log_security_event(
+                event_type=event_type,
+                severity=ErrorSeverity.LOW,
+                details={
+                    "host": host,
+                    detail: value,
+                    "count": count,
+                    "window_s": window_s,
+                    "signed": self.enable_request_signing
+                }
+            )
+    
     def get_security_metrics(self) -> Dict[str, Any]:
         """Get security metrics.
         
@@ -621,6 +1082,9 @@ class NetworkSecurityManager:
         }
 
 
+# Hosts the global manager lets Spotify clients reach
+_DEFAULT_ALLOWED_HOSTS: FrozenSet[str] = frozenset(("api.spotify.com", "accounts.spotify.com"))
+
 # Global network security manager
 _network_security: Optional[NetworkSecurityManager] = None
 
@@ -635,7 +1099,7 @@ def get_network_security() -> NetworkSecurityManager:
     if _network_security is None:
         _network_security = NetworkSecurityManager(
             enable_tls_validation=True,
-            allowed_hosts=["api.spotify.com", "accounts.spotify.com"]
+            allowed_hosts=_DEFAULT_ALLOWED_HOSTS
         )
     return _network_security
 
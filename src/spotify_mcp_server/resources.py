@@ -1,9 +1,13 @@
 """ABOUTME: MCP resources for exposing Spotify data as readable resources.
 ABOUTME: Implements resource handlers for playlists, tracks, albums, and artists with URI-based access."""
 
+import asyncio
+import io
 import logging
-from typing import Any, Dict, List
-from urllib.parse import urlparse
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastmcp import FastMCP
 
@@ -11,6 +15,126 @@ from .spotify_client import SpotifyClient, SpotifyAPIError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Spotify's per-request ID limits for several tracks / audio features
+_TRACKS_PER_REQUEST = 50
+_AUDIO_FEATURES_PER_REQUEST = 100
+
+# Maximum unique track IDs in one tracks://batch read, so a single read
+# cannot fan out into an unbounded number of rate-limited API requests
+_MAX_BATCH_TRACKS = 50
+
+# Maximum Spotify requests a batch resource has in flight at once
+_BATCH_CONCURRENCY = 8
+
+# Resource path routes; leading/trailing slashes and extra segments are ignored
+_PLAYLIST_PATH = re.compile(r"/*user/([^/]+)")
+_TRACK_PATH = re.compile(r"/*([^/]+)/([^/]+)(.*?)/*$", re.DOTALL)
+_DETAILS_PATH = re.compile(r"/*details/([^/]+)")
+
+# Pitch class names indexed by Spotify's audio-features "key" (0 = C)
+_KEY_NAMES = ('C', 'C♯/D♭', 'D', 'D♯/E♭', 'E', 'F', 'F♯/G♭', 'G', 'G♯/A♭', 'A', 'A♯/B♭', 'B')
+
+# Mode names indexed by whether Spotify's "mode" is 1 (major)
+_MODE_NAMES = ('Minor', 'Major')
+
+
+def _artist_names(artists: List[Dict[str, Any]]) -> str:
+    """Join artist names for display, skipping artists without a name.
+    
+    Args:
+        artists: Simplified artist objects from a Spotify response
+        
+    Returns:
+        Comma-separated artist names
+    """
+    return ", ".join([artist["name"] for artist in artists if "name" in artist])
+
+
+def _format_duration(duration_ms: int) -> str:
+    """Format a duration in milliseconds as m:ss.
+    
+    Args:
+        duration_ms: Duration in milliseconds
+        
+    Returns:
+        Duration as minutes and zero-padded seconds
+    """
+    minutes, remainder = divmod(duration_ms, 60000)
+    return f"{minutes}:{remainder // 1000:02d}"
+
+
+def _document(buf: io.StringIO) -> str:
+    """Get the text written to a resource buffer.
+    
+    Every line is written with its newline inline; the last one is dropped
+    so documents end the way a newline-joined list of lines would. FastMCP
+    resource functions must return the whole document (there is no streaming
+    resource API to yield lines to), so the buffer is the only copy built
+    before this final string.
+    
+    Args:
+        buf: Buffer the resource lines were written to
+    
+    Returns:
+        Resource document text
+    """
+    return buf.getvalue()[:-1]
+
+
+class _RenderedResourceCache:
+    """LRU of rendered resource documents that expire after a fixed TTL."""
+    
+    __slots__ = ('max_size', 'ttl_s', '_entries')
+    
+    def __init__(self, max_size: int = 512, ttl_s: float = 300.0):
+        """Initialize rendered resource cache.
+        
+        Args:
+            max_size: Maximum number of documents to keep
+            ttl_s: Seconds a document is served before it is rendered again
+        """
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        # (resource type, ID) -> (document, time.monotonic() when rendered)
+        self._entries: OrderedDict[Tuple[str, str], Tuple[str, float]] = OrderedDict()
+    
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        """Get a rendered document if it has not expired.
+        
+        Args:
+            key: (resource type, ID) of the document
+            
+        Returns:
+            Rendered document or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        document, rendered_at = entry
+        if time.monotonic() - rendered_at >= self.ttl_s:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return document
+    
+    def set(self, key: Tuple[str, str], document: str) -> str:
+        """Store a rendered document, evicting the least recently used one.
+        
+        Args:
+            key: (resource type, ID) of the document
+            document: Rendered document
+            
+        Returns:
+            The document, so handlers can store and return in one step
+        """
+        self._entries[key] = (document, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return document
+
 
 def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> None:
     """Register all Spotify MCP resources with the FastMCP application.
@@ -19,6 +143,9 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
         app: FastMCP application instance
         spotify_client: Configured Spotify API client
     """
+    # Track, album, and artist details rarely change within minutes;
+    # playlists are edited through tools, so they are always fetched
+    rendered = _RenderedResourceCache()
     
     @app.resource("playlists://{path}")
     async def playlists_resource(path: str) -> str:
@@ -35,18 +162,20 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
             Formatted playlist data as string
         """
         try:
-            path_parts = path.strip('/').split('/')
-            
-            if len(path_parts) < 2 or path_parts[0] != 'user':
+            match = _PLAYLIST_PATH.match(path)
+            if match is None:
                 raise ValueError("Invalid playlist path format. Use user/all or user/{playlist_id}")
             
-            if path_parts[1] == 'all':
+            playlist_id = match.group(1)
+            if playlist_id == 'all':
                 # Get all user playlists
                 pass  # logger.info suppressed for MCP("Fetching all user playlists")
                 result = await spotify_client.get_user_playlists(limit=50)
                 
                 playlists = result.get("items", [])
-                output_lines = ["# User Playlists\n"]
+                buf = io.StringIO()
+                write = buf.write
+                write("# User Playlists\n\n")
                 
                 for playlist in playlists:
                     name = playlist.get("name", "Unknown")
@@ -55,22 +184,25 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
                     track_count = playlist.get("tracks", {}).get("total", 0)
                     public = playlist.get("public", False)
                     
-                    output_lines.append(f"## {name}")
-                    output_lines.append(f"- **ID:** {playlist_id}")
-                    output_lines.append(f"- **Description:** {description or 'No description'}")
-                    output_lines.append(f"- **Tracks:** {track_count}")
-                    output_lines.append(f"- **Public:** {'Yes' if public else 'No'}")
-                    output_lines.append(f"- **URI:** playlists://user/{playlist_id}")
-                    output_lines.append("")
+                    write(
+                        f"## {name}\n"
+                        f"- **ID:** {playlist_id}\n"
+                        f"- **Description:** {description or 'No description'}\n"
+                        f"- **Tracks:** {track_count}\n"
+                        f"- **Public:** {'Yes' if public else 'No'}\n"
+                        f"- **URI:** playlists://user/{playlist_id}\n"
+                        "\n"
+                    )
                 
-                return "\n".join(output_lines)
+                return _document(buf)
             
             else:
                 # Get specific playlist
-                playlist_id = path_parts[1]
                 pass  # logger.info suppressed for MCP(f"Fetching playlist: {playlist_id}")
                 
-                result = await spotify_client.get_playlist(playlist_id)
+                result = await spotify_client.get_playlist_or_none(playlist_id)
+                if result is None:
+                    return f"Playlist not found: playlists://{path}"
                 
                 name = result.get("name", "Unknown")
                 description = result.get("description", "")
@@ -78,33 +210,35 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
                 owner = result.get("owner", {}).get("display_name", "Unknown")
                 public = result.get("public", False)
                 
-                output_lines = [f"# {name}\n"]
-                output_lines.append(f"**Description:** {description or 'No description'}")
-                output_lines.append(f"**Owner:** {owner}")
-                output_lines.append(f"**Tracks:** {track_count}")
-                output_lines.append(f"**Public:** {'Yes' if public else 'No'}")
-                output_lines.append(f"**Playlist ID:** {playlist_id}")
-                output_lines.append("")
+                buf = io.StringIO()
+                write = buf.write
+                write(
+                    f"# {name}\n\n"
+                    f"**Description:** {description or 'No description'}\n"
+                    f"**Owner:** {owner}\n"
+                    f"**Tracks:** {track_count}\n"
+                    f"**Public:** {'Yes' if public else 'No'}\n"
+                    f"**Playlist ID:** {playlist_id}\n"
+                    "\n"
+                )
                 
                 # Add tracks
                 tracks = result.get("tracks", {}).get("items", [])
                 if tracks:
-                    output_lines.append("## Tracks\n")
+                    write("## Tracks\n\n")
                     for i, item in enumerate(tracks[:50], 1):  # Limit to first 50 tracks
                         track = item.get("track", {})
                         if track and track.get("type") == "track":
                             track_name = track.get("name", "Unknown")
-                            artists = ", ".join([artist.get("name", "") for artist in track.get("artists", [])])
-                            duration_ms = track.get("duration_ms", 0)
-                            duration_min = duration_ms // 60000
-                            duration_sec = (duration_ms % 60000) // 1000
+                            artists = _artist_names(track.get("artists", ()))
+                            duration = _format_duration(track.get("duration_ms", 0))
                             
-                            output_lines.append(f"{i}. **{track_name}** by {artists} ({duration_min}:{duration_sec:02d})")
+                            write(f"{i}. **{track_name}** by {artists} ({duration})\n")
                     
                     if len(tracks) > 50:
-                        output_lines.append(f"\n... and {len(tracks) - 50} more tracks")
+                        write(f"\n... and {len(tracks) - 50} more tracks\n")
                 
-                return "\n".join(output_lines)
+                return _document(buf)
                 
         except NotFoundError:
                             return f"Playlist not found: playlists://{path}"
@@ -122,6 +256,7 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
         Supported URIs:
         - tracks://search/{query} - Search results
         - tracks://details/{track_id} - Track details
+        - tracks://batch/{id1,id2,...} - Up to 50 tracks with audio features
         
         Args:
             uri: Resource URI
@@ -130,107 +265,201 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
             Formatted track data as string
         """
         try:
-            path_parts = path.strip('/').split('/')
+            match = _TRACK_PATH.match(path)
+            if match is None:
+                raise ValueError(
+                    "Invalid track path format. Use search/{query}, details/{track_id} or batch/{ids}"
+                )
             
-            if len(path_parts) < 2:
-                raise ValueError("Invalid track path format. Use search/{query} or details/{track_id}")
+            resource_type, argument, rest = match.groups()
             
-            if path_parts[0] == 'search':
+            if resource_type == 'search':
                 # Search for tracks
-                query = '/'.join(path_parts[1:])  # Handle queries with slashes
+                query = argument + rest  # Handle queries with slashes
                 pass  # logger.info suppressed for MCP(f"Searching tracks: {query}")
                 
                 result = await spotify_client.search_tracks(query=query, limit=20)
                 tracks = result.get("tracks", {}).get("items", [])
                 
-                output_lines = [f"# Search Results for '{query}'\n"]
+                buf = io.StringIO()
+                write = buf.write
+                write(f"# Search Results for '{query}'\n\n")
                 
                 if not tracks:
-                    output_lines.append("No tracks found.")
+                    write("No tracks found.\n")
                 else:
                     for i, track in enumerate(tracks, 1):
                         name = track.get("name", "Unknown")
-                        artists = ", ".join([artist.get("name", "") for artist in track.get("artists", [])])
+                        artists = _artist_names(track.get("artists", ()))
                         album = track.get("album", {}).get("name", "Unknown")
                         track_id = track.get("id", "")
-                        duration_ms = track.get("duration_ms", 0)
-                        duration_min = duration_ms // 60000
-                        duration_sec = (duration_ms % 60000) // 1000
+                        duration = _format_duration(track.get("duration_ms", 0))
                         
-                        output_lines.append(f"{i}. **{name}** by {artists}")
-                        output_lines.append(f"   - Album: {album}")
-                        output_lines.append(f"   - Duration: {duration_min}:{duration_sec:02d}")
-                        output_lines.append(f"   - Track ID: {track_id}")
-                        output_lines.append(f"   - Details: tracks://details/{track_id}")
-                        output_lines.append("")
+                        write(
+                            f"{i}. **{name}** by {artists}\n"
+                            f"   - Album: {album}\n"
+                            f"   - Duration: {duration}\n"
+                            f"   - Track ID: {track_id}\n"
+                            f"   - Details: tracks://details/{track_id}\n"
+                            "\n"
+                        )
                 
-                return "\n".join(output_lines)
+                return _document(buf)
             
-            elif path_parts[0] == 'details':
+            elif resource_type == 'details':
                 # Get track details
-                track_id = path_parts[1]
+                track_id = argument
+                cached = rendered.get(("track", track_id))
+                if cached is not None:
+                    return cached
                 pass  # logger.info suppressed for MCP(f"Fetching track details: {track_id}")
                 
                 # Get track info and audio features
-                import asyncio
-                
-                track_task = spotify_client.get_track(track_id)
-                features_task = spotify_client.get_audio_features(track_id)
-                
-                track, features = await asyncio.gather(track_task, features_task, return_exceptions=True)
+                features_task = asyncio.create_task(spotify_client.get_audio_features(track_id))
+                try:
+                    track = await spotify_client.get_track_or_none(track_id)
+                except BaseException:
+                    features_task.cancel()
+                    raise
+                if track is None:
+                    features_task.cancel()
+                    return f"Track not found: {track_id}"
                 
-                if isinstance(track, Exception):
-                    if isinstance(track, NotFoundError):
-                        return f"Track not found: {track_id}"
-                    raise track
+                # Audio features are optional, but a document rendered after
+                # a failed fetch is not cached so the next read retries it
+                features_failed = False
+                try:
+                    features = await features_task
+                except Exception:
+                    features = None
+                    features_failed = True
                 
                 name = track.get("name", "Unknown")
-                artists = ", ".join([artist.get("name", "") for artist in track.get("artists", [])])
+                artists = _artist_names(track.get("artists", ()))
                 album = track.get("album", {}).get("name", "Unknown")
                 release_date = track.get("album", {}).get("release_date", "Unknown")
-                duration_ms = track.get("duration_ms", 0)
-                duration_min = duration_ms // 60000
-                duration_sec = (duration_ms % 60000) // 1000
+                duration = _format_duration(track.get("duration_ms", 0))
                 popularity = track.get("popularity", 0)
                 explicit = track.get("explicit", False)
                 
-                output_lines = [f"# {name}\n"]
-                output_lines.append(f"**Artists:** {artists}")
-                output_lines.append(f"**Album:** {album}")
-                output_lines.append(f"**Release Date:** {release_date}")
-                output_lines.append(f"**Duration:** {duration_min}:{duration_sec:02d}")
-                output_lines.append(f"**Popularity:** {popularity}/100")
-                output_lines.append(f"**Explicit:** {'Yes' if explicit else 'No'}")
-                output_lines.append(f"**Track ID:** {track_id}")
-                output_lines.append("")
+                buf = io.StringIO()
+                write = buf.write
+                write(
+                    f"# {name}\n\n"
+                    f"**Artists:** {artists}\n"
+                    f"**Album:** {album}\n"
+                    f"**Release Date:** {release_date}\n"
+                    f"**Duration:** {duration}\n"
+                    f"**Popularity:** {popularity}/100\n"
+                    f"**Explicit:** {'Yes' if explicit else 'No'}\n"
+                    f"**Track ID:** {track_id}\n"
+                    "\n"
+                )
                 
                 # Add audio features if available
-                if not isinstance(features, Exception) and features:
-                    output_lines.append("## Audio Features\n")
-                    output_lines.append(f"- **Danceability:** {features.get('danceability', 0):.2f}")
-                    output_lines.append(f"- **Energy:** {features.get('energy', 0):.2f}")
-                    output_lines.append(f"- **Valence:** {features.get('valence', 0):.2f}")
-                    output_lines.append(f"- **Acousticness:** {features.get('acousticness', 0):.2f}")
-                    output_lines.append(f"- **Instrumentalness:** {features.get('instrumentalness', 0):.2f}")
-                    output_lines.append(f"- **Liveness:** {features.get('liveness', 0):.2f}")
-                    output_lines.append(f"- **Speechiness:** {features.get('speechiness', 0):.2f}")
-                    output_lines.append(f"- **Tempo:** {features.get('tempo', 0):.1f} BPM")
-                    output_lines.append(f"- **Loudness:** {features.get('loudness', 0):.1f} dB")
+                if features:
+                    write(
+                        "## Audio Features\n\n"
+                        f"- **Danceability:** {features.get('danceability', 0):.2f}\n"
+                        f"- **Energy:** {features.get('energy', 0):.2f}\n"
+                        f"- **Valence:** {features.get('valence', 0):.2f}\n"
+                        f"- **Acousticness:** {features.get('acousticness', 0):.2f}\n"
+                        f"- **Instrumentalness:** {features.get('instrumentalness', 0):.2f}\n"
+                        f"- **Liveness:** {features.get('liveness', 0):.2f}\n"
+                        f"- **Speechiness:** {features.get('speechiness', 0):.2f}\n"
+                        f"- **Tempo:** {features.get('tempo', 0):.1f} BPM\n"
+                        f"- **Loudness:** {features.get('loudness', 0):.1f} dB\n"
+                    )
                     
-                    key_map = {0: 'C', 1: 'C♯/D♭', 2: 'D', 3: 'D♯/E♭', 4: 'E', 5: 'F', 
-                              6: 'F♯/G♭', 7: 'G', 8: 'G♯/A♭', 9: 'A', 10: 'A♯/B♭', 11: 'B'}
                     key = features.get('key', -1)
-                    if key in key_map:
-                        mode = 'Major' if features.get('mode', 0) == 1 else 'Minor'
-                        output_lines.append(f"- **Key:** {key_map[key]} {mode}")
+                    if isinstance(key, int) and 0 <= key < 12:
+                        mode = _MODE_NAMES[features.get('mode', 0) == 1]
+                        write(f"- **Key:** {_KEY_NAMES[key]} {mode}\n")
                     
                     time_sig = features.get('time_signature', 4)
-                    output_lines.append(f"- **Time Signature:** {time_sig}/4")
+                    write(f"- **Time Signature:** {time_sig}/4\n")
                 
-                return "\n".join(output_lines)
+                if features_failed:
+                    return _document(buf)
+                return rendered.set(("track", track_id), _document(buf))
+            
+            elif resource_type == 'batch':
+                # Get several tracks, de-duplicated, in request order
+                track_ids = list(dict.fromkeys(filter(None, argument.split(','))))
+                if not track_ids:
+                    raise ValueError("No track IDs given. Use batch/{id1,id2,...}")
+                if len(track_ids) > _MAX_BATCH_TRACKS:
+                    raise ValueError(
+                        f"Too many track IDs: {len(track_ids)} given, "
+                        f"at most {_MAX_BATCH_TRACKS} per batch"
+                    )
+                
+                semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+                
+                async def bounded(coro):
+                    async with semaphore:
+                        return await coro
+                
+                track_batches = [
+                    bounded(spotify_client.get_several_tracks(track_ids[i:i + _TRACKS_PER_REQUEST]))
+                    for i in range(0, len(track_ids), _TRACKS_PER_REQUEST)
+                ]
+                feature_batches = [
+                    bounded(spotify_client.get_bulk_audio_features(track_ids[i:i + _AUDIO_FEATURES_PER_REQUEST]))
+                    for i in range(0, len(track_ids), _AUDIO_FEATURES_PER_REQUEST)
+                ]
+                
+                results = await asyncio.gather(*track_batches, *feature_batches, return_exceptions=True)
+                
+                tracks: Dict[str, Any] = {}
+                for batch in results[:len(track_batches)]:
+                    if isinstance(batch, Exception):
+                        raise batch
+                    tracks.update(batch)
+                
+                # Audio features are optional, as for single track details
+                features: Dict[str, Any] = {}
+                for batch in results[len(track_batches):]:
+                    if not isinstance(batch, Exception):
+                        features.update(batch)
+                
+                buf = io.StringIO()
+                write = buf.write
+                write(f"# Tracks ({len(track_ids)})\n\n")
+                
+                for i, track_id in enumerate(track_ids, 1):
+                    track = tracks.get(track_id)
+                    if track is None:
+                        write(f"{i}. Track not found: {track_id}\n\n")
+                        continue
+                    
+                    name = track.get("name", "Unknown")
+                    artists = _artist_names(track.get("artists", ()))
+                    album = track.get("album", {}).get("name", "Unknown")
+                    duration = _format_duration(track.get("duration_ms", 0))
+                    
+                    write(
+                        f"{i}. **{name}** by {artists}\n"
+                        f"   - Album: {album}\n"
+                        f"   - Duration: {duration}\n"
+                    )
+                    track_features = features.get(track_id)
+                    if track_features:
+                        write(
+                            f"   - Tempo: {track_features.get('tempo', 0):.1f} BPM, "
+                            f"Energy: {track_features.get('energy', 0):.2f}, "
+                            f"Danceability: {track_features.get('danceability', 0):.2f}\n"
+                        )
+                    write(
+                        f"   - Track ID: {track_id}\n"
+                        f"   - Details: tracks://details/{track_id}\n"
+                        "\n"
+                    )
+                
+                return _document(buf)
             
             else:
-                raise ValueError(f"Unknown track resource type: {path_parts[0]}")
+                raise ValueError(f"Unknown track resource type: {resource_type}")
                 
         except SpotifyAPIError as e:
             pass  # logger.error suppressed for MCP(f"Spotify API error in tracks_resource: {e}")
@@ -253,56 +482,59 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
             Formatted album data as string
         """
         try:
-            path_parts = path.strip('/').split('/')
-            
-            if len(path_parts) < 2 or path_parts[0] != 'details':
+            match = _DETAILS_PATH.match(path)
+            if match is None:
                 raise ValueError("Invalid album path format. Use details/{album_id}")
             
-            album_id = path_parts[1]
+            album_id = match.group(1)
+            cached = rendered.get(("album", album_id))
+            if cached is not None:
+                return cached
             pass  # logger.info suppressed for MCP(f"Fetching album details: {album_id}")
             
-            result = await spotify_client.get_album(album_id)
+            result = await spotify_client.get_album_or_none(album_id)
+            if result is None:
+                return f"Album not found: {album_id}"
             
             name = result.get("name", "Unknown")
-            artists = ", ".join([artist.get("name", "") for artist in result.get("artists", [])])
+            artists = _artist_names(result.get("artists", ()))
             release_date = result.get("release_date", "Unknown")
             album_type = result.get("album_type", "album").title()
             total_tracks = result.get("total_tracks", 0)
             popularity = result.get("popularity", 0)
             genres = result.get("genres", [])
             
-            output_lines = [f"# {name}\n"]
-            output_lines.append(f"**Artists:** {artists}")
-            output_lines.append(f"**Type:** {album_type}")
-            output_lines.append(f"**Release Date:** {release_date}")
-            output_lines.append(f"**Total Tracks:** {total_tracks}")
-            output_lines.append(f"**Popularity:** {popularity}/100")
+            buf = io.StringIO()
+            write = buf.write
+            write(
+                f"# {name}\n\n"
+                f"**Artists:** {artists}\n"
+                f"**Type:** {album_type}\n"
+                f"**Release Date:** {release_date}\n"
+                f"**Total Tracks:** {total_tracks}\n"
+                f"**Popularity:** {popularity}/100\n"
+            )
             if genres:
-                output_lines.append(f"**Genres:** {', '.join(genres)}")
-            output_lines.append(f"**Album ID:** {album_id}")
-            output_lines.append("")
+                write(f"**Genres:** {', '.join(genres)}\n")
+            write(f"**Album ID:** {album_id}\n\n")
             
             # Add tracks
             tracks = result.get("tracks", {}).get("items", [])
             if tracks:
-                output_lines.append("## Tracks\n")
+                write("## Tracks\n\n")
                 for track in tracks:
                     track_number = track.get("track_number", 0)
                     track_name = track.get("name", "Unknown")
-                    duration_ms = track.get("duration_ms", 0)
-                    duration_min = duration_ms // 60000
-                    duration_sec = (duration_ms % 60000) // 1000
+                    duration = _format_duration(track.get("duration_ms", 0))
                     track_id = track.get("id", "")
                     
-                    output_lines.append(f"{track_number}. **{track_name}** ({duration_min}:{duration_sec:02d})")
+                    write(f"{track_number}. **{track_name}** ({duration})\n")
                     if track_id:
-                        output_lines.append(f"   - Details: tracks://details/{track_id}")
-                    output_lines.append("")
+                        write(f"   - Details: tracks://details/{track_id}\n")
+                    write("\n")
             
-            return "\n".join(output_lines)
+            return rendered.set(("album", album_id), _document(buf))
             
-        except NotFoundError:
-            return f"Album not found: {album_id}"
         except SpotifyAPIError as e:
             pass  # logger.error suppressed for MCP(f"Spotify API error in albums_resource: {e}")
             return f"Error accessing album: {e}"
@@ -324,32 +556,38 @@ def register_spotify_resources(app: FastMCP, spotify_client: SpotifyClient) -> N
             Formatted artist data as string
         """
         try:
-            path_parts = path.strip('/').split('/')
-            
-            if len(path_parts) < 2 or path_parts[0] != 'details':
+            match = _DETAILS_PATH.match(path)
+            if match is None:
                 raise ValueError("Invalid artist path format. Use details/{artist_id}")
             
-            artist_id = path_parts[1]
+            artist_id = match.group(1)
+            cached = rendered.get(("artist", artist_id))
+            if cached is not None:
+                return cached
             pass  # logger.info suppressed for MCP(f"Fetching artist details: {artist_id}")
             
-            result = await spotify_client.get_artist(artist_id)
+            result = await spotify_client.get_artist_or_none(artist_id)
+            if result is None:
+                return f"Artist not found: {artist_id}"
             
             name = result.get("name", "Unknown")
             genres = result.get("genres", [])
             popularity = result.get("popularity", 0)
             followers = result.get("followers", {}).get("total", 0)
             
-            output_lines = [f"# {name}\n"]
-            output_lines.append(f"**Popularity:** {popularity}/100")
-            output_lines.append(f"**Followers:** {followers:,}")
+            buf = io.StringIO()
+            write = buf.write
+            write(
+                f"# {name}\n\n"
+                f"**Popularity:** {popularity}/100\n"
+                f"**Followers:** {followers:,}\n"
+            )
             if genres:
-                output_lines.append(f"**Genres:** {', '.join(genres)}")
-            output_lines.append(f"**Artist ID:** {artist_id}")
+                write(f"**Genres:** {', '.join(genres)}\n")
+            write(f"**Artist ID:** {artist_id}\n")
             
-            return "\n".join(output_lines)
+            return rendered.set(("artist", artist_id), _document(buf))
             
-        except NotFoundError:
-            return f"Artist not found: {artist_id}"
         except SpotifyAPIError as e:
             pass  # logger.error suppressed for MCP(f"Spotify API error in artists_resource: {e}")
             return f"Error accessing artist: {e}"
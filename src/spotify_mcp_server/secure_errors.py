@@ -4,10 +4,68 @@ ABOUTME: Prevents information disclosure while maintaining useful error reportin
 """
 
 import logging
+import re
 import traceback
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from enum import Enum
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Every sensitive pattern needs one of these characters or at least 20
+# characters of input (the token pattern, module names, traceback header),
+# so shorter values without them can skip the regex scan entirely.
+_SENSITIVE_CHARSET = frozenset("/\\0123456789")
+_SENSITIVE_MIN_PLAIN_LENGTH = 20
+
+
+def _build_priority_matcher(patterns: Sequence[str]) -> Callable[[str], Optional[int]]:
+    """Build a single-pass matcher for "which listed substring occurs first in the list".
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a compiled regex alternation inside a lookahead, so matches starting at
+    every position (including overlapping ones) are seen. Matching ignores
+    ASCII case, like lowercasing the input would for these ASCII patterns;
+    the regex does so without copying its input.
+    
+    Args:
+        patterns: Lowercase substrings to search for, highest priority first
+        
+    Returns:
+        Function returning the lowest index of a pattern its argument
+        contains, or None if it contains none
+    """
+    if not patterns:
+        return lambda text: None
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for index, pattern in enumerate(patterns):
+            automaton.add_word(pattern, index)
+        automaton.make_automaton()
+        return lambda text: min((index for _, index in automaton.iter(text.lower())), default=None)
+    
+    # Bucket patterns by first character: positions whose character starts
+    # no pattern are skipped by one set test, and the others only try their
+    # bucket. Within a bucket the alternation prefers the earlier pattern.
+    buckets: Dict[str, List[str]] = {}
+    for pattern in patterns:
+        buckets.setdefault(pattern[0], []).append(pattern)
+    
+    alternation = "|".join(
+        re.escape(first) + "(?:" + "|".join(re.escape(pattern[1:]) for pattern in bucket) + ")"
+        for first, bucket in buckets.items()
+    )
+    regex = re.compile(
+        "(?=[" + re.escape("".join(buckets)) + "])(?=(" + alternation + "))",
+        re.ASCII | re.IGNORECASE
+    )
+    indexes = {pattern: index for index, pattern in reversed(list(enumerate(patterns)))}
+    return lambda text: min((indexes[m.group(1).lower()] for m in regex.finditer(text)), default=None)
+
 
 class ErrorSeverity(Enum):
     """Error severity levels for security classification."""
@@ -51,6 +109,14 @@ class SecureErrorHandler:
         "unknown_error": "An unexpected error occurred. Please try again.",
     }
     
+    # Keyword fallbacks for messages matching no known error, in priority order
+    FALLBACK_ERROR_MESSAGES = (
+        (("validation", "invalid"), "Invalid input provided. Please check your parameters."),
+        (("permission", "access"), "Access denied. Please check your permissions."),
+        (("network", "connection"), "Network error occurred. Please check your connection."),
+        (("timeout",), "Request timed out. Please try again."),
+    )
+    
     # Patterns to detect and sanitize in error messages
     SENSITIVE_PATTERNS = [
         # File paths
@@ -74,6 +140,16 @@ class SecureErrorHandler:
         r'Traceback \(most recent call last\)',
     ]
     
+    # All sensitive patterns as one alternation, so values are scanned once.
+    # Each pattern is a run of one character class with no nested quantifiers,
+    # and values are truncated before matching, so a scan stays linear in
+    # the (at most ~200 character) input. ASCII mode keeps the \b and \d
+    # checks on the cheap ASCII tables.
+    _SENSITIVE_RE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in SENSITIVE_PATTERNS),
+        re.ASCII
+    )
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize secure error handler.
         
@@ -81,6 +157,12 @@ class SecureErrorHandler:
             logger: Logger instance for internal error logging
         """
         self.logger = logger or logging.getLogger(__name__)
+        patterns = list(self.SAFE_ERROR_MESSAGES)
+        self._safe_messages = list(self.SAFE_ERROR_MESSAGES.values())
+        for keywords, message in self.FALLBACK_ERROR_MESSAGES:
+            patterns.extend(keywords)
+            self._safe_messages.extend([message] * len(keywords))
+        self._find_safe_message = _build_priority_matcher(patterns)
     
     def sanitize_error_message(self, error_message: str) -> str:
         """Sanitize error message to remove sensitive information.
@@ -94,26 +176,11 @@ class SecureErrorHandler:
         if not error_message:
             return "An error occurred"
         
-        # Convert to lowercase for pattern matching
-        lower_message = error_message.lower()
-        
-        # Check for known safe patterns first
-        for pattern, safe_message in self.SAFE_ERROR_MESSAGES.items():
-            if pattern in lower_message:
-                return safe_message
-        
-        # Check for specific error types
-        if "validation" in lower_message or "invalid" in lower_message:
-            return "Invalid input provided. Please check your parameters."
-        
-        if "permission" in lower_message or "access" in lower_message:
-            return "Access denied. Please check your permissions."
-        
-        if "network" in lower_message or "connection" in lower_message:
-            return "Network error occurred. Please check your connection."
-        
-        if "timeout" in lower_message:
-            return "Request timed out. Please try again."
+        # Check known error patterns, then the keyword fallbacks, in one
+        # case-insensitive pass over the message
+        index = self._find_safe_message(error_message)
+        if index is not None:
+            return self._safe_messages[index]
         
         # Default safe message
         return "An error occurred. Please try again or contact support."
@@ -185,11 +252,15 @@ class SecureErrorHandler:
         details["error_type"] = type(error).__name__
         
         # Add safe attributes based on error type
-        if hasattr(error, 'status_code'):
-            details["status_code"] = getattr(error, 'status_code')
+        status_code = getattr(error, 'status_code', None)
+        if status_code is not None:
+            details["status_code"] = status_code
         
-        if hasattr(error, 'response') and hasattr(error.response, 'status_code'):
-            details["http_status"] = error.response.status_code
+        response = getattr(error, 'response', None)
+        if response is not None:
+            http_status = getattr(response, 'status_code', None)
+            if http_status is not None:
+                details["http_status"] = http_status
         
         # Only return details if we have any
         return details if details else None
@@ -266,20 +337,32 @@ class SecureErrorHandler:
         Returns:
             Sanitized string value
         """
+        # Short values with no path separators or digits cannot match
+        if len(value) < _SENSITIVE_MIN_PLAIN_LENGTH and _SENSITIVE_CHARSET.isdisjoint(value):
+            return value
+        
         # Truncate very long strings
         if len(value) > 200:
             value = value[:200] + "..."
         
         # Remove potentially sensitive patterns
-        import re
-        for pattern in self.SENSITIVE_PATTERNS:
-            value = re.sub(pattern, "[REDACTED]", value)
-        
-        return value
+        return self._SENSITIVE_RE.sub("[REDACTED]", value)
+
 
+# Global secure error handler instance, created on first use
+_error_handler: Optional[SecureErrorHandler] = None
 
-# Global secure error handler instance
-_error_handler = SecureErrorHandler()
+
+def get_error_handler() -> SecureErrorHandler:
+    """Get global secure error handler.
+    
+    Returns:
+        SecureErrorHandler instance
+    """
+    global _error_handler
+    if _error_handler is None:
+        _error_handler = SecureErrorHandler()
+    return _error_handler
 
 
 def handle_api_error(
@@ -297,7 +380,7 @@ def handle_api_error(
     Returns:
         Safe error response dictionary
     """
-    return _error_handler.create_safe_error_response(
+    return get_error_handler().create_safe_error_response(
         error=error,
         error_code=error_code,
         user_message=user_message,
@@ -320,7 +403,7 @@ def handle_validation_error(
     """
     user_message = f"Invalid {field_name} provided. Please check the format and try again."
     
-    return _error_handler.create_safe_error_response(
+    return get_error_handler().create_safe_error_response(
         error=error,
         error_code="validation_error",
         user_message=user_message,
@@ -342,14 +425,14 @@ def handle_authentication_error(
         Safe error response dictionary
     """
     # Log security event
-    _error_handler.log_security_event(
+    get_error_handler().log_security_event(
         event_type="authentication_failure",
         severity=ErrorSeverity.MEDIUM,
         details={"error_type": type(error).__name__},
         user_id=user_id
     )
     
-    return _error_handler.create_safe_error_response(
+    return get_error_handler().create_safe_error_response(
         error=error,
         error_code="authentication_error",
         user_message="Authentication failed. Please check your credentials and try again.",
@@ -371,7 +454,7 @@ def log_security_event(
         details: Event details
         user_id: Associated user ID
     """
-    _error_handler.log_security_event(
+    get_error_handler().log_security_event(
         event_type=event_type,
         severity=severity,
         details=details or {},
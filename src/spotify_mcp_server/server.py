@@ -5,8 +5,10 @@ import asyncio
 import logging
 import os
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from fastmcp import FastMCP
 
@@ -14,19 +16,31 @@ from .config import Config, ConfigManager
 from .auth import SpotifyAuthenticator
 from .token_manager import TokenManager, UserTokenManager
 from .spotify_client import SpotifyClient
-from .cache import SpotifyCache, CachedSpotifyClient
 from .tools import register_spotify_tools
 from .resources import register_spotify_resources
 from .session_manager import initialize_session_manager, cleanup_session_manager
 from .middleware import (
-    SpotifyLoggingMiddleware,
-    SpotifyErrorHandlingMiddleware, 
-    SpotifyTimingMiddleware,
-    SpotifyAuthenticationMiddleware
+    SpotifyObservabilityMiddleware,
+    SpotifyAuthenticationMiddleware,
+    install_async_logging
 )
 
+if TYPE_CHECKING:
+    from .cache import SpotifyCache
+
 logger = logging.getLogger(__name__)
 
+# Bounds on per-user state; least recently used users are evicted first
+_MAX_USER_TOKEN_MANAGERS = 1024
+_MAX_USER_AUTH_STATES = 4096
+
+# Pending OAuth state lifetime, matching the session manager's 5-minute timeout
+_AUTH_STATE_TTL_S = 300.0
+
+# How long a successful check of the stored tokens against the API is
+# trusted, including across restarts (the check time is saved with the tokens)
+_TOKEN_VALIDATION_TTL_S = 300.0
+
 # Removed global server state - using dependency injection instead
 
 
@@ -43,6 +57,8 @@ class SpotifyMCPServer:
         global _current_server
         self.config = config
         self.config_path = config_path
+        # Directory holding tokens and cache; resolved once, as it never changes
+        self._config_dir = Path(config_path).resolve().parent
         
         # Setup logging BEFORE FastMCP initialization to prevent any output
         self._setup_logging()
@@ -53,17 +69,24 @@ class SpotifyMCPServer:
         self.authenticator = SpotifyAuthenticator(config.spotify)
         self.token_manager: Optional[TokenManager] = None
         self.spotify_client: Optional[SpotifyClient] = None
-        self.cache: Optional[SpotifyCache] = None
+        self.cache: Optional["SpotifyCache"] = None
         
-        # User-specific token manager cache for multi-user support
-        self._user_token_managers: Dict[str, UserTokenManager] = {}
-        self._user_auth_states: Dict[str, Dict[str, str]] = {}
+        # User-specific token manager cache for multi-user support (LRU)
+        self._user_token_managers: OrderedDict[str, UserTokenManager] = OrderedDict()
+        # Per-user API clients, kept (and evicted) alongside their token manager
+        # so each user's HTTP connection pool is reused across tool calls
+        self._user_spotify_clients: Dict[str, SpotifyClient] = {}
+        # user ID -> (auth state, time.monotonic() when set), oldest first
+        self._user_auth_states: OrderedDict[str, Tuple[Dict[str, str], float]] = OrderedDict()
         
         # Add middleware in order (first added = outermost layer)
         # Pass server instance for dependency injection
-        self.app.add_middleware(SpotifyLoggingMiddleware(include_payloads=False))
-        self.app.add_middleware(SpotifyErrorHandlingMiddleware(include_traceback=False))
-        self.app.add_middleware(SpotifyTimingMiddleware(slow_request_threshold_ms=2000))
+        self.app.add_middleware(SpotifyObservabilityMiddleware(
+            include_payloads=False,
+            include_traceback=False,
+            slow_request_threshold_ms=2000,
+            adaptive_sampling=True
+        ))
         self.app.add_middleware(SpotifyAuthenticationMiddleware(server_instance=self))
 
     def _setup_logging(self) -> None:
@@ -91,8 +114,10 @@ class SpotifyMCPServer:
         
         # Initialize cache if enabled
         if self.config.cache.enabled:
-            config_dir = Path(self.config_path).resolve().parent
-            cache_path = config_dir / self.config.cache.db_path
+            # The cache (and aiosqlite) is only imported when enabled
+            from .cache import SpotifyCache
+            
+            cache_path = self._config_dir / self.config.cache.db_path
             
             # Update cache config with absolute path
             cache_config = self.config.cache.model_copy()
@@ -103,15 +128,18 @@ class SpotifyMCPServer:
             self._log_to_stderr(f"Cache initialized: {cache_path}")
         
         # Initialize token manager with absolute path
-        config_dir = Path(self.config_path).resolve().parent
         self.token_manager = TokenManager(
             authenticator=self.authenticator,
-            token_file=config_dir / "tokens.json"
+            token_file=self._config_dir / "tokens.json"
         )
         
         # Load existing tokens if available
         await self.token_manager.load_tokens()
         
+        # Load tokens for configured users up front
+        if self.config.server.preload_users:
+            await self.load_all_user_tokens(self.config.server.preload_users)
+        
         # Initialize Spotify client
         self.spotify_client = SpotifyClient(
             token_manager=self.token_manager,
@@ -133,21 +161,49 @@ class SpotifyMCPServer:
         Returns:
             UserTokenManager instance for the user
         """
-        if user_id not in self._user_token_managers:
-            # Create new user token manager
-            config_dir = Path(self.config_path).resolve().parent
-            user_token_manager = UserTokenManager(
-                authenticator=self.authenticator,
-                user_id=user_id,
-                base_path=config_dir
-            )
-            
-            # Cache the manager
-            self._user_token_managers[user_id] = user_token_manager
-            
-            logger.debug(f"Created new UserTokenManager for user: {user_id}")
+        user_token_manager = self._user_token_managers.get(user_id)
+        if user_token_manager is not None:
+            self._user_token_managers.move_to_end(user_id)
+            return user_token_manager
+        
+        # Create new user token manager
+        user_token_manager = UserTokenManager(
+            authenticator=self.authenticator,
+            user_id=user_id,
+            base_path=self._config_dir
+        )
         
-        return self._user_token_managers[user_id]
+        # Cache the manager, closing the least recently used one when full
+        self._user_token_managers[user_id] = user_token_manager
+        while len(self._user_token_managers) > _MAX_USER_TOKEN_MANAGERS:
+            evicted_id, evicted = self._user_token_managers.popitem(last=False)
+            self._close_evicted_manager(evicted_id, evicted)
+        
+        logger.debug(f"Created new UserTokenManager for user: {user_id}")
+        
+        return user_token_manager
+    
+    def _close_evicted_manager(self, user_id: str, manager: UserTokenManager) -> None:
+        """Stop an evicted token manager's background refresh and close its client.
+        
+        A tool call may still be using the client, so it is closed once its
+        requests in progress finish rather than immediately.
+        
+        Args:
+            user_id: User identifier of the evicted manager
+            manager: Evicted token manager
+        """
+        client = self._user_spotify_clients.pop(user_id, None)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop, so no refresh task or open connection either
+            pass
+        else:
+            loop.create_task(manager.close())
+            if client is not None:
+                loop.create_task(client.close_when_idle())
+        logger.debug(f"Evicted token manager for user: {user_id}")
     
     async def load_user_tokens(self, user_id: str) -> bool:
         """Load tokens for a specific user.
@@ -161,6 +217,21 @@ class SpotifyMCPServer:
         user_token_manager = self.get_user_token_manager(user_id)
         return await user_token_manager.load_tokens()
     
+    async def load_all_user_tokens(self, user_ids: List[str]) -> Dict[str, bool]:
+        """Load tokens for several users concurrently.
+        
+        Args:
+            user_ids: User identifiers
+            
+        Returns:
+            Mapping of user ID to whether their tokens were loaded
+        """
+        results = await asyncio.gather(
+            *(self.load_user_tokens(user_id) for user_id in user_ids),
+            return_exceptions=True
+        )
+        return {user_id: result is True for user_id, result in zip(user_ids, results)}
+    
     def get_user_spotify_client(self, user_id: str) -> SpotifyClient:
         """Get a Spotify client for a specific user, with caching if enabled.
         
@@ -171,13 +242,19 @@ class SpotifyMCPServer:
             SpotifyClient or CachedSpotifyClient instance for the user
         """
         user_token_manager = self.get_user_token_manager(user_id)
-        base_client = SpotifyClient(user_token_manager, self.config.api)
+        client = self._user_spotify_clients.get(user_id)
+        if client is not None:
+            return client
+        
+        client = SpotifyClient(user_token_manager, self.config.api)
         
         # Return cached client if cache is enabled
         if self.cache:
-            return CachedSpotifyClient(base_client, self.cache, user_id)
+            from .cache import CachedSpotifyClient
+            client = CachedSpotifyClient(client, self.cache, user_id)
         
-        return base_client
+        self._user_spotify_clients[user_id] = client
+        return client
     
     def get_user_auth_state(self, user_id: str) -> Optional[Dict[str, str]]:
         """Get authentication state for a specific user.
@@ -188,7 +265,16 @@ class SpotifyMCPServer:
         Returns:
             Authentication state dictionary or None
         """
-        return self._user_auth_states.get(user_id)
+        entry = self._user_auth_states.get(user_id)
+        if entry is None:
+            return None
+        
+        auth_state, set_at = entry
+        if time.monotonic() - set_at >= _AUTH_STATE_TTL_S:
+            del self._user_auth_states[user_id]
+            return None
+        
+        return auth_state
     
     def set_user_auth_state(self, user_id: str, state: str, code_verifier: str) -> None:
         """Set authentication state for a specific user.
@@ -198,10 +284,21 @@ class SpotifyMCPServer:
             state: OAuth state parameter
             code_verifier: PKCE code verifier
         """
-        self._user_auth_states[user_id] = {
+        now = time.monotonic()
+        self._user_auth_states[user_id] = ({
             'state': state,
             'code_verifier': code_verifier
-        }
+        }, now)
+        self._user_auth_states.move_to_end(user_id)
+        
+        # Drop abandoned flows: expired ones from the oldest end, then any
+        # beyond the cap
+        while self._user_auth_states:
+            oldest_id, (_, set_at) = next(iter(self._user_auth_states.items()))
+            if now - set_at < _AUTH_STATE_TTL_S and len(self._user_auth_states) <= _MAX_USER_AUTH_STATES:
+                break
+            del self._user_auth_states[oldest_id]
+        
         logger.debug(f"Set auth state for user: {user_id}")
     
     def clear_user_auth_state(self, user_id: str) -> None:
@@ -215,17 +312,58 @@ class SpotifyMCPServer:
             logger.debug(f"Cleared auth state for user: {user_id}")
     
     async def cleanup_user_managers(self) -> None:
-        """Clean up all user token managers."""
-        for user_id, manager in self._user_token_managers.items():
+        """Clean up all user token managers and API clients concurrently."""
+        async def close_manager(user_id: str, manager: UserTokenManager) -> None:
             try:
                 await manager.close()
                 logger.debug(f"Closed token manager for user: {user_id}")
             except Exception as e:
                 logger.warning(f"Failed to close token manager for user {user_id}: {e}")
         
+        async def close_client(user_id: str, client: SpotifyClient) -> None:
+            try:
+                await client.close()
+                logger.debug(f"Closed Spotify client for user: {user_id}")
+            except Exception as e:
+                logger.warning(f"Failed to close Spotify client for user {user_id}: {e}")
+        
+        await asyncio.gather(
+            *(close_manager(user_id, manager) for user_id, manager in self._user_token_managers.items()),
+            *(close_client(user_id, client) for user_id, client in self._user_spotify_clients.items())
+        )
+        
         self._user_token_managers.clear()
+        self._user_spotify_clients.clear()
         self._user_auth_states.clear()
 
+    async def _validate_tokens(self) -> bool:
+        """Check the stored tokens against the API, clearing them if rejected.
+        
+        A successful check is recorded with the tokens and reused for
+        _TOKEN_VALIDATION_TTL_S seconds, so setup() and a following
+        authenticate_user(), or a quick restart, make no further API call.
+        
+        Returns:
+            True if tokens are stored and were accepted by the API
+        """
+        if not self.token_manager.has_tokens():
+            return False
+        
+        if self.token_manager.was_validated_within(_TOKEN_VALIDATION_TTL_S):
+            return True
+        
+        try:
+            # Test token validity
+            async with self.spotify_client:
+                await self.spotify_client.get_current_user()
+        except Exception as e:
+            self._log_to_stderr(f"WARNING: Existing tokens invalid: {e}")
+            await self.token_manager.clear_tokens()
+            return False
+        
+        await self.token_manager.mark_validated()
+        return True
+
     async def authenticate_user(self) -> bool:
         """Perform user authentication if needed.
         
@@ -236,16 +374,9 @@ class SpotifyMCPServer:
             raise RuntimeError("Server not initialized")
         
         # Check if we already have valid tokens
-        if self.token_manager.has_tokens():
-            try:
-                # Test token validity
-                async with self.spotify_client:
-                    await self.spotify_client.get_current_user()
-                self._log_to_stderr("Existing tokens are valid")
-                return True
-            except Exception as e:
-                self._log_to_stderr(f"WARNING: Existing tokens invalid: {e}")
-                await self.token_manager.clear_tokens()
+        if await self._validate_tokens():
+            self._log_to_stderr("Existing tokens are valid")
+            return True
         
         # Need to authenticate
         self._log_to_stderr("Starting OAuth authentication flow...")
@@ -253,18 +384,24 @@ class SpotifyMCPServer:
         # Generate authorization URL
         auth_url, state, code_verifier = self.authenticator.get_authorization_url()
         
-        print("\n" + "="*60)
-        print("SPOTIFY AUTHENTICATION REQUIRED")
-        print("="*60)
-        print(f"\n1. Open this URL in your browser:")
-        print(f"   {auth_url}")
-        print(f"\n2. Authorize the application")
-        print(f"3. Copy the full callback URL from your browser")
-        print(f"4. Paste it below when prompted")
-        print("\n" + "="*60)
-        
-        # Get callback URL from user
-        callback_url = input("\nPaste the callback URL here: ").strip()
+        print("\n".join([
+            "\n" + "="*60,
+            "SPOTIFY AUTHENTICATION REQUIRED",
+            "="*60,
+            "\n1. Open this URL in your browser:",
+            f"   {auth_url}",
+            "\n2. Authorize the application",
+            "3. Copy the full callback URL from your browser",
+            "4. Paste it below when prompted",
+            "\n" + "="*60
+        ]))
+        
+        # Get callback URL from user on a worker thread, so the event loop
+        # (session cleanup, concurrent requests) keeps running while waiting
+        callback_url = await asyncio.get_running_loop().run_in_executor(
+            None, input, "\nPaste the callback URL here: "
+        )
+        callback_url = callback_url.strip()
         
         # Parse callback URL
         code, returned_state, error = self.authenticator.parse_callback_url(callback_url)
@@ -301,16 +438,8 @@ class SpotifyMCPServer:
         await self.initialize()
         
         # Check if we have existing tokens, but don't require authentication during startup
-        if self.token_manager.has_tokens():
-            try:
-                # Test token validity
-                async with self.spotify_client:
-                    await self.spotify_client.get_current_user()
-                self._log_to_stderr("Existing tokens are valid - server ready")
-            except Exception as e:
-                self._log_to_stderr(f"WARNING: Existing tokens invalid: {e}")
-                await self.token_manager.clear_tokens()
-                self._log_to_stderr("Server started - authentication required before using tools")
+        if await self._validate_tokens():
+            self._log_to_stderr("Existing tokens are valid - server ready")
         else:
             self._log_to_stderr("Server started - authentication required before using tools")
         
@@ -331,17 +460,17 @@ class SpotifyMCPServer:
         """Cleanup server resources."""
         self._log_to_stderr("Cleaning up server resources...")
         
-        # Clean up session manager first
-        await cleanup_session_manager()
-        
-        # Clean up user token managers
-        await self.cleanup_user_managers()
+        # Session manager, user token managers, client and token manager
+        # shut down independently, so close them concurrently
+        closers = [cleanup_session_manager(), self.cleanup_user_managers()]
         
         if self.spotify_client:
-            await self.spotify_client.close()
+            closers.append(self.spotify_client.close())
+        
+        if self.token_manager:
+            closers.append(self.token_manager.close())
         
-        if self.token_manager and hasattr(self.token_manager, 'close'):
-            await self.token_manager.close()
+        await asyncio.gather(*closers)
 
     @classmethod
     def create_and_run(cls, config: Config, config_path: str) -> None:
@@ -377,6 +506,9 @@ def main(config_path: str = "config.json") -> None:
     # Load configuration with environment variable precedence
     config = ConfigManager.load_with_env_precedence(config_path)
     
+    # Keep middleware log I/O off the event loop
+    install_async_logging()
+    
     # Create and run server
     SpotifyMCPServer.create_and_run(config, config_path)
 
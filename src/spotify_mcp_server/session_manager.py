@@ -4,9 +4,10 @@ ABOUTME: Handles OAuth state management, session expiration, and security cleanu
 """
 
 import asyncio
+import heapq
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, Set
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, Set
 import logging
 from dataclasses import dataclass
 
@@ -52,9 +53,12 @@ class SessionManager:
         # Session storage
         self._sessions: Dict[str, SessionState] = {}
         self._user_sessions: Dict[str, Set[str]] = {}  # user_id -> set of state tokens
+        # Min-heap of (expires_at, state); entries for sessions already removed
+        # or replaced are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
         
-        # Cleanup task
-        self._cleanup_task: Optional[asyncio.Task] = None
+        # Background tasks (the cleanup loop), strongly referenced until done
+        self._bg_tasks: Set[asyncio.Task] = set()
         self._running = False
     
     async def start(self) -> None:
@@ -63,19 +67,31 @@ class SessionManager:
             return
         
         self._running = True
-        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self._spawn(self._cleanup_loop())
         logger.info("Session manager started")
     
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """Run a coroutine as a background task owned by this manager.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The task, which is kept referenced until it finishes
+        """
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+    
     async def stop(self) -> None:
-        """Stop the session manager and cleanup task."""
+        """Stop the session manager and its background tasks."""
         self._running = False
         
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+        tasks = list(self._bg_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         
         # Clear all sessions
         await self.clear_all_sessions()
@@ -132,6 +148,7 @@ class SessionManager:
         )
         
         self._sessions[state] = session
+        heapq.heappush(self._expiry_heap, (expires_at, state))
         
         # Track user sessions
         if user_id:
@@ -273,6 +290,7 @@ class SessionManager:
         count = len(self._sessions)
         self._sessions.clear()
         self._user_sessions.clear()
+        self._expiry_heap.clear()
         
         if count > 0:
             log_security_event(
@@ -338,16 +356,17 @@ class SessionManager:
         """Clean up expired sessions."""
         current_time = time.time()
         expired_states = []
-        
-        # Find expired sessions
-        for state, session in self._sessions.items():
-            if current_time > session.expires_at:
+        heap = self._expiry_heap
+        
+        # Pop only entries that have expired, soonest first
+        while heap and heap[0][0] < current_time:
+            expires_at, state = heapq.heappop(heap)
+            session = self._sessions.get(state)
+            # Skip sessions already consumed, or recreated with a later expiry
+            if session is not None and session.expires_at == expires_at:
+                self._remove_session(state)
                 expired_states.append(state)
         
-        # Remove expired sessions
-        for state in expired_states:
-            self._remove_session(state)
-        
         if expired_states:
             logger.debug(f"Cleaned up {len(expired_states)} expired sessions")
             
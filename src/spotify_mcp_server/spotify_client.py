@@ -2,16 +2,22 @@
 ABOUTME: Provides high-level interface to Spotify API endpoints with automatic token management."""
 
 import asyncio
+import json
 import logging
 from typing import Any, Dict, List, Optional, Union
 
 import httpx
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 from pydantic import BaseModel
 
 from .config import APIConfig
 from .token_manager import TokenManager
 from .secure_errors import handle_api_error, handle_authentication_error, log_security_event, ErrorSeverity
-from .network_security import create_secure_spotify_client
+from .network_security import create_secure_spotify_client, get_network_security
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +70,10 @@ class SpotifyClient:
         # Persistent HTTP client - initialized on first use
         self._client: Optional[httpx.AsyncClient] = None
         self._client_lock = asyncio.Lock()
+        
+        # Requests in progress, and whether to close the client when none are
+        self._active_requests = 0
+        self._close_when_idle = False
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client (thread-safe)."""
@@ -79,9 +89,23 @@ class SpotifyClient:
 
     async def close(self):
         """Close the HTTP client and clean up resources."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # Detach first, so a request starting meanwhile opens a new client
+        client, self._client = self._client, None
+        if client:
+            await client.aclose()
+            # Log the request/response counts of the current, unfinished window
+            get_network_security().flush_security_events()
+
+    async def close_when_idle(self) -> None:
+        """Close the HTTP client now, or once the requests in progress finish.
+        
+        For a client that callers may still hold, e.g. one dropped from a
+        cache. A later request reopens the HTTP client, which is closed
+        again when that request finishes.
+        """
+        self._close_when_idle = True
+        if self._active_requests == 0:
+            await self.close()
 
     async def __aenter__(self):
         """Async context manager entry - for backward compatibility."""
@@ -98,25 +122,60 @@ class SpotifyClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0
-    ) -> Dict[str, Any]:
+        retry_count: int = 0,
+        missing_ok: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """Make authenticated request to Spotify API with retry logic.
         
+        Requests are counted while in progress, so close_when_idle() can
+        close the HTTP client after the last one.
+        
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (without base URL)
             params: Query parameters
             json_data: JSON request body
             retry_count: Current retry attempt
+            missing_ok: Return None instead of raising NotFoundError on 404
             
         Returns:
-            JSON response data
+            JSON response data, or None for a missing resource when missing_ok
             
         Raises:
             SpotifyAPIError: For various API errors
             RateLimitError: When rate limited
             AuthenticationError: For auth failures
-            NotFoundError: When resource not found
+            NotFoundError: When resource not found and missing_ok is False
+        """
+        self._active_requests += 1
+        try:
+            return await self._send_request(method, endpoint, params, json_data, retry_count, missing_ok)
+        finally:
+            self._active_requests -= 1
+            if self._close_when_idle and self._active_requests == 0:
+                await self.close()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+        retry_count: int,
+        missing_ok: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Send one authenticated request, retrying through _make_request.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            json_data: JSON request body
+            retry_count: Current retry attempt
+            missing_ok: Return None instead of raising NotFoundError on 404
+            
+        Returns:
+            JSON response data, or None for a missing resource when missing_ok
         """
         # Get valid access token
         try:
@@ -151,14 +210,16 @@ class SpotifyClient:
             )
             
             # Handle response
-            return await self._handle_response(response, method, endpoint, params, json_data, retry_count)
+            return await self._handle_response(
+                response, method, endpoint, params, json_data, retry_count, missing_ok
+            )
             
         except httpx.TimeoutException:
             if retry_count < self.config.retry_attempts:
                 delay = self._get_retry_delay(retry_count)
                 pass  # logger.warning suppressed for MCP(f"Request timeout, retrying in {delay}s (attempt {retry_count + 1})")
                 await asyncio.sleep(delay)
-                return await self._make_request(method, endpoint, params, json_data, retry_count + 1)
+                return await self._make_request(method, endpoint, params, json_data, retry_count + 1, missing_ok)
             else:
                 raise SpotifyAPIError("Request timed out. Please try again later.")
         
@@ -167,7 +228,7 @@ class SpotifyClient:
                 delay = self._get_retry_delay(retry_count)
                 pass  # logger.warning suppressed for MCP(f"Network error: {e}, retrying in {delay}s (attempt {retry_count + 1})")
                 await asyncio.sleep(delay)
-                return await self._make_request(method, endpoint, params, json_data, retry_count + 1)
+                return await self._make_request(method, endpoint, params, json_data, retry_count + 1, missing_ok)
             else:
                 # Log network error but don't expose details
                 log_security_event(
@@ -184,8 +245,9 @@ class SpotifyClient:
         endpoint: str,
         params: Optional[Dict[str, Any]],
         json_data: Optional[Dict[str, Any]],
-        retry_count: int
-    ) -> Dict[str, Any]:
+        retry_count: int,
+        missing_ok: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """Handle HTTP response and implement retry logic.
         
         Args:
@@ -195,9 +257,10 @@ class SpotifyClient:
             params: Original query parameters
             json_data: Original JSON data
             retry_count: Current retry attempt
+            missing_ok: Return None instead of raising NotFoundError on 404
             
         Returns:
-            JSON response data
+            JSON response data, or None for a missing resource when missing_ok
             
         Raises:
             Various SpotifyAPIError subclasses based on status code
@@ -207,7 +270,7 @@ class SpotifyClient:
             if response.status_code == 204:  # No Content
                 return {}
             try:
-                return response.json()
+                return _json_loads(response.content)
             except Exception:
                 return {}
         
@@ -218,7 +281,7 @@ class SpotifyClient:
             if retry_count < self.config.retry_attempts:
                 pass  # logger.warning suppressed for MCP(f"Rate limited, retrying after {retry_after}s (attempt {retry_count + 1})")
                 await asyncio.sleep(retry_after)
-                return await self._make_request(method, endpoint, params, json_data, retry_count + 1)
+                return await self._make_request(method, endpoint, params, json_data, retry_count + 1, missing_ok)
             else:
                 raise RateLimitError(retry_after, "Rate limit exceeded after all retries")
         
@@ -229,6 +292,8 @@ class SpotifyClient:
         
         # Not found
         if response.status_code == 404:
+            if missing_ok:
+                return None
             error_data = self._get_error_data(response)
             raise NotFoundError(f"Resource not found: {error_data.get('message', 'Not found')}")
         
@@ -238,7 +303,7 @@ class SpotifyClient:
                 delay = self._get_retry_delay(retry_count)
                 pass  # logger.warning suppressed for MCP(f"Server error {response.status_code}, retrying in {delay}s (attempt {retry_count + 1})")
                 await asyncio.sleep(delay)
-                return await self._make_request(method, endpoint, params, json_data, retry_count + 1)
+                return await self._make_request(method, endpoint, params, json_data, retry_count + 1, missing_ok)
             else:
                 error_data = self._get_error_data(response)
                 raise SpotifyAPIError(
@@ -265,7 +330,7 @@ class SpotifyClient:
             Error data dictionary
         """
         try:
-            return response.json()
+            return _json_loads(response.content)
         except Exception:
             return {"message": response.text or "Unknown error"}
 
@@ -373,6 +438,32 @@ class SpotifyClient:
         
         return await self._make_request("GET", f"/playlists/{playlist_id}", params=params)
 
+    async def get_playlist_or_none(
+        self,
+        playlist_id: str,
+        fields: Optional[str] = None,
+        market: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get playlist details, or None if the playlist does not exist.
+        
+        Args:
+            playlist_id: Spotify playlist ID
+            fields: Comma-separated list of fields to return
+            market: Market code (ISO 3166-1 alpha-2)
+            
+        Returns:
+            Playlist details, or None on 404
+        """
+        params = {}
+        if fields:
+            params["fields"] = fields
+        if market:
+            params["market"] = market
+        
+        return await self._make_request(
+            "GET", f"/playlists/{playlist_id}", params=params, missing_ok=True
+        )
+
     async def create_playlist(
         self,
         user_id: str,
@@ -463,6 +554,59 @@ class SpotifyClient:
         
         return await self._make_request("GET", f"/tracks/{track_id}", params=params)
 
+    async def get_track_or_none(self, track_id: str, market: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get track details, or None if the track does not exist.
+        
+        Args:
+            track_id: Spotify track ID
+            market: Market code (ISO 3166-1 alpha-2)
+            
+        Returns:
+            Track details, or None on 404
+        """
+        params = {}
+        if market:
+            params["market"] = market
+        
+        return await self._make_request("GET", f"/tracks/{track_id}", params=params, missing_ok=True)
+
+    async def get_several_tracks(
+        self,
+        track_ids: List[str],
+        market: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get details for multiple tracks (up to 50) in one request.
+        
+        Args:
+            track_ids: List of Spotify track IDs (max 50)
+            market: Market code (ISO 3166-1 alpha-2)
+            
+        Returns:
+            Dictionary mapping track IDs to their details
+            
+        Raises:
+            ValueError: If more than 50 track IDs provided
+        """
+        if len(track_ids) > 50:
+            raise ValueError("Maximum 50 track IDs allowed per request")
+        
+        if not track_ids:
+            return {}
+        
+        params = {"ids": ",".join(track_ids)}
+        if market:
+            params["market"] = market
+        
+        response = await self._make_request("GET", "/tracks", params=params)
+        
+        # Unknown IDs come back as null entries in request order
+        result = {}
+        for track_id, track in zip(track_ids, response.get("tracks", [])):
+            if track is not None:
+                result[track_id] = track
+        
+        return result
+
     async def get_audio_features(self, track_id: str) -> Dict[str, Any]:
         """Get audio features for a track.
         
@@ -566,6 +710,22 @@ class SpotifyClient:
         
         return await self._make_request("GET", f"/albums/{album_id}", params=params)
 
+    async def get_album_or_none(self, album_id: str, market: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get album details, or None if the album does not exist.
+        
+        Args:
+            album_id: Spotify album ID
+            market: Market code (ISO 3166-1 alpha-2)
+            
+        Returns:
+            Album details, or None on 404
+        """
+        params = {}
+        if market:
+            params["market"] = market
+        
+        return await self._make_request("GET", f"/albums/{album_id}", params=params, missing_ok=True)
+
     # Artist Methods
     
     async def get_artist(self, artist_id: str) -> Dict[str, Any]:
@@ -578,3 +738,14 @@ class SpotifyClient:
             Artist details
         """
         return await self._make_request("GET", f"/artists/{artist_id}")
+
+    async def get_artist_or_none(self, artist_id: str) -> Optional[Dict[str, Any]]:
+        """Get artist details, or None if the artist does not exist.
+        
+        Args:
+            artist_id: Spotify artist ID
+            
+        Returns:
+            Artist details, or None on 404
+        """
+        return await self._make_request("GET", f"/artists/{artist_id}", missing_ok=True)
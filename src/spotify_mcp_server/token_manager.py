@@ -12,12 +12,23 @@ from typing import Optional
 
 import aiofiles
 from cryptography.fernet import Fernet
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
 
 from .auth import AuthTokens, SpotifyAuthenticator
 from .config import SpotifyConfig
 
 logger = logging.getLogger(__name__)
 
+# Token updates within this many seconds of each other share one file write
+_SAVE_DELAY_S = 0.1
+
 # Remove the helper function - use proper logging
 
 
@@ -59,6 +70,12 @@ class TokenManager:
         # Token state
         self._tokens: Optional[AuthTokens] = None
         self._token_expires_at: Optional[float] = None
+        # time.time() when the API last accepted these tokens (persisted)
+        self._validated_at: Optional[float] = None
+        # Pending delayed write coalescing bursts of token updates, and
+        # whether the state changed since the last write took its snapshot
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_pending = False
         self._refresh_task: Optional[asyncio.Task] = None
         self._refresh_lock = asyncio.Lock()
     
@@ -87,6 +104,7 @@ class TokenManager:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.flush_tokens()
         if self._refresh_task and not self._refresh_task.done():
             self._refresh_task.cancel()
             try:
@@ -102,11 +120,12 @@ class TokenManager:
         """
         self._tokens = tokens
         self._token_expires_at = time.time() + tokens.expires_in - 60  # 60s buffer
+        self._validated_at = None
         
-        await self.save_tokens()
+        self._schedule_save()
         self._schedule_refresh()
         
-        logger.info("Authentication tokens updated and stored securely")
+        logger.info("Authentication tokens updated")
 
     async def get_valid_token(self) -> str:
         """Get a valid access token, refreshing if necessary.
@@ -185,8 +204,51 @@ class TokenManager:
         except Exception as e:
             print(f"[Token Manager] ERROR: Automatic token refresh failed: {e}", file=sys.stderr)
 
+    def _schedule_save(self) -> None:
+        """Write tokens after _SAVE_DELAY_S, joining any write already pending."""
+        self._save_pending = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_after_delay())
+
+    async def _save_after_delay(self) -> None:
+        """Wait for further token updates, then write the latest state.
+        
+        An update made while a write is in progress is not in its snapshot,
+        so the state is written again until nothing changed during a write.
+        """
+        await asyncio.sleep(_SAVE_DELAY_S)
+        while self._save_pending:
+            await self.save_tokens()
+
+    async def _cancel_pending_save(self) -> bool:
+        """Cancel a scheduled token write.
+        
+        Returns:
+            True if a write was pending
+        """
+        task = self._save_task
+        self._save_task = None
+        if task is None or task.done():
+            return False
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return True
+
+    async def flush_tokens(self) -> None:
+        """Write any pending token update to disk now."""
+        # A cancelled write may not have reached the file, so write the
+        # current state whenever one was in progress
+        if await self._cancel_pending_save() or self._save_pending:
+            await self.save_tokens()
+
     async def save_tokens(self) -> None:
-        """Save tokens to encrypted file."""
+        """Save tokens to encrypted file atomically."""
+        # Updates from here on are not in this write's snapshot
+        self._save_pending = False
         if not self._tokens:
             return
         
@@ -195,21 +257,42 @@ class TokenManager:
             token_data = {
                 "tokens": self._tokens.model_dump(),
                 "expires_at": self._token_expires_at,
+                "validated_at": self._validated_at,
                 "saved_at": time.time()
             }
             
             # Encrypt and save
-            json_data = json.dumps(token_data).encode()
+            json_data = _json_dumps(token_data)
             encrypted_data = self.cipher.encrypt(json_data)
             
-            async with aiofiles.open(self.token_file, "wb") as f:
-                await f.write(encrypted_data)
+            # Write a temporary file and move it into place, so an interrupted
+            # (or cancelled) write never leaves a truncated token file
+            temp_path = self.token_file.with_suffix(".tmp")
+            try:
+                async with aiofiles.open(temp_path, "wb") as f:
+                    await f.write(encrypted_data)
+                    await f.flush()
+                    await asyncio.get_running_loop().run_in_executor(None, os.fsync, f.fileno())
+                temp_path.replace(self.token_file)
+            except BaseException:
+                # Don't leave a stray encrypted copy behind on failure or cancellation
+                self._remove_temp_file()
+                raise
             
-            pass  # Suppress debug logging for MCP
+            logger.info("Authentication tokens stored securely")
             
         except Exception as e:
             print(f"[Token Manager] ERROR: Failed to save tokens: {e}", file=sys.stderr)
 
+    def _remove_temp_file(self) -> None:
+        """Delete a partially written token file, if one exists."""
+        try:
+            self.token_file.with_suffix(".tmp").unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[Token Manager] ERROR: Failed to delete temporary token file: {e}", file=sys.stderr)
+
     async def load_tokens(self) -> bool:
         """Load tokens from encrypted file.
         
@@ -226,7 +309,7 @@ class TokenManager:
                 encrypted_data = await f.read()
             
             decrypted_data = self.cipher.decrypt(encrypted_data)
-            token_data = json.loads(decrypted_data.decode())
+            token_data = _json_loads(decrypted_data)
             
             # Validate token data structure
             if "tokens" not in token_data or "expires_at" not in token_data:
@@ -236,6 +319,7 @@ class TokenManager:
             # Load tokens
             self._tokens = AuthTokens(**token_data["tokens"])
             self._token_expires_at = token_data["expires_at"]
+            self._validated_at = token_data.get("validated_at")
             
             # Check if tokens are still valid
             if self._is_token_expired():
@@ -254,10 +338,16 @@ class TokenManager:
         """Clear stored tokens and delete token file."""
         self._tokens = None
         self._token_expires_at = None
+        self._validated_at = None
         
         if self._refresh_task and not self._refresh_task.done():
             self._refresh_task.cancel()
         
+        # A pending write must not recreate the file after it is deleted
+        await self._cancel_pending_save()
+        self._save_pending = False
+        self._remove_temp_file()
+        
         try:
             if self.token_file.exists():
                 self.token_file.unlink()
@@ -267,6 +357,7 @@ class TokenManager:
 
     async def close(self) -> None:
         """Close the token manager and clean up resources."""
+        await self.flush_tokens()
         if self._refresh_task and not self._refresh_task.done():
             self._refresh_task.cancel()
             try:
@@ -275,6 +366,25 @@ class TokenManager:
                 pass
         logger.debug("Token manager closed")
 
+    def was_validated_within(self, max_age_s: float) -> bool:
+        """Check whether the API accepted the current tokens recently.
+        
+        Args:
+            max_age_s: Maximum age of the last successful check in seconds
+            
+        Returns:
+            True if tokens were validated within max_age_s and are not expiring
+        """
+        if self._validated_at is None or self._is_token_expired():
+            return False
+        
+        return time.time() - self._validated_at < max_age_s
+
+    async def mark_validated(self) -> None:
+        """Record that the API accepted the current tokens and persist it."""
+        self._validated_at = time.time()
+        self._schedule_save()
+
     def has_tokens(self) -> bool:
         """Check if tokens are available.
         
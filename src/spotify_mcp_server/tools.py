@@ -228,12 +228,7 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             auth_url, state, code_verifier = user_token_manager.authenticator.get_authorization_url()
             
             # Store the code_verifier and state for later use (per user)
-            if not hasattr(server_instance, '_user_auth_states'):
-                server_instance._user_auth_states = {}
-            server_instance._user_auth_states[user.user_id] = {
-                'state': state,
-                'code_verifier': code_verifier
-            }
+            server_instance.set_user_auth_state(user.user_id, state, code_verifier)
             
             return {
                 "auth_url": auth_url,
@@ -404,14 +399,11 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                result = await user_spotify_client.search_tracks(
-                    query=params.query,
-                    limit=params.limit,
-                    market=params.market
-                )
-            finally:
-                await user_spotify_client.close()
+            result = await user_spotify_client.search_tracks(
+                query=params.query,
+                limit=params.limit,
+                market=params.market
+            )
             
             # Extract and format track data
             tracks = result.get("tracks", {}).get("items", [])
@@ -465,13 +457,10 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                result = await user_spotify_client.get_user_playlists(
-                    limit=params.limit,
-                    offset=params.offset
-                )
-            finally:
-                await user_spotify_client.close()
+            result = await user_spotify_client.get_user_playlists(
+                limit=params.limit,
+                offset=params.offset
+            )
             
             # Format playlist data
             playlists = result.get("items", [])
@@ -526,10 +515,7 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                result = await user_spotify_client.get_playlist(params.playlist_id)
-            finally:
-                await user_spotify_client.close()
+            result = await user_spotify_client.get_playlist(params.playlist_id)
             
             # Format playlist with tracks
             tracks = result.get("tracks", {}).get("items", [])
@@ -597,22 +583,19 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                # Get current user to create playlist
-                spotify_user = await user_spotify_client.get_current_user()
-                user_id = spotify_user.get("id")
-                
-                if not user_id:
-                    raise SpotifyAPIError("Unable to get current user ID")
-                
-                result = await user_spotify_client.create_playlist(
-                    user_id=user_id,
-                    name=params.name,
-                    description=params.description,
-                    public=params.public
-                )
-            finally:
-                await user_spotify_client.close()
+            # Get current user to create playlist
+            spotify_user = await user_spotify_client.get_current_user()
+            user_id = spotify_user.get("id")
+            
+            if not user_id:
+                raise SpotifyAPIError("Unable to get current user ID")
+            
+            result = await user_spotify_client.create_playlist(
+                user_id=user_id,
+                name=params.name,
+                description=params.description,
+                public=params.public
+            )
             
             return {
                 "id": result.get("id"),
@@ -654,14 +637,11 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                result = await user_spotify_client.add_tracks_to_playlist(
+            result = await user_spotify_client.add_tracks_to_playlist(
                 playlist_id=params.playlist_id,
                 track_uris=params.track_uris,
                 position=params.position
-                )
-            finally:
-                await user_spotify_client.close()
+            )
             
             return {
                 "snapshot_id": result.get("snapshot_id"),
@@ -695,13 +675,10 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                result = await user_spotify_client.remove_tracks_from_playlist(
-                    playlist_id=params.playlist_id,
-                    track_uris=params.track_uris
-                )
-            finally:
-                await user_spotify_client.close()
+            result = await user_spotify_client.remove_tracks_from_playlist(
+                playlist_id=params.playlist_id,
+                track_uris=params.track_uris
+            )
             
             return {
                 "snapshot_id": result.get("snapshot_id"),
@@ -734,16 +711,13 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                # Get basic track info and audio features in parallel
-                import asyncio
-                
-                track_task = user_spotify_client.get_track(params.track_id, params.market)
-                features_task = user_spotify_client.get_audio_features(params.track_id)
-                
-                track, features = await asyncio.gather(track_task, features_task, return_exceptions=True)
-            finally:
-                await user_spotify_client.close()
+            # Get basic track info and audio features in parallel
+            import asyncio
+            
+            track_task = user_spotify_client.get_track(params.track_id, params.market)
+            features_task = user_spotify_client.get_audio_features(params.track_id)
+            
+            track, features = await asyncio.gather(track_task, features_task, return_exceptions=True)
             
             # Handle track data
             if isinstance(track, Exception):
@@ -819,10 +793,7 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                result = await user_spotify_client.get_album(params.album_id, params.market)
-            finally:
-                await user_spotify_client.close()
+            result = await user_spotify_client.get_album(params.album_id, params.market)
             
             # Format tracks
             tracks = result.get("tracks", {}).get("items", [])
@@ -886,10 +857,7 @@ def register_spotify_tools(app: FastMCP, spotify_client: SpotifyClient, server_i
             
             # Get user-specific Spotify client
             user_spotify_client = await get_user_spotify_client()
-            try:
-                result = await user_spotify_client.get_artist(params.artist_id)
-            finally:
-                await user_spotify_client.close()
+            result = await user_spotify_client.get_artist(params.artist_id)
             
             return {
                 "id": result.get("id"),
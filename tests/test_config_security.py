@@ -0,0 +1,25 @@
+"""Unit tests for configuration security validation."""
+
+import os
+
+from spotify_mcp_server.config_security import ConfigurationValidator
+
+
+class TestSecurityReport:
+    """Test security report generation."""
+
+    def test_report_follows_cache_directory_permissions(self, tmp_path):
+        """Test a cached report is not reused after the cache directory's permissions change."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        os.chmod(cache_dir, 0o700)
+        config = {"cache": {"db_path": str(cache_dir / "spotify_cache.db")}}
+        validator = ConfigurationValidator("development")
+        
+        assert "Cache directory has insecure permissions" not in validator.generate_security_report(config)
+        
+        os.chmod(cache_dir, 0o777)
+        assert "Cache directory has insecure permissions" in validator.generate_security_report(config)
+        
+        os.chmod(cache_dir, 0o700)
+        assert "Cache directory has insecure permissions" not in validator.generate_security_report(config)
@@ -0,0 +1,206 @@
+"""Unit tests for dependency security scanning."""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from spotify_mcp_server import dependency_security
+from spotify_mcp_server.dependency_security import DependencySecurityScanner
+
+
+@pytest.fixture
+def pip_audit_modules():
+    """Install stand-ins for the pip-audit modules the scanner imports."""
+    auditor_class = MagicMock(name="Auditor")
+    service_class = MagicMock(name="PyPIService")
+    pip_source = MagicMock(name="PipSource")
+    requirement_source = MagicMock(name="RequirementSource")
+    
+    modules = {
+        "pip_audit": types.ModuleType("pip_audit"),
+        "pip_audit._audit": types.ModuleType("pip_audit._audit"),
+        "pip_audit._service": types.ModuleType("pip_audit._service"),
+        "pip_audit._service.pypi": types.ModuleType("pip_audit._service.pypi"),
+        "pip_audit._dependency_source": types.ModuleType("pip_audit._dependency_source"),
+    }
+    modules["pip_audit._audit"].Auditor = auditor_class
+    modules["pip_audit._service.pypi"].PyPIService = service_class
+    modules["pip_audit._dependency_source"].PipSource = pip_source
+    modules["pip_audit._dependency_source"].RequirementSource = requirement_source
+    
+    with patch.dict(sys.modules, modules):
+        yield types.SimpleNamespace(
+            Auditor=auditor_class,
+            PyPIService=service_class,
+            PipSource=pip_source,
+            RequirementSource=requirement_source
+        )
+
+
+def make_result(vulnerability_id, description, fix_versions):
+    """Create a pip-audit vulnerability result."""
+    return types.SimpleNamespace(id=vulnerability_id, description=description, fix_versions=fix_versions)
+
+
+def make_distribution(name, version, license=None):
+    """Create an installed distribution stand-in."""
+    metadata = MagicMock()
+    metadata.__getitem__.side_effect = {"Name": name}.get
+    metadata.get.side_effect = {"License": license}.get
+    metadata.get_all.return_value = None
+    return types.SimpleNamespace(metadata=metadata, version=version)
+
+
+@pytest.fixture
+def distributions():
+    """Serve a fixed set of installed distributions to a fresh metadata snapshot."""
+    dists = [
+        make_distribution("Foo_Bar", "1.0", "MIT"),
+        make_distribution("zope.interface", "6.0"),
+        make_distribution("", "0.1"),
+    ]
+    dependency_security._dist_snapshot.cache_clear()
+    with patch.object(dependency_security.importlib.metadata, "distributions", return_value=dists) as mock:
+        yield mock
+    dependency_security._dist_snapshot.cache_clear()
+
+
+class TestInstalledPackages:
+    """Test reading installed package metadata."""
+
+    def test_versions_from_snapshot(self, distributions):
+        """Test versions are keyed by canonical name and share one metadata pass with licenses."""
+        scanner = DependencySecurityScanner()
+        scanner.scan_licenses()
+        
+        assert scanner.installed_packages == {"foo-bar": "1.0", "zope-interface": "6.0"}
+        assert set(dependency_security._dist_snapshot()) == set(scanner.installed_packages)
+        distributions.assert_called_once()
+
+
+class TestPipAudit:
+    """Test vulnerability scanning through pip-audit."""
+
+    def test_in_process_audit(self, pip_audit_modules):
+        """Test the in-process auditor is built with a timeout and its results are converted."""
+        resolved = types.SimpleNamespace(name="httpx", version="0.23.0")
+        skipped = types.SimpleNamespace(name="local-package", skip_reason="not on PyPI")
+        pip_audit_modules.Auditor.return_value.audit.return_value = [
+            (resolved, [make_result("GHSA-1", "Header injection", ["0.23.1"])]),
+            (skipped, []),
+        ]
+        
+        scanner = DependencySecurityScanner()
+        with patch("spotify_mcp_server.dependency_security.subprocess.run") as run:
+            vulnerabilities = scanner._run_pip_audit()
+            run.assert_not_called()
+        
+        pip_audit_modules.PyPIService.assert_called_once_with(
+            timeout=dependency_security._PIP_AUDIT_TIMEOUT_S
+        )
+        pip_audit_modules.Auditor.assert_called_once_with(pip_audit_modules.PyPIService.return_value)
+        pip_audit_modules.Auditor.return_value.audit.assert_called_once_with(
+            pip_audit_modules.PipSource.return_value
+        )
+        
+        assert [v.to_dict() for v in vulnerabilities] == [{
+            "package": "httpx",
+            "version": "0.23.0",
+            "vulnerability_id": "GHSA-1",
+            "severity": "MEDIUM",
+            "description": "Header injection",
+            "fixed_version": "0.23.1"
+        }]
+
+    def test_in_process_audit_requirements_file(self, pip_audit_modules):
+        """Test a requirements file is audited instead of the environment."""
+        pip_audit_modules.Auditor.return_value.audit.return_value = []
+        requirements_file = Path("requirements.txt")
+        
+        scanner = DependencySecurityScanner(requirements_file)
+        assert scanner._run_pip_audit() == []
+        
+        pip_audit_modules.RequirementSource.assert_called_once_with([requirements_file])
+        pip_audit_modules.PipSource.assert_not_called()
+
+    def test_auditor_reused(self, pip_audit_modules):
+        """Test the auditor is created once per scanner."""
+        pip_audit_modules.Auditor.return_value.audit.return_value = []
+        
+        scanner = DependencySecurityScanner()
+        scanner._run_pip_audit()
+        scanner._run_pip_audit()
+        
+        pip_audit_modules.Auditor.assert_called_once()
+
+    def test_falls_back_to_subprocess(self, pip_audit_modules):
+        """Test a failing in-process audit falls back to the pip-audit command."""
+        pip_audit_modules.Auditor.return_value.audit.side_effect = RuntimeError("API changed")
+        
+        scanner = DependencySecurityScanner()
+        with patch("spotify_mcp_server.dependency_security.subprocess.run") as run:
+            run.return_value = MagicMock(returncode=0, stdout=b"")
+            assert scanner._run_pip_audit() == []
+        
+        assert run.call_args.kwargs["timeout"] == dependency_security._PIP_AUDIT_TIMEOUT_S
+
+    def test_subprocess_without_pip_audit_modules(self):
+        """Test the pip-audit command is used when its modules cannot be imported."""
+        with patch.dict(sys.modules, {"pip_audit": None}):
+            scanner = DependencySecurityScanner()
+            with patch("spotify_mcp_server.dependency_security.subprocess.run") as run:
+                run.return_value = MagicMock(returncode=1, stdout=b'{"vulnerabilities": [{"package": "httpx", "id": "GHSA-1"}]}')
+                vulnerabilities = scanner._run_pip_audit()
+        
+        assert [v.vulnerability_id for v in vulnerabilities] == ["GHSA-1"]
+        assert run.call_args.args[0][:3] == [sys.executable, "-m", "pip_audit"]
+
+
+class TestSecurityReport:
+    """Test security report caching."""
+
+    @pytest.fixture
+    def scanner(self, distributions):
+        """Create a scanner whose network and subprocess scans find nothing."""
+        scanner = DependencySecurityScanner()
+        with patch.object(scanner, "scan_vulnerabilities", return_value=[]), \
+                patch.object(scanner, "check_outdated_packages", return_value=[]):
+            yield scanner
+
+    def test_forced_report_reads_installed_packages_again(self, scanner, distributions):
+        """Test a forced report sees packages installed after the first scan."""
+        assert scanner.generate_security_report()["summary"]["total_packages"] == 2
+        
+        distributions.return_value = distributions.return_value + [make_distribution("new-package", "2.0")]
+        assert scanner.generate_security_report()["summary"]["total_packages"] == 2
+        
+        report = scanner.generate_security_report(force=True)
+        assert report["summary"]["total_packages"] == 3
+        assert scanner.installed_packages["new-package"] == "2.0"
+
+    def test_report_copies_returned(self, scanner):
+        """Test callers modifying a report do not change the cached one."""
+        report = scanner.generate_security_report()
+        report["summary"]["total_packages"] = 0
+        report["recommendations"].clear()
+        
+        cached = scanner.generate_security_report()
+        assert cached["summary"]["total_packages"] == 2
+        assert cached["recommendations"]
+
+    def test_forced_scan_replaces_shared_scanner(self, distributions):
+        """Test a forced scan_dependencies call does not reuse the shared scanner."""
+        dependency_security._get_scanner.cache_clear()
+        try:
+            with patch.object(DependencySecurityScanner, "generate_security_report", return_value={}):
+                first = dependency_security._get_scanner(None)
+                dependency_security.scan_dependencies()
+                assert dependency_security._get_scanner(None) is first
+                
+                dependency_security.scan_dependencies(force=True)
+                assert dependency_security._get_scanner(None) is not first
+        finally:
+            dependency_security._get_scanner.cache_clear()
@@ -10,9 +10,7 @@ from fastmcp.server.middleware import MiddlewareContext
 from spotify_mcp_server.server import SpotifyMCPServer
 from spotify_mcp_server.config import Config, SpotifyConfig, ServerConfig, APIConfig
 from spotify_mcp_server.middleware import (
-    SpotifyLoggingMiddleware,
-    SpotifyErrorHandlingMiddleware,
-    SpotifyTimingMiddleware,
+    SpotifyObservabilityMiddleware,
     SpotifyAuthenticationMiddleware
 )
 
@@ -39,15 +37,13 @@ class TestMiddlewareIntegration:
         server = SpotifyMCPServer(test_config)
         
         # Verify middleware is registered
-        assert len(server.app.middleware) >= 4  # Our 4 middleware components
+        assert len(server.app.middleware) >= 2  # Observability and auth
         
-        # Middleware should be in order: Logging, Error, Timing, Auth
+        # Middleware should be in order: Observability, Auth
         middleware_types = [type(mw).__name__ for mw in server.app.middleware]
         
-        assert "SpotifyLoggingMiddleware" in middleware_types
-        assert "SpotifyErrorHandlingMiddleware" in middleware_types
-        assert "SpotifyTimingMiddleware" in middleware_types
-        assert "SpotifyAuthenticationMiddleware" in middleware_types
+        assert middleware_types.index("SpotifyObservabilityMiddleware") < \
+            middleware_types.index("SpotifyAuthenticationMiddleware")
 
     @pytest.mark.asyncio
     async def test_logging_middleware_integration(self, test_config):
@@ -98,7 +94,7 @@ class TestMiddlewareIntegration:
                 # Find the error handling middleware
                 error_middleware = None
                 for mw in server.app.middleware:
-                    if isinstance(mw, SpotifyErrorHandlingMiddleware):
+                    if isinstance(mw, SpotifyObservabilityMiddleware):
                         error_middleware = mw
                         break
                 
@@ -142,7 +138,7 @@ class TestMiddlewareIntegration:
                 # Find the timing middleware
                 timing_middleware = None
                 for mw in server.app.middleware:
-                    if isinstance(mw, SpotifyTimingMiddleware):
+                    if isinstance(mw, SpotifyObservabilityMiddleware):
                         timing_middleware = mw
                         break
                 
@@ -216,9 +212,7 @@ class TestServerMiddlewareLifecycle:
         # Verify all expected middleware types are present
         middleware_types = {type(mw).__name__ for mw in server.app.middleware}
         expected_types = {
-            "SpotifyLoggingMiddleware",
-            "SpotifyErrorHandlingMiddleware", 
-            "SpotifyTimingMiddleware",
+            "SpotifyObservabilityMiddleware",
             "SpotifyAuthenticationMiddleware"
         }
         
@@ -299,7 +293,7 @@ class TestMiddlewarePerformance:
                     # Get timing stats from middleware
                     timing_middleware = None
                     for mw in server.app.middleware:
-                        if isinstance(mw, SpotifyTimingMiddleware):
+                        if isinstance(mw, SpotifyObservabilityMiddleware):
                             timing_middleware = mw
                             break
                     
@@ -0,0 +1,71 @@
+"""Unit tests for the command-line entry points."""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from spotify_mcp_server.main import (
+    _async_setup_auth,
+    _config_env,
+    _config_mtime_ns,
+    _load_config,
+)
+
+
+@pytest.fixture
+def token_manager():
+    """Create mock token manager holding tokens."""
+    token_manager = MagicMock()
+    token_manager.has_tokens.return_value = True
+    token_manager.close = AsyncMock()
+    token_manager.clear_tokens = AsyncMock()
+    return token_manager
+
+
+class TestSetupAuth:
+    """Test the one-time authentication setup."""
+
+    @pytest.mark.asyncio
+    async def test_valid_existing_tokens_close_manager(self, token_manager):
+        """Test the token manager is closed when existing tokens are still valid."""
+        with patch("spotify_mcp_server.spotify_client.SpotifyClient.get_current_user",
+                   new_callable=AsyncMock, return_value={"id": "test_user"}):
+            await _async_setup_auth(MagicMock(), token_manager, "config.json")
+        
+        token_manager.close.assert_awaited_once()
+        token_manager.clear_tokens.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_setup_closes_manager(self, token_manager):
+        """Test the token manager is closed when setup fails."""
+        token_manager.has_tokens.return_value = False
+        authenticator = MagicMock()
+        authenticator.get_authorization_url.side_effect = RuntimeError("no client ID")
+        
+        with pytest.raises(RuntimeError):
+            await _async_setup_auth(authenticator, token_manager, "config.json")
+        
+        token_manager.close.assert_awaited_once()
+
+
+class TestLoadConfig:
+    """Test the cached configuration loader."""
+
+    def test_env_change_reloads_config(self, tmp_path, monkeypatch):
+        """Test changed environment overrides are not served from the cache."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({
+            "spotify": {"client_id": "file_id", "client_secret": "file_secret"}
+        }))
+        path = str(config_path)
+        monkeypatch.delenv("SPOTIFY_CLIENT_SECRET", raising=False)
+        
+        monkeypatch.setenv("SPOTIFY_CLIENT_ID", "first_id")
+        first = _load_config(path, _config_mtime_ns(path), _config_env())
+        monkeypatch.setenv("SPOTIFY_CLIENT_ID", "second_id")
+        second = _load_config(path, _config_mtime_ns(path), _config_env())
+        
+        assert first.spotify.client_id == "first_id"
+        assert second.spotify.client_id == "second_id"
+        assert _load_config(path, _config_mtime_ns(path), _config_env()) is second
@@ -1,17 +1,23 @@
 """Unit tests for FastMCP middleware components."""
 
 import asyncio
+import logging
 import pytest
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastmcp.server.middleware import MiddlewareContext
 
+from spotify_mcp_server import middleware as middleware_module
 from spotify_mcp_server.middleware import (
+    SpotifyObservabilityMiddleware,
     SpotifyLoggingMiddleware,
     SpotifyErrorHandlingMiddleware,
     SpotifyTimingMiddleware,
-    SpotifyAuthenticationMiddleware
+    SpotifyAuthenticationMiddleware,
+    MethodStats,
+    install_async_logging,
+    uninstall_async_logging
 )
 
 
@@ -30,6 +36,152 @@ def mock_call_next():
     return AsyncMock(return_value={"result": "success"})
 
 
+class TestSpotifyObservabilityMiddleware:
+    """Test SpotifyObservabilityMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_single_pass_logs_times_and_counts(self, mock_context, mock_call_next):
+        """Test that one pass logs the request and records its timing."""
+        middleware = SpotifyObservabilityMiddleware()
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            result = await middleware.on_message(mock_context, mock_call_next)
+            
+            assert result == {"result": "success"}
+            mock_call_next.assert_called_once_with(mock_context)
+            assert mock_logger.info.call_count == 2
+            assert middleware.get_timing_stats()["test_method"]["count"] == 1
+            assert middleware.get_error_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_error_logged_once_and_counted(self, mock_context):
+        """Test that a failure produces one combined error line."""
+        middleware = SpotifyObservabilityMiddleware()
+        
+        async def failing_call_next(context):
+            raise ValueError("Test error")
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            with pytest.raises(ValueError):
+                await middleware.on_message(mock_context, failing_call_next)
+            
+            mock_logger.error.assert_called_once()
+            assert "failed after" in mock_logger.error.call_args[0][0]
+            assert "ValueError" in mock_logger.error.call_args[0]
+            mock_logger.debug.assert_not_called()
+            assert middleware.error_counts["ValueError"] == 1
+
+    @pytest.mark.asyncio
+    async def test_traceback_attached_to_error_log(self, mock_context):
+        """Test that the error is attached to the error log when include_traceback is set."""
+        middleware = SpotifyObservabilityMiddleware(include_traceback=True)
+        
+        async def failing_call_next(context):
+            raise ValueError("Test error")
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            with pytest.raises(ValueError):
+                await middleware.on_message(mock_context, failing_call_next)
+            
+            # Logged inline; install_async_logging moves the formatting off the loop
+            mock_logger.error.assert_called_once()
+            assert isinstance(mock_logger.error.call_args[1]["exc_info"], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_repeated_errors_are_suppressed(self, mock_context):
+        """Test that identical errors within the window are logged once but still counted."""
+        middleware = SpotifyObservabilityMiddleware()
+        
+        async def failing_call_next(context):
+            raise ValueError("Rate limited")
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            for _ in range(5):
+                with pytest.raises(ValueError):
+                    await middleware.on_message(mock_context, failing_call_next)
+            
+            mock_logger.error.assert_called_once()
+            assert middleware.error_counts["ValueError"] == 5
+
+    def test_log_rate_limiter_reports_suppressed_count(self):
+        """Test that the first line after the window carries the suppressed count."""
+        limiter = middleware_module._LogRateLimiter(window_s=5.0)
+        
+        with patch('time.monotonic', side_effect=[0.0, 1.0, 2.0, 6.0]):
+            assert limiter.allow("key") == 0
+            assert limiter.allow("key") is None
+            assert limiter.allow("key") is None
+            assert limiter.allow("key") == 2
+
+    @pytest.mark.asyncio
+    async def test_stacked_shims_share_start_timestamp(self, mock_context, mock_call_next):
+        """Test that stacked legacy middlewares take one start timestamp per request."""
+        logging_middleware = SpotifyLoggingMiddleware()
+        timing_middleware = SpotifyTimingMiddleware()
+        
+        async def timed_call_next(context):
+            return await timing_middleware.on_message(context, mock_call_next)
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger, \
+             patch('spotify_mcp_server.middleware.time') as mock_time:
+            mock_time.perf_counter_ns.side_effect = [0, 3_000_000, 4_000_000]
+            
+            result = await logging_middleware.on_message(mock_context, timed_call_next)
+        
+        assert result == {"result": "success"}
+        assert mock_time.perf_counter_ns.call_count == 3
+        assert timing_middleware.request_times["test_method"].max_ms == 3.0
+        assert middleware_module._request_start_ns.get() is None
+
+    @pytest.mark.asyncio
+    async def test_forked_worker_starts_with_empty_stats(self, mock_context, mock_call_next):
+        """Test that the after-fork hook resets inherited statistics."""
+        middleware = SpotifyObservabilityMiddleware()
+        
+        with patch('spotify_mcp_server.middleware.logger'):
+            await middleware.on_message(mock_context, mock_call_next)
+        middleware.error_counts["ValueError"] += 1
+        
+        middleware_module._reset_stats_after_fork()
+        
+        assert middleware.get_timing_stats() == {}
+        assert middleware.get_error_stats() == {}
+
+    def test_adaptive_sampling_backs_off_under_load(self):
+        """Test that the sample period doubles above and halves below the watermarks."""
+        middleware = SpotifyObservabilityMiddleware(
+            adaptive_sampling=True, high_watermark_rps=500, low_watermark_rps=100
+        )
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            middleware._window_start = time.monotonic() - 1.0
+            middleware._request_count += 1000
+            middleware._adapt_sample_period()
+            assert middleware.sample_period == 2
+            mock_logger.info.assert_called_once()
+            
+            middleware._window_start = time.monotonic() - 1.0
+            middleware._request_count += 10
+            middleware._adapt_sample_period()
+            assert middleware.sample_period == 1
+            
+            # Never drops below the configured period
+            middleware._window_start = time.monotonic() - 1.0
+            middleware._adapt_sample_period()
+            assert middleware.sample_period == 1
+
+    def test_legacy_middlewares_are_deprecated_shims(self):
+        """Test that the single-purpose middlewares wrap the composite."""
+        for legacy_class in (
+            SpotifyLoggingMiddleware,
+            SpotifyErrorHandlingMiddleware,
+            SpotifyTimingMiddleware
+        ):
+            with pytest.warns(DeprecationWarning):
+                middleware = legacy_class()
+            assert isinstance(middleware, SpotifyObservabilityMiddleware)
+
+
 class TestSpotifyLoggingMiddleware:
     """Test SpotifyLoggingMiddleware."""
 
@@ -52,7 +204,7 @@ class TestSpotifyLoggingMiddleware:
             
             # Verify logging calls
             assert mock_logger.info.call_count == 2  # Request and response
-            mock_logger.info.assert_any_call("MCP Request: test_method")
+            mock_logger.info.assert_any_call("MCP Request: %s", "test_method")
 
     @pytest.mark.asyncio
     async def test_failed_request_logging(self, mock_context):
@@ -81,6 +233,53 @@ class TestSpotifyLoggingMiddleware:
             # Verify debug logging for payloads
             assert mock_logger.debug.call_count == 2  # Request and response payloads
 
+    @pytest.mark.asyncio
+    async def test_payload_not_stringified_when_debug_disabled(self, mock_context, mock_call_next):
+        """Test payloads are skipped when DEBUG logging is disabled."""
+        middleware = SpotifyLoggingMiddleware(include_payloads=True)
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            await middleware.on_message(mock_context, mock_call_next)
+            
+            mock_logger.debug.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_sampling_skips_unsampled_requests(self, mock_context, mock_call_next):
+        """Test that only every Nth request is logged when sampling."""
+        middleware = SpotifyLoggingMiddleware(sample_rate=0.25)
+        assert middleware.sample_period == 4
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            for _ in range(8):
+                await middleware.on_message(mock_context, mock_call_next)
+            
+            assert mock_call_next.call_count == 8
+            assert mock_logger.info.call_count == 4  # Request and response, twice
+
+    @pytest.mark.asyncio
+    async def test_passthrough_when_info_disabled(self, mock_context, mock_call_next):
+        """Test that nothing is timed or logged when INFO is filtered out."""
+        middleware = SpotifyLoggingMiddleware(include_payloads=True)
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger, \
+             patch('spotify_mcp_server.middleware.time') as mock_time:
+            mock_logger.isEnabledFor.return_value = False
+            result = await middleware.on_message(mock_context, mock_call_next)
+            
+            assert result == {"result": "success"}
+            mock_logger.info.assert_not_called()
+            mock_logger.debug.assert_not_called()
+            mock_time.perf_counter_ns.assert_not_called()
+
+    def test_invalid_sample_rate(self):
+        """Test that out-of-range sample rates are rejected."""
+        with pytest.raises(ValueError):
+            SpotifyLoggingMiddleware(sample_rate=0)
+        with pytest.raises(ValueError):
+            SpotifyTimingMiddleware(sample_rate=1.5)
+
 
 class TestSpotifyErrorHandlingMiddleware:
     """Test SpotifyErrorHandlingMiddleware."""
@@ -115,7 +314,7 @@ class TestSpotifyErrorHandlingMiddleware:
             
             # Verify error was logged
             mock_logger.error.assert_called_once()
-            assert "ValueError" in mock_logger.error.call_args[0][0]
+            assert "ValueError" in mock_logger.error.call_args[0]
             
             # Verify error counting
             assert middleware.error_counts["ValueError"] == 1
@@ -168,8 +367,20 @@ class TestSpotifyTimingMiddleware:
         
         assert result == {"result": "success"}
         assert "test_method" in middleware.request_times
-        assert len(middleware.request_times["test_method"]) == 1
-        assert middleware.request_times["test_method"][0] >= 0
+        assert middleware.request_times["test_method"].count == 1
+        assert middleware.request_times["test_method"].min_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_passthrough_when_stats_and_warnings_disabled(self, mock_context, mock_call_next):
+        """Test that timing is skipped when there is nothing to record or log."""
+        middleware = SpotifyTimingMiddleware(collect_stats=False)
+        
+        with patch('spotify_mcp_server.middleware.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            result = await middleware.on_message(mock_context, mock_call_next)
+        
+        assert result == {"result": "success"}
+        assert middleware.request_times == {}
 
     @pytest.mark.asyncio
     async def test_slow_request_warning(self, mock_context):
@@ -208,8 +419,10 @@ class TestSpotifyTimingMiddleware:
         middleware = SpotifyTimingMiddleware()
         
         # Simulate some timing data
-        middleware.request_times["method1"] = [100, 200, 150]
-        middleware.request_times["method2"] = [50, 75]
+        for method, durations in (("method1", [100, 200, 150]), ("method2", [50, 75])):
+            middleware.request_times[method] = MethodStats()
+            for duration in durations:
+                middleware.request_times[method].record(duration)
         
         stats = middleware.get_timing_stats()
         
@@ -222,6 +435,18 @@ class TestSpotifyTimingMiddleware:
         assert method1_stats["min_ms"] == 100
         assert method1_stats["max_ms"] == 200
         assert method1_stats["total_ms"] == 450
+        assert method1_stats["stddev_ms"] == pytest.approx(40.82, abs=0.01)
+
+    def test_method_stats_memory_is_bounded(self):
+        """Test that only recent samples are retained."""
+        method_stats = MethodStats()
+        for duration in range(1000):
+            method_stats.record(float(duration))
+        
+        assert method_stats.count == 1000
+        assert len(method_stats.recent) == 256
+        assert method_stats.min_ms == 0
+        assert method_stats.max_ms == 999
 
 
 class TestSpotifyAuthenticationMiddleware:
@@ -305,3 +530,127 @@ class TestSpotifyAuthenticationMiddleware:
             mock_call_next.assert_not_called()
             mock_logger.warning.assert_called_once()
 
+
+
+    @pytest.mark.asyncio
+    async def test_token_manager_created_after_middleware(self, mock_call_next):
+        """Test auth check once the server initializes its token manager later."""
+        mock_server = MagicMock()
+        mock_server.token_manager = None
+        
+        middleware = SpotifyAuthenticationMiddleware(server_instance=mock_server)
+        
+        context = MagicMock()
+        context.tool_name = "search_tracks"
+        
+        with patch('spotify_mcp_server.middleware.logger'):
+            result = await middleware.on_call_tool(context, mock_call_next)
+            assert "Authentication required" in result["error"]
+        
+        mock_server.token_manager = MagicMock()
+        mock_server.token_manager.has_tokens.return_value = True
+        
+        result = await middleware.on_call_tool(context, mock_call_next)
+        
+        assert result == {"result": "success"}
+        mock_call_next.assert_called_once_with(context)
+
+    @pytest.mark.asyncio
+    async def test_tool_check_decided_once_per_tool(self, mock_call_next):
+        """Test that the auth decision for a tool is cached after its first call."""
+        middleware = SpotifyAuthenticationMiddleware()
+        
+        context = MagicMock()
+        context.tool_name = "get_auth_url"
+        
+        with patch.object(
+            middleware, '_resolve_tool_check', wraps=middleware._resolve_tool_check
+        ) as mock_resolve:
+            await middleware.on_call_tool(context, mock_call_next)
+            await middleware.on_call_tool(context, mock_call_next)
+            
+            mock_resolve.assert_called_once_with("get_auth_url")
+        
+        assert mock_call_next.call_count == 2
+
+
+class TestAsyncLogging:
+    """Test queue-based middleware logging."""
+
+    def test_install_routes_records_through_listener(self):
+        """Test that records reach the original handlers via the queue."""
+        records = []
+        
+        class CollectingHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+        
+        handler = CollectingHandler()
+        middleware_module.logger.addHandler(handler)
+        try:
+            listener = install_async_logging()
+            assert install_async_logging() is listener  # Idempotent
+            assert middleware_module.logger.propagate is False
+            
+            middleware_module.logger.warning("queued %s", "message")
+        finally:
+            uninstall_async_logging()
+            middleware_module.logger.removeHandler(handler)
+        
+        assert [r.getMessage() for r in records] == ["queued message"]
+        assert middleware_module.logger.propagate is True
+
+    def test_error_tracebacks_formatted_by_listener(self):
+        """Test that secure error records are queued with their traceback unformatted."""
+        records = []
+        
+        class CollectingHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+        
+        handler = CollectingHandler()
+        middleware_module.logger.addHandler(handler)
+        try:
+            install_async_logging()
+            try:
+                raise ValueError("boom")
+            except ValueError as error:
+                logging.getLogger("spotify_mcp_server.secure_errors").error(
+                    "Internal error", exc_info=error
+                )
+        finally:
+            uninstall_async_logging()
+            middleware_module.logger.removeHandler(handler)
+        
+        assert len(records) == 1
+        assert records[0].exc_info[0] is ValueError
+        assert records[0].exc_text is None
+        assert logging.getLogger("spotify_mcp_server.secure_errors").propagate is True
+
+    def test_queued_message_snapshotted(self):
+        """Test that message arguments are merged when the record is queued."""
+        records = []
+        
+        class CollectingHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+        
+        handler = CollectingHandler()
+        middleware_module.logger.addHandler(handler)
+        try:
+            listener = install_async_logging()
+            # Hold the listener back so the record waits in the queue
+            listener.stop()
+            
+            tools = ["get_track"]
+            logging.getLogger("spotify_mcp_server.secure_errors").error("Failed tools: %s", tools)
+            tools.append("get_album")
+            
+            listener.start()
+        finally:
+            uninstall_async_logging()
+            middleware_module.logger.removeHandler(handler)
+        
+        assert len(records) == 1
+        assert records[0].getMessage() == "Failed tools: ['get_track']"
+        assert records[0].args is None
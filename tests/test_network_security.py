@@ -0,0 +1,260 @@
+"""Unit tests for network security components."""
+
+import asyncio
+import io
+import ssl
+import threading
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from unittest.mock import patch
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from spotify_mcp_server.network_security import NetworkSecurityManager, RequestSigner, TLSValidator
+
+
+@pytest.fixture
+def signer():
+    """Create a request signer."""
+    return RequestSigner("test_secret")
+
+
+@pytest.fixture
+def certificate_files(tmp_path):
+    """Write a self-signed certificate for localhost and its key."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([
+        x509.NameAttribute(NameOID.COMMON_NAME, "localhost"),
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Test CA")
+    ])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=90))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    
+    cert_file = tmp_path / "cert.pem"
+    key_file = tmp_path / "key.pem"
+    cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ))
+    return cert_file, key_file
+
+
+@pytest.fixture
+async def tls_server(certificate_files):
+    """Serve TLS on a local port, counting connections."""
+    cert_file, key_file = certificate_files
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    connections = []
+    
+    async def handle(reader, writer):
+        connections.append(writer)
+        await reader.read()
+        writer.close()
+    
+    server = await asyncio.start_server(handle, "localhost", 0, ssl=context)
+    port = server.sockets[0].getsockname()[1]
+    yield port, connections
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.fixture
+def validator(certificate_files):
+    """Create a TLS validator that trusts the test certificate."""
+    cert_file, _ = certificate_files
+    validator = TLSValidator()
+    validator.shared_context.load_verify_locations(cert_file)
+    return validator
+
+
+class NonSeekableBody(io.RawIOBase):
+    """Readable body that cannot be rewound."""
+    
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return False
+    
+    def read(self, size=-1):
+        return self._data.read(size)
+
+
+class TestRequestSigner:
+    """Test request signing."""
+
+    def test_file_body_signs_like_bytes(self, signer):
+        """Test a file-like body gives the same signature as its bytes."""
+        data = b"x" * 200000
+        
+        expected = signer.sign_request("POST", "https://api.spotify.com/v1/me", body=data, timestamp=1)
+        actual = signer.sign_request("POST", "https://api.spotify.com/v1/me", body=io.BytesIO(data), timestamp=1)
+        
+        assert actual == expected
+
+    def test_file_body_position_restored(self, signer):
+        """Test signing leaves a file-like body where it was, so it can still be sent."""
+        body = io.BytesIO(b"prefix:payload")
+        body.seek(7)
+        
+        headers = signer.sign_request("POST", "https://api.spotify.com/v1/me", body=body, timestamp=1)
+        
+        assert body.tell() == 7
+        assert body.read() == b"payload"
+        assert headers == signer.sign_request(
+            "POST", "https://api.spotify.com/v1/me", body=b"payload", timestamp=1
+        )
+
+    def test_non_seekable_body_rejected(self, signer):
+        """Test a body that could not be rewound after hashing is rejected."""
+        with pytest.raises(ValueError):
+            signer.sign_request("POST", "https://api.spotify.com/v1/me", body=NonSeekableBody(b"data"))
+
+
+class TestSecurityEventAggregation:
+    """Test aggregation of routine request/response security events."""
+
+    @pytest.mark.asyncio
+    async def test_events_counted_per_status_code(self):
+        """Test responses are counted separately per status code and requests per method."""
+        manager = NetworkSecurityManager(event_log_interval_s=3600)
+        request = httpx.Request("GET", "https://api.spotify.com/v1/me")
+        
+        with patch("spotify_mcp_server.network_security.log_security_event") as log_event:
+            for status_code in (200, 200, 404):
+                await manager._pre_request_hook(request)
+                await manager._post_response_hook(httpx.Response(status_code, request=request))
+            
+            log_event.assert_not_called()
+            manager.flush_security_events()
+        
+        events = {
+            (call.kwargs["event_type"], call.kwargs["details"].get("method"), call.kwargs["details"].get("status_code")):
+            call.kwargs["details"]["count"]
+            for call in log_event.call_args_list
+        }
+        assert events == {
+            ("secure_request_initiated", "GET", None): 3,
+            ("secure_response_received", None, 200): 2,
+            ("secure_response_received", None, 404): 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_counts_flushed_when_window_ends(self):
+        """Test counts are logged once the window has passed, then reset."""
+        manager = NetworkSecurityManager(event_log_interval_s=0)
+        request = httpx.Request("GET", "https://api.spotify.com/v1/me")
+        
+        with patch("spotify_mcp_server.network_security.log_security_event") as log_event:
+            await manager._pre_request_hook(request)
+            assert log_event.call_count == 1
+            
+            manager.flush_security_events()
+            assert log_event.call_count == 1
+
+
+class TestTLSValidator:
+    """Test certificate fetching and caching."""
+
+    @pytest.mark.asyncio
+    async def test_get_certificate_info_async(self, validator, tls_server):
+        """Test the certificate is fetched without blocking and then served from cache."""
+        port, connections = tls_server
+        
+        cert_info = await validator.get_certificate_info_async("localhost", port)
+        
+        assert cert_info is not None
+        assert cert_info["san_names"] == ["localhost"]
+        assert ("localhost", port) in validator.certificate_cache
+        assert len(connections) == 1
+        
+        # Same result as the blocking fetch, without connecting again
+        assert await validator.get_certificate_info_async("localhost", port) == cert_info
+        assert validator.get_certificate_info("localhost", port) == cert_info
+        assert len(connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_certificate_info_async_closes_connection(self, validator, tls_server):
+        """Test the connection is fully closed before the result is returned."""
+        port, _ = tls_server
+        closed = []
+        open_connection = asyncio.open_connection
+        
+        async def recording_open_connection(*args, **kwargs):
+            reader, writer = await open_connection(*args, **kwargs)
+            wait_closed = writer.wait_closed
+            
+            async def recording_wait_closed():
+                await wait_closed()
+                closed.append(writer)
+            
+            writer.wait_closed = recording_wait_closed
+            return reader, writer
+        
+        with patch("asyncio.open_connection", side_effect=recording_open_connection):
+            assert await validator.get_certificate_info_async("localhost", port) is not None
+        
+        assert len(closed) == 1
+        assert closed[0].is_closing()
+
+    @pytest.mark.asyncio
+    async def test_get_certificate_info_async_failure_negative_cached(self, tls_server):
+        """Test a failed handshake returns None and is not retried within the negative TTL."""
+        port, connections = tls_server
+        # Does not trust the self-signed test certificate
+        validator = TLSValidator()
+        
+        assert await validator.get_certificate_info_async("localhost", port) is None
+        assert await validator.get_certificate_info_async("localhost", port) is None
+        
+        assert len(connections) <= 1
+        assert ("localhost", port) in validator._negative_cache
+
+    def test_validate_many(self):
+        """Test hosts are fetched once each on worker threads and mapped in order."""
+        validator = TLSValidator()
+        threads = []
+        
+        def fake_certificate_info(hostname, port=443):
+            threads.append(threading.current_thread())
+            return None if hostname == "bad.example.com" else {"hostname": hostname, "port": port}
+        
+        with patch.object(validator, "get_certificate_info", side_effect=fake_certificate_info) as get_info:
+            results = validator.validate_many(
+                ["api.spotify.com", "accounts.spotify.com", "api.spotify.com", "bad.example.com"],
+                port=8443
+            )
+        
+        assert list(results) == ["api.spotify.com", "accounts.spotify.com", "bad.example.com"]
+        assert results["api.spotify.com"] == {"hostname": "api.spotify.com", "port": 8443}
+        assert results["bad.example.com"] is None
+        assert get_info.call_count == 3
+        assert threading.current_thread() not in threads
+
+    def test_validate_many_no_hosts(self):
+        """Test no thread pool is started for an empty host list."""
+        with patch("spotify_mcp_server.network_security.ThreadPoolExecutor") as executor:
+            assert TLSValidator().validate_many([]) == {}
+        
+        executor.assert_not_called()
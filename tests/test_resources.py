@@ -0,0 +1,221 @@
+"""Unit tests for MCP resource handlers."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from spotify_mcp_server.resources import register_spotify_resources
+from spotify_mcp_server.spotify_client import SpotifyAPIError
+
+
+class ResourceRegistry:
+    """Stand-in for the FastMCP app that keeps resource handlers by URI scheme."""
+    
+    def __init__(self):
+        self.handlers = {}
+    
+    def resource(self, uri):
+        def decorator(func):
+            self.handlers[uri.split("://")[0]] = func
+            return func
+        return decorator
+
+
+def make_track(track_id):
+    """Create a track API object."""
+    return {
+        "id": track_id,
+        "name": f"Track {track_id}",
+        "artists": [{"name": "Artist"}],
+        "album": {"name": "Album", "release_date": "2020-01-01"},
+        "duration_ms": 185000,
+        "popularity": 50
+    }
+
+
+def make_features(tempo=120.0):
+    """Create an audio features API object."""
+    return {"tempo": tempo, "energy": 0.5, "danceability": 0.7, "key": 1, "mode": 1}
+
+
+@pytest.fixture
+def spotify_client():
+    """Create mock Spotify client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def tracks_resource(spotify_client):
+    """Register the resources and return the track resource handler."""
+    registry = ResourceRegistry()
+    register_spotify_resources(registry, spotify_client)
+    return registry.handlers["tracks"]
+
+
+class TestTrackDetailsResource:
+    """Test the tracks://details/{track_id} resource."""
+
+    @pytest.mark.asyncio
+    async def test_details_cached(self, tracks_resource, spotify_client):
+        """Test a complete details document is served from cache on the next read."""
+        spotify_client.get_track_or_none.return_value = make_track("t1")
+        spotify_client.get_audio_features.return_value = make_features()
+        
+        first = await tracks_resource("details/t1")
+        second = await tracks_resource("details/t1")
+        
+        assert "## Audio Features" in first
+        assert second == first
+        spotify_client.get_track_or_none.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_details_not_cached_when_features_fail(self, tracks_resource, spotify_client):
+        """Test a document rendered without features after a failed fetch is not cached."""
+        spotify_client.get_track_or_none.return_value = make_track("t1")
+        spotify_client.get_audio_features.side_effect = [
+            SpotifyAPIError("Service unavailable", 503),
+            make_features()
+        ]
+        
+        first = await tracks_resource("details/t1")
+        second = await tracks_resource("details/t1")
+        
+        assert "# Track t1" in first
+        assert "## Audio Features" not in first
+        assert "## Audio Features" in second
+        assert spotify_client.get_track_or_none.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_details_track_not_found(self, tracks_resource, spotify_client):
+        """Test a missing track is reported without waiting for its features."""
+        spotify_client.get_track_or_none.return_value = None
+        
+        assert await tracks_resource("details/missing") == "Track not found: missing"
+
+
+class TestTrackBatchResource:
+    """Test the tracks://batch/{ids} resource."""
+
+    @staticmethod
+    def serve_tracks(spotify_client, missing=(), failing_features=()):
+        """Answer batch requests from the requested IDs.
+        
+        Args:
+            spotify_client: Mock Spotify client
+            missing: Track IDs the API does not know
+            failing_features: Track IDs whose audio features batch fails
+        """
+        async def get_several_tracks(track_ids):
+            return {track_id: make_track(track_id) for track_id in track_ids if track_id not in missing}
+        
+        async def get_bulk_audio_features(track_ids):
+            if any(track_id in failing_features for track_id in track_ids):
+                raise SpotifyAPIError("Service unavailable", 503)
+            return {track_id: make_features() for track_id in track_ids}
+        
+        spotify_client.get_several_tracks.side_effect = get_several_tracks
+        spotify_client.get_bulk_audio_features.side_effect = get_bulk_audio_features
+
+    @pytest.mark.asyncio
+    async def test_batch_deduplicates_in_request_order(self, tracks_resource, spotify_client):
+        """Test repeated and empty IDs are dropped and tracks are listed in request order."""
+        self.serve_tracks(spotify_client)
+        
+        result = await tracks_resource("batch/b,a,,b,c")
+        
+        assert result.startswith("# Tracks (3)\n")
+        assert result.index("Track ID: b") < result.index("Track ID: a") < result.index("Track ID: c")
+        spotify_client.get_several_tracks.assert_awaited_once_with(["b", "a", "c"])
+        spotify_client.get_bulk_audio_features.assert_awaited_once_with(["b", "a", "c"])
+
+    @pytest.mark.asyncio
+    async def test_batch_full_batch_single_requests(self, tracks_resource, spotify_client):
+        """Test a batch of the maximum size needs one tracks and one audio features request."""
+        self.serve_tracks(spotify_client)
+        track_ids = [f"t{i}" for i in range(50)]
+        
+        result = await tracks_resource("batch/" + ",".join(track_ids))
+        
+        spotify_client.get_several_tracks.assert_awaited_once_with(track_ids)
+        spotify_client.get_bulk_audio_features.assert_awaited_once_with(track_ids)
+        assert result.count("Tempo: 120.0 BPM") == 50
+
+    @pytest.mark.asyncio
+    async def test_batch_chunks_requests(self, tracks_resource, spotify_client):
+        """Test IDs are split into requests of at most the per-request limits."""
+        self.serve_tracks(spotify_client)
+        track_ids = [f"t{i}" for i in range(5)]
+        
+        with patch("spotify_mcp_server.resources._TRACKS_PER_REQUEST", 2), \
+                patch("spotify_mcp_server.resources._AUDIO_FEATURES_PER_REQUEST", 3):
+            result = await tracks_resource("batch/" + ",".join(track_ids))
+        
+        track_batches = [call.args[0] for call in spotify_client.get_several_tracks.await_args_list]
+        feature_batches = [call.args[0] for call in spotify_client.get_bulk_audio_features.await_args_list]
+        assert sorted(track_batches) == [["t0", "t1"], ["t2", "t3"], ["t4"]]
+        assert sorted(feature_batches) == [["t0", "t1", "t2"], ["t3", "t4"]]
+        assert result.count("Tempo: 120.0 BPM") == 5
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_too_many_ids(self, tracks_resource, spotify_client):
+        """Test more than 50 unique IDs are rejected without calling the API."""
+        self.serve_tracks(spotify_client)
+        track_ids = [f"t{i}" for i in range(51)]
+        
+        result = await tracks_resource("batch/" + ",".join(track_ids))
+        
+        assert result == "Error: Too many track IDs: 51 given, at most 50 per batch"
+        spotify_client.get_several_tracks.assert_not_awaited()
+        spotify_client.get_bulk_audio_features.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_limit_counts_unique_ids(self, tracks_resource, spotify_client):
+        """Test repeated IDs do not count towards the batch limit."""
+        self.serve_tracks(spotify_client)
+        track_ids = [f"t{i}" for i in range(50)] * 2
+        
+        result = await tracks_resource("batch/" + ",".join(track_ids))
+        
+        assert result.startswith("# Tracks (50)\n")
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_missing_tracks(self, tracks_resource, spotify_client):
+        """Test IDs the API does not return are listed as not found in place."""
+        self.serve_tracks(spotify_client, missing={"b"})
+        
+        result = await tracks_resource("batch/a,b,c")
+        
+        assert "2. Track not found: b\n" in result
+        assert "1. **Track a**" in result
+        assert "3. **Track c**" in result
+
+    @pytest.mark.asyncio
+    async def test_batch_tolerates_failed_feature_batch(self, tracks_resource, spotify_client):
+        """Test tracks whose features batch failed are listed without features."""
+        self.serve_tracks(spotify_client, failing_features={"t4"})
+        track_ids = [f"t{i}" for i in range(5)]
+        
+        with patch("spotify_mcp_server.resources._AUDIO_FEATURES_PER_REQUEST", 3):
+            result = await tracks_resource("batch/" + ",".join(track_ids))
+        
+        # The batch t0-t2 has features; the batch t3-t4 failed
+        entries = {entry.split("Track ID: ")[1].split("\n")[0]: entry for entry in result.split("\n\n") if "Track ID: " in entry}
+        assert [track_id for track_id, entry in entries.items() if "Tempo" in entry] == ["t0", "t1", "t2"]
+        assert list(entries) == track_ids
+
+    @pytest.mark.asyncio
+    async def test_batch_track_request_failure(self, tracks_resource, spotify_client):
+        """Test a failed track batch fails the whole resource."""
+        spotify_client.get_several_tracks.side_effect = SpotifyAPIError("Service unavailable", 503)
+        spotify_client.get_bulk_audio_features.return_value = {}
+        
+        result = await tracks_resource("batch/a,b")
+        
+        assert result == "Error accessing track: Service unavailable"
+
+    @pytest.mark.asyncio
+    async def test_batch_requires_ids(self, tracks_resource, spotify_client):
+        """Test a batch without IDs is rejected without calling the API."""
+        result = await tracks_resource("batch/,")
+        
+        assert result.startswith("Error: No track IDs given")
+        spotify_client.get_several_tracks.assert_not_awaited()
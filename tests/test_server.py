@@ -1,5 +1,6 @@
 """Unit tests for FastMCP server integration."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
@@ -9,6 +10,7 @@ from fastmcp import FastMCP, Client
 from spotify_mcp_server.server import SpotifyMCPServer
 from spotify_mcp_server.config import Config, SpotifyConfig, ServerConfig, APIConfig
 from spotify_mcp_server.auth import AuthTokens
+from spotify_mcp_server.token_manager import TokenManager
 
 
 @pytest.fixture
@@ -92,6 +94,7 @@ class TestSpotifyMCPServer:
         # Mock components
         mock_token_manager = AsyncMock()
         mock_token_manager.has_tokens.return_value = True
+        mock_token_manager.was_validated_within = MagicMock(return_value=False)
         server.token_manager = mock_token_manager
         
         mock_spotify_client = AsyncMock()
@@ -104,6 +107,37 @@ class TestSpotifyMCPServer:
         assert result is True
         mock_token_manager.has_tokens.assert_called_once()
         mock_spotify_client.get_current_user.assert_called_once()
+        mock_token_manager.mark_validated.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_token_validation_reused(self, test_config, tmp_path):
+        """Test a recent successful token check is reused across restarts."""
+        token_file = tmp_path / "tokens.json"
+        key = TokenManager.generate_encryption_key()
+        
+        token_manager = TokenManager(MagicMock(), token_file, key)
+        await token_manager.set_tokens(AuthTokens(
+            access_token="test_access_token",
+            refresh_token="test_refresh_token",
+            expires_in=3600
+        ))
+        await token_manager.close()
+        
+        mock_spotify_client = AsyncMock()
+        mock_spotify_client.get_current_user = AsyncMock(return_value={"id": "test_user"})
+        
+        for _ in range(2):
+            # A fresh server and token manager per start, as after a restart
+            server = SpotifyMCPServer(test_config)
+            server.token_manager = TokenManager(MagicMock(), token_file, key)
+            await server.token_manager.load_tokens()
+            server.spotify_client = mock_spotify_client
+            
+            assert await server.authenticate_user() is True
+            assert await server.authenticate_user() is True
+            await server.token_manager.close()
+        
+        mock_spotify_client.get_current_user.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_authenticate_user_with_invalid_tokens(self, test_config):
@@ -113,6 +147,7 @@ class TestSpotifyMCPServer:
         # Mock components
         mock_token_manager = AsyncMock()
         mock_token_manager.has_tokens.return_value = True
+        mock_token_manager.was_validated_within = MagicMock(return_value=False)
         mock_token_manager.clear_tokens = AsyncMock()
         server.token_manager = mock_token_manager
         
@@ -158,6 +193,100 @@ class TestSpotifyMCPServer:
         # Verify cleanup was attempted
         # Note: The cleanup method should handle cases where components don't exist
         # Just verify the cleanup method completed without error
+        mock_spotify_client.close.assert_awaited_once()
+        mock_token_manager.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_user_token_managers_evict_least_recently_used(self, test_config, tmp_path):
+        """Test per-user token managers are bounded and evicted in LRU order."""
+        server = SpotifyMCPServer(test_config, str(tmp_path / "config.json"))
+        
+        with patch('spotify_mcp_server.server._MAX_USER_TOKEN_MANAGERS', 2):
+            first = server.get_user_token_manager("user1")
+            server.get_user_token_manager("user2")
+            assert server.get_user_token_manager("user1") is first
+            server.get_user_token_manager("user3")
+        
+        assert list(server._user_token_managers) == ["user1", "user3"]
+
+    @pytest.mark.asyncio
+    async def test_evicted_user_client_closed_when_idle(self, test_config, tmp_path):
+        """Test an evicted user's client is closed once its request in progress finishes."""
+        server = SpotifyMCPServer(test_config, str(tmp_path / "config.json"))
+        request_started = asyncio.Event()
+        finish_request = asyncio.Event()
+        
+        async def slow_request(*args):
+            request_started.set()
+            await finish_request.wait()
+            return {"id": "user1"}
+        
+        with patch('spotify_mcp_server.server._MAX_USER_TOKEN_MANAGERS', 1):
+            client = server.get_user_spotify_client("user1")
+            manager = server.get_user_token_manager("user1")
+            
+            with patch.object(client, '_send_request', side_effect=slow_request), \
+                    patch.object(client, 'close', new_callable=AsyncMock) as close_client, \
+                    patch.object(manager, 'close', new_callable=AsyncMock) as close_manager:
+                in_flight = asyncio.create_task(client.get_current_user())
+                await request_started.wait()
+                
+                server.get_user_spotify_client("user2")
+                await asyncio.sleep(0)
+                
+                # Still in use by the request in progress
+                close_client.assert_not_awaited()
+                close_manager.assert_awaited_once()
+                
+                finish_request.set()
+                assert await in_flight == {"id": "user1"}
+                close_client.assert_awaited_once()
+            
+            assert server.get_user_spotify_client("user1") is not client
+
+    @pytest.mark.asyncio
+    async def test_user_spotify_client_reused(self, test_config, tmp_path):
+        """Test each user keeps one API client until cleanup."""
+        server = SpotifyMCPServer(test_config, str(tmp_path / "config.json"))
+        
+        client = server.get_user_spotify_client("user1")
+        assert server.get_user_spotify_client("user1") is client
+        assert server.get_user_spotify_client("user2") is not client
+        
+        await server.cleanup_user_managers()
+        
+        assert server.get_user_spotify_client("user1") is not client
+
+    @pytest.mark.asyncio
+    async def test_load_all_user_tokens(self, test_config):
+        """Test tokens for several users are loaded and failures reported."""
+        server = SpotifyMCPServer(test_config)
+        
+        async def load_user_tokens(user_id):
+            if user_id == "broken":
+                raise OSError("unreadable")
+            return user_id == "user1"
+        
+        with patch.object(server, 'load_user_tokens', side_effect=load_user_tokens):
+            result = await server.load_all_user_tokens(["user1", "user2", "broken"])
+        
+        assert result == {"user1": True, "user2": False, "broken": False}
+
+    def test_user_auth_state_expires(self, test_config):
+        """Test pending OAuth state is dropped after its TTL."""
+        server = SpotifyMCPServer(test_config)
+        
+        with patch('spotify_mcp_server.server.time.monotonic', return_value=1000.0):
+            server.set_user_auth_state("user1", "state", "verifier")
+            assert server.get_user_auth_state("user1") == {
+                'state': "state",
+                'code_verifier': "verifier"
+            }
+        
+        with patch('spotify_mcp_server.server.time.monotonic', return_value=1300.0):
+            assert server.get_user_auth_state("user1") is None
+        
+        assert "user1" not in server._user_auth_states
 
 
 class TestSpotifyMCPServerIntegration:
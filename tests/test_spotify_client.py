@@ -1,10 +1,11 @@
 """Unit tests for SpotifyClient with persistent HTTP client."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
-from spotify_mcp_server.spotify_client import SpotifyClient, SpotifyAPIError
+from spotify_mcp_server.spotify_client import SpotifyClient, SpotifyAPIError, NotFoundError
 from spotify_mcp_server.config import APIConfig
 from spotify_mcp_server.token_manager import TokenManager
 
@@ -88,6 +89,61 @@ class TestSpotifyClientHTTPManagement:
         await client.close()
         assert client._client is None
 
+    @pytest.mark.asyncio
+    async def test_close_when_idle(self, mock_token_manager, api_config):
+        """Test an idle client is closed at once, and a busy one after its last request."""
+        client = SpotifyClient(mock_token_manager, api_config)
+        await client._get_client()
+        
+        await client.close_when_idle()
+        assert client._client is None
+        
+        # A request made afterwards reopens the HTTP client and closes it when done
+        with patch.object(client, '_send_request', new_callable=AsyncMock) as send_request:
+            async def use_client(*args):
+                await client._get_client()
+                return {"id": "test_user"}
+            
+            send_request.side_effect = use_client
+            assert await client.get_current_user() == {"id": "test_user"}
+        
+        assert client._client is None
+        assert client._active_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_close_when_idle_waits_for_requests(self, mock_token_manager, api_config):
+        """Test closing is deferred while requests are in progress."""
+        client = SpotifyClient(mock_token_manager, api_config)
+        finish_request = asyncio.Event()
+        
+        async def slow_request(*args):
+            await client._get_client()
+            await finish_request.wait()
+            return {}
+        
+        with patch.object(client, '_send_request', side_effect=slow_request):
+            requests = [asyncio.create_task(client.get_current_user()) for _ in range(2)]
+            await asyncio.sleep(0)
+            
+            await client.close_when_idle()
+            assert client._client is not None
+            
+            finish_request.set()
+            await asyncio.gather(*requests)
+        
+        assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_client_close_flushes_security_events(self, mock_token_manager, api_config):
+        """Test closing the client logs the security events of the unfinished window."""
+        client = SpotifyClient(mock_token_manager, api_config)
+        await client._get_client()
+        
+        with patch("spotify_mcp_server.spotify_client.get_network_security") as get_network_security:
+            await client.close()
+        
+        get_network_security.return_value.flush_security_events.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_context_manager_backward_compatibility(self, mock_token_manager, api_config):
         """Test that context manager still works for backward compatibility."""
@@ -114,7 +170,7 @@ class TestSpotifyClientRequests:
         # Mock HTTP response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
+        mock_response.content = b'{"test": "data"}'
         
         with patch.object(client, '_get_client') as mock_get_client:
             mock_http_client = AsyncMock()
@@ -137,7 +193,7 @@ class TestSpotifyClientRequests:
             mock_http_client = AsyncMock()
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"test": "data"}
+            mock_response.content = b'{"test": "data"}'
             mock_http_client.request = AsyncMock(return_value=mock_response)
             mock_get_client.return_value = mock_http_client
             
@@ -154,7 +210,7 @@ class TestSpotifyClientRequests:
         # Mock HTTP response with 401 error
         mock_response = MagicMock()
         mock_response.status_code = 401
-        mock_response.json.return_value = {"error": {"message": "Invalid token"}}
+        mock_response.content = b'{"error": {"message": "Invalid token"}}'
         
         with patch.object(client, '_get_client') as mock_get_client:
             mock_http_client = AsyncMock()
@@ -166,6 +222,25 @@ class TestSpotifyClientRequests:
             
             assert "Authentication failed" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_not_found_missing_ok(self, mock_token_manager, api_config):
+        """Test 404 raises NotFoundError unless missing_ok is set."""
+        client = SpotifyClient(mock_token_manager, api_config)
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.content = b'{"error": {"message": "Not found"}}'
+        
+        with patch.object(client, '_get_client') as mock_get_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.request = AsyncMock(return_value=mock_response)
+            mock_get_client.return_value = mock_http_client
+            
+            with pytest.raises(NotFoundError):
+                await client._make_request("GET", "/albums/missing")
+            
+            assert await client._make_request("GET", "/albums/missing", missing_ok=True) is None
+
     @pytest.mark.asyncio
     async def test_rate_limit_handling(self, mock_token_manager, api_config):
         """Test rate limit handling with retry."""
@@ -179,7 +254,7 @@ class TestSpotifyClientRequests:
         # Mock successful response after retry
         mock_success_response = MagicMock()
         mock_success_response.status_code = 200
-        mock_success_response.json.return_value = {"test": "data"}
+        mock_success_response.content = b'{"test": "data"}'
         
         with patch.object(client, '_get_client') as mock_get_client:
             mock_http_client = AsyncMock()
@@ -204,7 +279,7 @@ class TestSpotifyClientRequests:
             # First call raises network error, second call succeeds
             mock_success_response = MagicMock()
             mock_success_response.status_code = 200
-            mock_success_response.json.return_value = {"test": "data"}
+            mock_success_response.content = b'{"test": "data"}'
             
             mock_http_client.request = AsyncMock(side_effect=[
                 httpx.NetworkError("Network error"),
@@ -262,3 +337,40 @@ class TestSpotifyClientMethods:
                 params={"q": "test query", "type": "track", "limit": 10, "offset": 0}
             )
 
+    @pytest.mark.asyncio
+    async def test_get_several_tracks(self, mock_token_manager, api_config):
+        """Test several tracks are fetched in one request and keyed by ID."""
+        client = SpotifyClient(mock_token_manager, api_config)
+        
+        track = {"id": "track1", "name": "Test Track"}
+        
+        with patch.object(client, '_make_request') as mock_request:
+            mock_request.return_value = {"tracks": [track, None]}
+            
+            result = await client.get_several_tracks(["track1", "missing"])
+            
+            assert result == {"track1": track}
+            mock_request.assert_called_once_with(
+                "GET", "/tracks", params={"ids": "track1,missing"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_get_album_or_none(self, mock_token_manager, api_config):
+        """Test album lookup that reports a missing album as None."""
+        client = SpotifyClient(mock_token_manager, api_config)
+        
+        with patch.object(client, '_make_request') as mock_request:
+            mock_request.return_value = None
+            
+            assert await client.get_album_or_none("missing") is None
+            mock_request.assert_called_once_with(
+                "GET", "/albums/missing", params={}, missing_ok=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_get_several_tracks_limit(self, mock_token_manager, api_config):
+        """Test more than 50 track IDs are rejected."""
+        client = SpotifyClient(mock_token_manager, api_config)
+        
+        with pytest.raises(ValueError):
+            await client.get_several_tracks([f"track{i}" for i in range(51)])
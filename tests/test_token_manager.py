@@ -0,0 +1,198 @@
+"""Unit tests for token persistence."""
+
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from spotify_mcp_server.auth import AuthTokens
+from spotify_mcp_server.token_manager import TokenManager
+
+
+def make_tokens(access_token="test_access_token"):
+    """Create authentication tokens."""
+    return AuthTokens(
+        access_token=access_token,
+        refresh_token="test_refresh_token",
+        expires_in=3600
+    )
+
+
+@pytest.fixture
+def token_file(tmp_path):
+    """Path of the token file."""
+    return tmp_path / "tokens.json"
+
+
+@pytest.fixture
+def encryption_key():
+    """Create an encryption key."""
+    return TokenManager.generate_encryption_key()
+
+
+class TestTokenSaving:
+    """Test coalesced and atomic token writes."""
+
+    @pytest.mark.asyncio
+    async def test_updates_coalesce_into_one_write(self, token_file, encryption_key):
+        """Test updates in quick succession are written once, with the latest tokens."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        
+        with patch.object(token_manager, "save_tokens", wraps=token_manager.save_tokens) as save:
+            await token_manager.set_tokens(make_tokens("first"))
+            await token_manager.mark_validated()
+            await token_manager.set_tokens(make_tokens("second"))
+            
+            assert not token_file.exists()
+            await asyncio.sleep(0.3)
+            
+            assert save.await_count == 1
+        
+        loaded = TokenManager(MagicMock(), token_file, encryption_key)
+        assert await loaded.load_tokens() is True
+        assert loaded._tokens.access_token == "second"
+        
+        await token_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_update(self, token_file, encryption_key):
+        """Test flushing writes a pending update immediately, and only once."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        await token_manager.set_tokens(make_tokens())
+        
+        with patch.object(token_manager, "save_tokens", wraps=token_manager.save_tokens) as save:
+            await token_manager.flush_tokens()
+            assert token_file.exists()
+            
+            # Nothing is left pending afterwards
+            await token_manager.flush_tokens()
+            await asyncio.sleep(0.3)
+            assert save.await_count == 1
+        
+        await token_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_update(self, token_file, encryption_key):
+        """Test closing the manager does not lose a pending update."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        await token_manager.set_tokens(make_tokens())
+        await token_manager.close()
+        
+        loaded = TokenManager(MagicMock(), token_file, encryption_key)
+        assert await loaded.load_tokens() is True
+
+    @pytest.mark.asyncio
+    async def test_clear_cancels_pending_update(self, token_file, encryption_key):
+        """Test a pending write does not recreate the file after clearing."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        await token_manager.set_tokens(make_tokens())
+        await token_manager.clear_tokens()
+        await asyncio.sleep(0.3)
+        
+        assert not token_file.exists()
+        assert not token_file.with_suffix(".tmp").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_previous_file(self, token_file, encryption_key):
+        """Test a failed write leaves the previous token file intact and no temporary file."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        await token_manager.set_tokens(make_tokens("first"))
+        await token_manager.flush_tokens()
+        previous = token_file.read_bytes()
+        
+        await token_manager.set_tokens(make_tokens("second"))
+        with patch("spotify_mcp_server.token_manager.os.fsync", side_effect=OSError("disk full")):
+            await token_manager.flush_tokens()
+        
+        assert token_file.read_bytes() == previous
+        assert not token_file.with_suffix(".tmp").exists()
+        
+        await token_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_write_removes_temporary_file(self, token_file, encryption_key):
+        """Test cancelling a write between writing and renaming removes the temporary file."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        await token_manager.set_tokens(make_tokens())
+        await token_manager._cancel_pending_save()
+        
+        fsync_started = threading.Event()
+        release_fsync = threading.Event()
+        
+        def blocked_fsync(fd):
+            fsync_started.set()
+            release_fsync.wait(5)
+        
+        loop = asyncio.get_running_loop()
+        with patch("spotify_mcp_server.token_manager.os.fsync", side_effect=blocked_fsync):
+            save = asyncio.create_task(token_manager.save_tokens())
+            await loop.run_in_executor(None, fsync_started.wait, 5)
+            assert token_file.with_suffix(".tmp").exists()
+            
+            save.cancel()
+            try:
+                with pytest.raises(asyncio.CancelledError):
+                    await save
+            finally:
+                release_fsync.set()
+        
+        assert not token_file.exists()
+        assert not token_file.with_suffix(".tmp").exists()
+        
+        await token_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_update_during_write_saved(self, token_file, encryption_key):
+        """Test an update made while a write is in progress is written afterwards."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        fsync_started = threading.Event()
+        release_fsync = threading.Event()
+        
+        def blocked_fsync(fd):
+            fsync_started.set()
+            release_fsync.wait(5)
+        
+        loop = asyncio.get_running_loop()
+        with patch("spotify_mcp_server.token_manager.os.fsync", side_effect=blocked_fsync):
+            await token_manager.set_tokens(make_tokens("first"))
+            try:
+                await loop.run_in_executor(None, fsync_started.wait, 5)
+                await token_manager.set_tokens(make_tokens("second"))
+            finally:
+                release_fsync.set()
+            await asyncio.sleep(0.3)
+        
+        loaded = TokenManager(MagicMock(), token_file, encryption_key)
+        assert await loaded.load_tokens() is True
+        assert loaded._tokens.access_token == "second"
+        
+        await token_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_during_write_saves_latest(self, token_file, encryption_key):
+        """Test flushing while a write is in progress writes the latest tokens."""
+        token_manager = TokenManager(MagicMock(), token_file, encryption_key)
+        fsync_started = threading.Event()
+        release_fsync = threading.Event()
+        
+        def blocked_fsync(fd):
+            if not fsync_started.is_set():
+                fsync_started.set()
+                release_fsync.wait(5)
+        
+        loop = asyncio.get_running_loop()
+        with patch("spotify_mcp_server.token_manager.os.fsync", side_effect=blocked_fsync):
+            await token_manager.set_tokens(make_tokens("first"))
+            try:
+                await loop.run_in_executor(None, fsync_started.wait, 5)
+                await token_manager.mark_validated()
+                await token_manager.flush_tokens()
+            finally:
+                release_fsync.set()
+        
+        loaded = TokenManager(MagicMock(), token_file, encryption_key)
+        assert await loaded.load_tokens() is True
+        assert loaded._validated_at == token_manager._validated_at
+        
+        await token_manager.close()